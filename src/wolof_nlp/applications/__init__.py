@@ -1,11 +1,16 @@
-from .pos_tagger import POSTagger, POSToken, tag
-from .ner import NERTagger, NamedEntity, extract_entities
+from .pos_tagger import POSTagger, POSToken, POSTable, tag
+from .perceptron import StructuredPerceptron
+from .ner import NERTagger, NamedEntity, EntityTable, extract_entities, extract_entities_many
 from .sentiment import SentimentAnalyzer, SentimentResult, Sentiment, analyze_sentiment
-from .glosser import InterlinearGlosser, InterlinearGloss, GlossedWord, gloss, gloss_to_string, gloss_to_html
+from .aggregator import SentimentAggregator, WindowStats
+from .glosser import (InterlinearGlosser, InterlinearGloss, GlossedWord, gloss, gloss_to_string, gloss_to_html,
+                      render_text, render_html)
 
 __all__ = [
-    'POSTagger', 'POSToken', 'tag',
-    'NERTagger', 'NamedEntity', 'extract_entities',
+    'POSTagger', 'POSToken', 'POSTable', 'tag', 'StructuredPerceptron',
+    'NERTagger', 'NamedEntity', 'EntityTable', 'extract_entities', 'extract_entities_many',
     'SentimentAnalyzer', 'SentimentResult', 'Sentiment', 'analyze_sentiment',
+    'SentimentAggregator', 'WindowStats',
     'InterlinearGlosser', 'InterlinearGloss', 'GlossedWord', 'gloss', 'gloss_to_string', 'gloss_to_html',
+    'render_text', 'render_html',
 ]
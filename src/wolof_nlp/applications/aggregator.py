@@ -0,0 +1,199 @@
+"""Sentiment Aggregation - Windowed statistics over streams of timestamped comments"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from ..core.cache import LRUCache
+from .sentiment import Sentiment, SentimentAnalyzer, SentimentResult
+
+
+_POLARITY = {Sentiment.POSITIVE: 1, Sentiment.NEGATIVE: -1, Sentiment.NEUTRAL: 0}
+
+
+def signed_score(result: SentimentResult) -> float:
+    """``score`` with the sign of the sentiment: positive > 0, negative < 0, neutral 0."""
+    return _POLARITY[result.sentiment] * result.score
+
+
+@dataclass
+class WindowStats:
+    """Counts for one key over the tumbling window starting at ``start``."""
+    key: Hashable
+    start: float
+    count: int = 0
+    positive: int = 0
+    negative: int = 0
+    score_sum: float = 0.0
+
+    @property
+    def neutral(self) -> int:
+        return self.count - self.positive - self.negative
+
+    @property
+    def mean_score(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+    @property
+    def positive_ratio(self) -> float:
+        return self.positive / self.count if self.count else 0.0
+
+    @property
+    def negative_ratio(self) -> float:
+        return self.negative / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'start': self.start,
+            'count': self.count,
+            'mean_score': self.mean_score,
+            'positive_ratio': self.positive_ratio,
+            'negative_ratio': self.negative_ratio,
+        }
+
+
+class _KeyState:
+    """Open and last closed window plus exponentially decayed rolling sums for one key."""
+
+    __slots__ = ('current', 'previous', 'weight', 'score', 'positive', 'negative', 'last_time')
+
+    def __init__(self, current: WindowStats):
+        self.current = current
+        self.previous: Optional[WindowStats] = None
+        self.weight = self.score = self.positive = self.negative = 0.0
+        self.last_time = current.start
+
+
+class SentimentAggregator:
+    """Per-key sentiment statistics over a stream of ``(key, timestamp, text)`` events.
+
+    Each key (video, series, ...) keeps a fixed amount of state: the open
+    tumbling window of ``window`` seconds, the last closed one, and rolling
+    averages that decay with half-life ``half_life`` seconds. Texts are
+    buffered and analyzed ``batch_size`` at a time with
+    ``SentimentAnalyzer.analyze_many``. Repeated texts ("Amine", "🔥🔥") are
+    served from an LRU cache of ``cache_size`` results; the analyzer's own
+    word-type table is capped by its ``max_types``. Events older than a
+    key's open window are counted in that window.
+    """
+
+    def __init__(self, window: float = 60.0, half_life: float = 300.0, batch_size: int = 512,
+                 analyzer: Optional[SentimentAnalyzer] = None, cache_size: int = 10000,
+                 on_window: Optional[Callable[[WindowStats], None]] = None):
+        self.window = window
+        self.half_life = half_life
+        self.batch_size = batch_size
+        self.analyzer = analyzer or SentimentAnalyzer()
+        self.cache = LRUCache(cache_size)
+        self.on_window = on_window
+        self.keys: Dict[Hashable, _KeyState] = {}
+        self._pending: List[Tuple[Hashable, float, str]] = []
+
+    def add(self, key: Hashable, timestamp: float, text: str):
+        self._pending.append((key, timestamp, text))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, events: Iterable[Tuple[Hashable, float, str]]):
+        for key, timestamp, text in events:
+            self.add(key, timestamp, text)
+
+    def flush(self):
+        """Analyze buffered events and fold them into the statistics, in arrival order."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        cache = self.cache
+        scores: List[Optional[Tuple[float, int]]] = [cache.get(text) for _, _, text in pending]
+        misses = list(dict.fromkeys(text for (_, _, text), s in zip(pending, scores) if s is None))
+        if misses:
+            fresh = {}
+            for text, result in zip(misses, self.analyzer.analyze_many(misses, chunk_size=self.batch_size)):
+                fresh[text] = (signed_score(result), _POLARITY[result.sentiment])
+                cache.put(text, fresh[text])
+            scores = [s if s is not None else fresh[text] for (_, _, text), s in zip(pending, scores)]
+        for (key, timestamp, _), (score, polarity) in zip(pending, scores):
+            self._update(key, timestamp, score, polarity)
+
+    def add_result(self, key: Hashable, timestamp: float, result: SentimentResult):
+        """Fold in an event that has already been analyzed."""
+        self._update(key, timestamp, signed_score(result), _POLARITY[result.sentiment])
+
+    def _update(self, key: Hashable, timestamp: float, score: float, polarity: int):
+        start = math.floor(timestamp / self.window) * self.window
+        state = self.keys.get(key)
+        if state is None:
+            state = self.keys[key] = _KeyState(WindowStats(key, start))
+        elif start > state.current.start:
+            if state.current.count:
+                self._close(state)
+            state.current = WindowStats(key, start)
+
+        window = state.current
+        window.count += 1
+        window.score_sum += score
+        if polarity > 0:
+            window.positive += 1
+        elif polarity < 0:
+            window.negative += 1
+
+        if timestamp > state.last_time:
+            decay = 0.5 ** ((timestamp - state.last_time) / self.half_life)
+            state.weight *= decay
+            state.score *= decay
+            state.positive *= decay
+            state.negative *= decay
+            state.last_time = timestamp
+        state.weight += 1.0
+        state.score += score
+        if polarity > 0:
+            state.positive += 1.0
+        elif polarity < 0:
+            state.negative += 1.0
+
+    def _close(self, state: _KeyState):
+        state.previous = state.current
+        if self.on_window is not None:
+            self.on_window(state.current)
+
+    def close_windows(self, now: float) -> List[WindowStats]:
+        """Close every open window that ended before ``now`` (after flushing) and return them."""
+        self.flush()
+        closed = []
+        for state in self.keys.values():
+            window = state.current
+            if window.count and window.start + self.window <= now:
+                self._close(state)
+                closed.append(window)
+                state.current = WindowStats(window.key, math.floor(now / self.window) * self.window)
+        return closed
+
+    def snapshot(self, key: Optional[Hashable] = None, now: Optional[float] = None) -> Dict:
+        """JSON-friendly statistics for one key, or ``{key: stats}`` for all keys.
+
+        ``rolling`` holds the decayed averages, evaluated at ``now`` when given
+        (which only changes ``weight``; the ratios do not decay).
+        """
+        self.flush()
+        if key is None:
+            return {k: self._snapshot(state, now) for k, state in self.keys.items()}
+        state = self.keys.get(key)
+        return self._snapshot(state, now) if state is not None else {}
+
+    def _snapshot(self, state: _KeyState, now: Optional[float]) -> Dict:
+        weight = state.weight
+        if now is not None and now > state.last_time:
+            weight *= 0.5 ** ((now - state.last_time) / self.half_life)
+        return {
+            'window': state.current.to_dict(),
+            'previous_window': state.previous.to_dict() if state.previous is not None else None,
+            'rolling': {
+                'weight': weight,
+                'mean_score': state.score / state.weight if state.weight else 0.0,
+                'positive_ratio': state.positive / state.weight if state.weight else 0.0,
+                'negative_ratio': state.negative / state.weight if state.weight else 0.0,
+            },
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -1,12 +1,15 @@
 """Wolof Interlinear Glosser - Morphological decomposition with Leipzig conventions"""
 
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 from dataclasses import dataclass
 import re
+import weakref
 
+from ..core.cache import LRUCache
 from ..core.tokenizer import WolofTokenizer, TokenType
 from ..morphology.analyzer import MorphologyAnalyzer
-from ..lexicon.dictionary import Dictionary
+from ..morphology.paradigms import default_paradigm_table
+from ..lexicon.dictionary import Dictionary, get_default_dictionary
 
 
 @dataclass
@@ -17,38 +20,104 @@ class GlossedWord:
     translation: str
 
 
+_HTML_CHUNK = 1024  # cells per write
+_HTML_TABLE = '<table class="interlinear" style="border-collapse:collapse;font-family:monospace;">'
+_HTML_ROWS = (
+    ('wolof', '<tr style="font-weight:bold;background:#f0f0f0;">', '<td style="padding:4px 8px;border:1px solid #ddd;">'),
+    ('morphemes', '<tr>', '<td style="padding:4px 8px;border:1px solid #ddd;color:#666;">'),
+    ('gloss', '<tr>', '<td style="padding:4px 8px;border:1px solid #ddd;font-style:italic;">'),
+    ('translation', '<tr style="background:#f8f8f8;">', '<td style="padding:4px 8px;border:1px solid #ddd;">'),
+)
+
+
+def _cell_width(w: GlossedWord) -> int:
+    return max(len(w.wolof), len(w.morphemes), len(w.gloss), len(w.translation))
+
+
+def _blocks(words: Iterable[GlossedWord], width: Optional[int]) -> Iterator[List[GlossedWord]]:
+    """Group words into runs whose padded text line fits in ``width`` characters (one run when ``None``).
+    
+    A word wider than ``width`` gets a run of its own. With no words at all a
+    single empty run is produced.
+    """
+    if width is None:
+        yield list(words)
+        return
+    block: List[GlossedWord] = []
+    used = 0
+    for w in words:
+        size = _cell_width(w)
+        if block and used + 2 + size > width:
+            yield block
+            block = []
+        used = used + 2 + size if block else size
+        block.append(w)
+    yield block
+
+
+def render_text(words: Iterable[GlossedWord], fp: TextIO, width: Optional[int] = None):
+    """Write the four aligned gloss lines to ``fp``.
+    
+    With ``width`` the words are wrapped into blocks of lines at most
+    ``width`` characters long, separated by a blank line, and each block is
+    written as soon as it is full: memory stays constant for any number of
+    words. Without it the output is ``InterlinearGloss.to_string()``.
+    """
+    separator = ''
+    for block in _blocks(words, width):
+        wolof, morphemes, glosses, translations = [], [], [], []
+        for w in block:
+            size = _cell_width(w)
+            wolof.append(w.wolof.ljust(size))
+            morphemes.append(w.morphemes.ljust(size))
+            glosses.append(w.gloss.ljust(size))
+            translations.append(w.translation.ljust(size))
+        fp.write(separator + '\n'.join('  '.join(line) for line in (wolof, morphemes, glosses, translations)))
+        separator = '\n\n'
+
+
+def render_html(words: Iterable[GlossedWord], fp: TextIO, width: Optional[int] = None):
+    """Write the gloss as an HTML table to ``fp``, one table per ``render_text`` block when wrapping.
+    
+    Without ``width`` the output is ``InterlinearGloss.to_html()``.
+    """
+    separator = ''
+    for block in _blocks(words, width):
+        fp.write(separator + _HTML_TABLE)
+        for field, row, td in _HTML_ROWS:
+            fp.write(row)
+            for i in range(0, len(block), _HTML_CHUNK):
+                fp.write(''.join(td + getattr(w, field) + '</td>' for w in block[i:i + _HTML_CHUNK]))
+            fp.write('</tr>')
+        fp.write('</table>')
+        separator = '\n'
+
+
+class _Chunks(list):
+    """Text sink keeping each write as a list item, joined once by the caller."""
+    write = list.append
+
+
 @dataclass
 class InterlinearGloss:
     original: str
     words: List[GlossedWord]
     
     def to_string(self) -> str:
-        lines = [[], [], [], []]
-        for w in self.words:
-            width = max(len(w.wolof), len(w.morphemes), len(w.gloss), len(w.translation))
-            lines[0].append(w.wolof.ljust(width))
-            lines[1].append(w.morphemes.ljust(width))
-            lines[2].append(w.gloss.ljust(width))
-            lines[3].append(w.translation.ljust(width))
-        
-        return '\n'.join('  '.join(line) for line in lines)
+        out = _Chunks()
+        render_text(self.words, out)
+        return ''.join(out)
     
     def to_html(self) -> str:
-        html = '<table class="interlinear" style="border-collapse:collapse;font-family:monospace;">'
-        html += '<tr style="font-weight:bold;background:#f0f0f0;">'
-        for w in self.words:
-            html += f'<td style="padding:4px 8px;border:1px solid #ddd;">{w.wolof}</td>'
-        html += '</tr><tr>'
-        for w in self.words:
-            html += f'<td style="padding:4px 8px;border:1px solid #ddd;color:#666;">{w.morphemes}</td>'
-        html += '</tr><tr>'
-        for w in self.words:
-            html += f'<td style="padding:4px 8px;border:1px solid #ddd;font-style:italic;">{w.gloss}</td>'
-        html += '</tr><tr style="background:#f8f8f8;">'
-        for w in self.words:
-            html += f'<td style="padding:4px 8px;border:1px solid #ddd;">{w.translation}</td>'
-        html += '</tr></table>'
-        return html
+        out = _Chunks()
+        render_html(self.words, out)
+        return ''.join(out)
+    
+    def write_text(self, fp: TextIO, width: Optional[int] = None):
+        render_text(self.words, fp, width)
+    
+    def write_html(self, fp: TextIO, width: Optional[int] = None):
+        render_html(self.words, fp, width)
 
 
 FRENCH_PATTERNS = re.compile(r'.*(tion|ment|eur|eux|oir|age|ais|ait|ez|ence|ance)$', re.IGNORECASE)
@@ -125,12 +194,33 @@ PERSON_MARKERS = {
 }
 
 
+# (morphemes, gloss, translation) for one surface form
+GlossRow = Tuple[str, str, str]
+
+_TABLES: 'weakref.WeakKeyDictionary[Dictionary, Dict[bool, Tuple[int, Dict[str, GlossRow]]]]' = weakref.WeakKeyDictionary()
+
+
 class InterlinearGlosser:
+    """Leipzig-style glosses word by word.
     
-    def __init__(self):
+    Rows for every single-word paradigm form, and for every headword of an
+    in-memory dictionary, are precomputed once per dictionary (shared
+    between glossers). Other words, such as headwords of a SQLite backend,
+    are glossed on demand. The rows of the last ``cache_size`` surface forms
+    are kept in an LRU cache, so a word repeated across a document is
+    analyzed once. Both are rebuilt when ``Dictionary.version`` changes.
+    """
+    
+    def __init__(self, fuzzy: bool = False, dictionary: Optional[Dictionary] = None,
+                 cache_size: int = 4096, precompute: bool = True):
         self.tokenizer = WolofTokenizer(normalize=True)
         self.analyzer = MorphologyAnalyzer()
-        self.dictionary = Dictionary()
+        self.dictionary = dictionary if dictionary is not None else get_default_dictionary()
+        self.fuzzy = fuzzy
+        self.precompute = precompute
+        self.cache = LRUCache(cache_size)
+        self._table: Dict[str, GlossRow] = {}
+        self._dictionary_version = -1
     
     def _is_french(self, word: str) -> bool:
         w = word.lower()
@@ -161,6 +251,11 @@ class InterlinearGlosser:
             if entry:
                 return entry.english
             
+            if self.fuzzy:
+                candidates = self.dictionary.fuzzy_lookup(root, max_distance=1, limit=1)
+                if candidates:
+                    return '~' + candidates[0][0].english
+            
             for length in range(len(root) - 1, 2, -1):
                 entry = self.dictionary.lookup(root[:length])
                 if entry:
@@ -168,61 +263,95 @@ class InterlinearGlosser:
         
         return '?'
     
-    def gloss(self, text: str) -> InterlinearGloss:
-        tokens = self.tokenizer.tokenize(text)
-        words = []
+    def _analyzed_row(self, word: str, morphemes: list) -> GlossRow:
+        return (
+            '-'.join(m.text for m in morphemes),
+            '-'.join(self._gloss_morpheme(m) for m in morphemes),
+            self._lookup_translation(word, morphemes),
+        )
+    
+    def gloss_table(self) -> Dict[str, GlossRow]:
+        """Precomputed rows keyed by lowercase form: single-word paradigm forms, plus headwords of in-memory dictionaries."""
+        version = self.dictionary.version
+        tables = _TABLES.setdefault(self.dictionary, {})
+        built = tables.get(self.fuzzy)
+        if built is None or built[0] != version:
+            # Walking every headword of an on-disk backend would load the whole table
+            forms = dict.fromkeys(self.dictionary.entries) if self.dictionary.entries.in_memory else {}
+            forms.update(dict.fromkeys(f for f in default_paradigm_table().forms if ' ' not in f))
+            table = {}
+            for form in forms:
+                if self._is_french(form) or form in PERSON_MARKERS:
+                    continue
+                morphemes = self.analyzer.analyze(form)
+                # Without morphemes the row echoes the surface casing, so it cannot be shared
+                if morphemes:
+                    table[form] = self._analyzed_row(form, morphemes)
+            built = tables[self.fuzzy] = (version, table)
+        return built[1]
+    
+    def _sync(self):
+        """Drop cached rows when entries were added to the dictionary since they were computed."""
+        version = self.dictionary.version
+        if version != self._dictionary_version:
+            self._dictionary_version = version
+            self.cache.clear()
+            self._table = self.gloss_table() if self.precompute else {}
+    
+    def _gloss_row(self, word: str) -> GlossRow:
+        if self._is_french(word):
+            return word, '[FR]', word
+        
+        person_gloss = self._get_person_gloss(word)
+        if person_gloss:
+            return word, person_gloss, ''
+        
+        row = self._table.get(word.lower())
+        if row is not None:
+            return row
         
-        for token in tokens:
+        morphemes = self.analyzer.analyze(word)
+        if morphemes:
+            return self._analyzed_row(word, morphemes)
+        return word, word.upper(), self._lookup_translation(word, morphemes)
+    
+    def iter_gloss(self, text: str) -> Iterator[GlossedWord]:
+        """Glossed words of ``text`` one at a time, e.g. to feed ``render_text`` paragraph by paragraph."""
+        self._sync()
+        cache = self.cache
+        
+        for token in self.tokenizer.tokenize(text):
             if token.type != TokenType.WORD:
                 continue
             
-            if self._is_french(token.text):
-                words.append(GlossedWord(
-                    wolof=token.text,
-                    morphemes=token.text,
-                    gloss='[FR]',
-                    translation=token.text,
-                ))
-                continue
-            
-            person_gloss = self._get_person_gloss(token.text)
-            if person_gloss:
-                words.append(GlossedWord(
-                    wolof=token.text,
-                    morphemes=token.text,
-                    gloss=person_gloss,
-                    translation='',
-                ))
-                continue
-            
-            morphemes = self.analyzer.analyze(token.text)
-            
-            if morphemes:
-                morph_str = '-'.join(m.text for m in morphemes)
-                gloss_str = '-'.join(self._gloss_morpheme(m) for m in morphemes)
-            else:
-                morph_str = token.text
-                gloss_str = token.text.upper()
-            
-            translation = self._lookup_translation(token.text, morphemes)
-            
-            words.append(GlossedWord(
-                wolof=token.text,
-                morphemes=morph_str,
-                gloss=gloss_str,
-                translation=translation,
-            ))
-        
-        return InterlinearGloss(original=text, words=words)
+            row = cache.get(token.text)
+            if row is None:
+                row = self._gloss_row(token.text)
+                cache.put(token.text, row)
+            yield GlossedWord(token.text, *row)
+    
+    def gloss(self, text: str) -> InterlinearGloss:
+        return InterlinearGloss(original=text, words=list(self.iter_gloss(text)))
+
+
+_DEFAULT_GLOSSER: Optional[InterlinearGlosser] = None
+
+
+def default_glosser() -> InterlinearGlosser:
+    """Shared glosser over the current default dictionary, so its cache persists across calls."""
+    global _DEFAULT_GLOSSER
+    if _DEFAULT_GLOSSER is None or _DEFAULT_GLOSSER.dictionary is not get_default_dictionary():
+        _DEFAULT_GLOSSER = InterlinearGlosser()
+    return _DEFAULT_GLOSSER
 
 
 def gloss(text: str) -> InterlinearGloss:
-    return InterlinearGlosser().gloss(text)
+    return default_glosser().gloss(text)
 
 
 def gloss_to_string(text: str) -> str:
-    return InterlinearGlosser().gloss(text).to_string()
+    return default_glosser().gloss(text).to_string()
 
 
 def gloss_to_html(text: str) -> str:
-    return InterlinearGlosser().gloss(text).to_html()
+    return default_glosser().gloss(text).to_html()
@@ -1,9 +1,19 @@
 """Wolof Named Entity Recognition - Pattern-based with gazetteer fallback"""
 
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from array import array
 from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
 import re
+import weakref
 
+from ..core.automaton import AhoCorasick
+from ..core.parallel import chunked, parallel_map
+from ..core.constants import (  # re-exported: the lists used to live here
+    SENEGAL_PLACES, FOREIGN_PLACES, WOLOF_FIRST_NAMES, WOLOF_SURNAMES,
+    RELIGIOUS_TITLES, ORGANIZATIONS, TV_SHOWS,
+)
+from ..core.gazetteer import Gazetteer, default_gazetteer
 from ..core.tokenizer import WolofTokenizer, TokenType
 
 
@@ -16,53 +26,44 @@ class NamedEntity:
     confidence: float = 0.8
 
 
-SENEGAL_PLACES = frozenset([
-    'dakar', 'thiès', 'thies', 'kaolack', 'ziguinchor', 'saint-louis', 'ndar',
-    'touba', 'mbour', 'rufisque', 'diourbel', 'louga', 'tambacounda', 'kolda',
-    'matam', 'fatick', 'kaffrine', 'kédougou', 'kedougou', 'sédhiou', 'sedhiou',
-    'sénégal', 'senegal', 'gambie', 'gambia', 'mauritanie', 'mali', 'guinée',
-    'guinee', 'france', 'paris', 'usa', 'america', 'maroc', 'italie', 'espagne',
-    'london', 'londres', 'new york', 'abidjan', 'bamako', 'conakry', 'banjul',
-    'casamance', 'sine', 'saloum', 'fouta', 'walo', 'cayor', 'baol', 'djolof',
-    'gorée', 'goree', 'lac rose', 'petite côte', 'cap vert', 'almadies',
-])
-
-WOLOF_FIRST_NAMES = frozenset([
-    'samba', 'demba', 'fatou', 'fatu', 'awa', 'moussa', 'musa', 
-    'ibrahima', 'amadou', 'amadu', 'ousmane', 'usmane',
-    'mariama', 'aïssatou', 'aissatou', 'aisatu', 'aminata', 
-    'modou', 'modu', 'mamadou', 'mamadu', 'abdoulaye', 'abdulaye',
-    'aliou', 'aliu', 'oumar', 'umar', 'binta', 'coumba', 'kumba', 
-    'daba', 'ndeye', 'ndey', 'pape', 'cheikh',
-    'sokhna', 'soxna', 'adja', 'mor', 'mbaye', 'lamine', 'malick', 
-    'youssou', 'yusu', 'babacar', 'babakar',
-    'abdou', 'abdu', 'alassane', 'alasan', 'khady', 'xadi', 
-    'mame', 'biram', 'thierno', 'cerno', 'assane', 'asan', 'djibril', 'jibril',
-])
-
-WOLOF_SURNAMES = frozenset([
-    'ba', 'seck', 'mbaye', 'fall', 'ndiaye', 'faye', 'sall', 'diop', 'thiam',
-    'gueye', 'sy', 'cissé', 'cisse', 'diouf', 'wade', 'diagne', 'mbacké',
-    'mbacke', 'diaw', 'sarr', 'niang', 'kane', 'dia', 'tall', 'samb', 'lo',
-    'ndoye', 'gning', 'sene', 'bodian', 'diatta', 'sonko', 'sow', 'camara',
-])
+ENTITY_LABELS = ('PER', 'LOC', 'ORG', 'WORK')
 
-RELIGIOUS_TITLES = frozenset([
-    'serigne', 'sëriñ', 'seriñe', 'cheikh', 'sheikh', 'oustaz', 'ustaz',
-    'imam', 'mame', 'sokhna', 'adja', 'el hadj', 'elhadj', 'hadj', 'hajj',
-])
 
-ORGANIZATIONS = frozenset([
-    'tfm', 'rts', '2stv', 'sen tv', 'sentv', 'walf', 'gfm', 'iradio',
-    'sonatel', 'orange', 'free', 'expresso', 'auchan', 'eiffage',
-    'mouride', 'mouridiyya', 'tidiane', 'tidjane', 'layène', 'layene',
-    'ucad', 'ugb', 'uasz', 'ept', 'esp', 'iam', 'bhs', 'cbao', 'sgbs',
-])
+@dataclass
+class EntityTable:
+    """Columnar entities for a batch of documents, one row per entity, in document order.
+    
+    Row i is entity ``texts[i]`` of document ``doc_ids[i]`` spanning
+    ``starts[i]:ends[i]`` with label ``ENTITY_LABELS[labels[i]]``.
+    """
+    doc_ids: array
+    starts: array
+    ends: array
+    labels: array
+    confidences: array
+    texts: List[str]
+    
+    @classmethod
+    def from_documents(cls, documents: Iterable[List[NamedEntity]]) -> 'EntityTable':
+        table = cls(array('i'), array('i'), array('i'), array('B'), array('d'), [])
+        label_ids = {label: i for i, label in enumerate(ENTITY_LABELS)}
+        for doc_id, entities in enumerate(documents):
+            for e in entities:
+                table.doc_ids.append(doc_id)
+                table.starts.append(e.start)
+                table.ends.append(e.end)
+                table.labels.append(label_ids[e.label])
+                table.confidences.append(e.confidence)
+                table.texts.append(e.text)
+        return table
+    
+    def __len__(self):
+        return len(self.doc_ids)
+    
+    def entity(self, i: int) -> NamedEntity:
+        return NamedEntity(self.texts[i], ENTITY_LABELS[self.labels[i]], self.starts[i], self.ends[i],
+                           self.confidences[i])
 
-TV_SHOWS = frozenset([
-    'pod et marichou', 'maîtresse', 'maitresse', 'wiri wiri', 'adja',
-    'mbettel', 'nafi', 'mœurs', 'moeurs', 'golden', 'dikoon', 'buur',
-])
 
 TITLE_PATTERN = re.compile(
     r'\b(serigne|sëriñ|seriñe|cheikh|sheikh|oustaz|ustaz|mame|sokhna|el\s*hadj)\s+([A-ZÀÁÂÃÄÅÈÉÊËÌÍÎÏÒÓÔÕÖÙÚÛÜ][a-zàáâãäåèéêëìíîïòóôõöùúûü]+)',
@@ -93,31 +94,85 @@ EXCLUDED_CAPITALS = frozenset([
 ])
 
 
-class NERTagger:
+# Entity label and confidence for each gazetteer category
+CATEGORY_LABELS = {
+    'place': ('LOC', 0.95),
+    'foreign_place': ('LOC', 0.95),
+    'first_name': ('PER', 0.88),
+    'surname': ('PER', 0.85),
+    'title': ('PER', 0.80),
+    'organization': ('ORG', 0.92),
+    'tv_show': ('WORK', 0.90),
+}
+
+_SINGLE_WORD = re.compile(r'\w+')
+_MATCHERS: 'weakref.WeakKeyDictionary[Gazetteer, AhoCorasick]' = weakref.WeakKeyDictionary()
+
+
+def entity_matcher(gazetteer: Gazetteer) -> AhoCorasick:
+    """Automaton over MULTI_WORD_ENTITIES and every gazetteer entry spanning several words.
+    
+    Curated MULTI_WORD_ENTITIES take precedence. Single words are looked up in
+    the gazetteer itself, so the automaton stays small for large name lists.
+    """
+    matcher = _MATCHERS.get(gazetteer)
+    if matcher is None:
+        matcher = AhoCorasick()
+        for pattern, (canonical, label, conf) in MULTI_WORD_ENTITIES.items():
+            matcher.add(pattern, (canonical, label, conf, True))
+        for name, categories in gazetteer.items():
+            if name in MULTI_WORD_ENTITIES or _SINGLE_WORD.fullmatch(name):
+                continue
+            category = next((c for c in categories if c in CATEGORY_LABELS), None)
+            if category is not None:
+                label, conf = CATEGORY_LABELS[category]
+                matcher.add(name, (None, label, conf, False))
+        _MATCHERS[gazetteer] = matcher
+    return matcher
+
+
+class _SpanSet:
+    """Disjoint half-open intervals kept sorted for O(log n) overlap tests."""
     
     def __init__(self):
-        self.tokenizer = WolofTokenizer(normalize=True)
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+    
+    def overlaps(self, start: int, end: int) -> bool:
+        i = bisect_right(self.starts, start)
+        if i and self.ends[i - 1] > start:
+            return True
+        return i < len(self.starts) and self.starts[i] < end
+    
+    def add(self, start: int, end: int):
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+
+class NERTagger:
+    
+    def __init__(self, gazetteer: Optional[Gazetteer] = None):
+        self.gazetteer = gazetteer if gazetteer is not None else default_gazetteer()
+        self.matcher = entity_matcher(self.gazetteer)
+        self.tokenizer = WolofTokenizer(normalize=True, gazetteer=self.gazetteer)
+    
+    def _find_gazetteer_entities(self, text: str) -> Tuple[List[NamedEntity], List[NamedEntity]]:
+        """Longest non-overlapping multi-word hits, split into curated entities and gazetteer entries."""
+        curated, listed = [], []
+        for start, end, (canonical, label, conf, is_curated) in self.matcher.find(text.lower()):
+            entity = NamedEntity(
+                text=canonical or text[start:end],
+                label=label,
+                start=start,
+                end=end,
+                confidence=conf,
+            )
+            (curated if is_curated else listed).append(entity)
+        return curated, listed
     
     def _find_multi_word_entities(self, text: str) -> List[NamedEntity]:
-        entities = []
-        text_lower = text.lower()
-        
-        for pattern, (canonical, label, conf) in MULTI_WORD_ENTITIES.items():
-            start = 0
-            while True:
-                idx = text_lower.find(pattern, start)
-                if idx == -1:
-                    break
-                entities.append(NamedEntity(
-                    text=canonical,
-                    label=label,
-                    start=idx,
-                    end=idx + len(pattern),
-                    confidence=conf,
-                ))
-                start = idx + 1
-        
-        return entities
+        return self._find_gazetteer_entities(text)[0]
     
     def _find_title_patterns(self, text: str) -> List[NamedEntity]:
         entities = []
@@ -135,23 +190,9 @@ class NERTagger:
         return entities
     
     def _classify_word(self, word_lower: str, word_original: str, is_sentence_start: bool) -> Tuple[Optional[str], float]:
-        if word_lower in SENEGAL_PLACES:
-            return 'LOC', 0.95
-        
-        if word_lower in WOLOF_FIRST_NAMES:
-            return 'PER', 0.88
-        
-        if word_lower in WOLOF_SURNAMES:
-            return 'PER', 0.85
-        
-        if word_lower in RELIGIOUS_TITLES:
-            return 'PER', 0.80
-        
-        if word_lower in ORGANIZATIONS:
-            return 'ORG', 0.92
-        
-        if word_lower in TV_SHOWS:
-            return 'WORK', 0.90
+        for category in self.gazetteer.lookup(word_lower):
+            if category in CATEGORY_LABELS:
+                return CATEGORY_LABELS[category]
         
         if (word_original[0].isupper() and 
             len(word_original) > 2 and 
@@ -163,20 +204,17 @@ class NERTagger:
     
     def extract(self, text: str) -> List[NamedEntity]:
         entities = []
-        used_spans = set()
+        used_spans = _SpanSet()
         
-        multi_word = self._find_multi_word_entities(text)
-        for ent in multi_word:
+        curated, listed = self._find_gazetteer_entities(text)
+        for ent in curated:
             entities.append(ent)
-            for i in range(ent.start, ent.end):
-                used_spans.add(i)
+            used_spans.add(ent.start, ent.end)
         
-        title_entities = self._find_title_patterns(text)
-        for ent in title_entities:
-            if not any(i in used_spans for i in range(ent.start, ent.end)):
+        for ent in self._find_title_patterns(text) + listed:
+            if not used_spans.overlaps(ent.start, ent.end):
                 entities.append(ent)
-                for i in range(ent.start, ent.end):
-                    used_spans.add(i)
+                used_spans.add(ent.start, ent.end)
         
         tokens = self.tokenizer.tokenize(text)
         
@@ -184,7 +222,7 @@ class NERTagger:
             if token.type != TokenType.WORD:
                 continue
             
-            if any(j in used_spans for j in range(token.start, token.end)):
+            if used_spans.overlaps(token.start, token.end):
                 continue
             
             is_sentence_start = i == 0 or (i > 0 and tokens[i-1].text in '.!?')
@@ -202,7 +240,52 @@ class NERTagger:
         
         entities.sort(key=lambda e: e.start)
         return entities
+    
+    def extract_many(self, texts: Iterable[str], n_jobs: int = 1, chunk_size: int = 256,
+                     columnar: bool = False) -> Union[Iterator[List[NamedEntity]], EntityTable]:
+        """Tag a stream of documents, yielding one entity list per document in input order.
+        
+        With ``n_jobs != 1`` chunks of ``chunk_size`` documents go to a process
+        pool; each worker builds its tagger (tokenizer, gazetteer automaton) once.
+        ``columnar=True`` consumes the stream into an ``EntityTable`` instead.
+        """
+        if n_jobs == 1:
+            documents = map(self.extract, texts)
+        else:
+            batches = parallel_map(_extract_batch, chunked(texts, chunk_size), n_jobs,
+                                   initializer=_init_worker, initargs=(self.gazetteer,))
+            documents = (entities for batch in batches for entities in batch)
+        if columnar:
+            return EntityTable.from_documents(documents)
+        return documents
+
+
+_WORKER_TAGGER: Optional[NERTagger] = None
+
+
+def _init_worker(gazetteer: Gazetteer):
+    global _WORKER_TAGGER
+    _WORKER_TAGGER = NERTagger(gazetteer)
+
+
+def _extract_batch(texts: List[str]) -> List[List[NamedEntity]]:
+    return [_WORKER_TAGGER.extract(text) for text in texts]
+
+
+_DEFAULT_TAGGER: Optional[NERTagger] = None
+
+
+def default_tagger() -> NERTagger:
+    """Shared tagger over the current default gazetteer."""
+    global _DEFAULT_TAGGER
+    if _DEFAULT_TAGGER is None or _DEFAULT_TAGGER.gazetteer is not default_gazetteer():
+        _DEFAULT_TAGGER = NERTagger()
+    return _DEFAULT_TAGGER
 
 
 def extract_entities(text: str) -> List[NamedEntity]:
-    return NERTagger().extract(text)
+    return default_tagger().extract(text)
+
+
+def extract_entities_many(texts: Iterable[str], n_jobs: int = 1) -> Iterator[List[NamedEntity]]:
+    return default_tagger().extract_many(texts, n_jobs=n_jobs)
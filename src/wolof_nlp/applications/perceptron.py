@@ -0,0 +1,197 @@
+"""Structured Perceptron - Averaged perceptron sequence model with Viterbi decoding"""
+
+import json
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+START = '<s>'
+
+
+def viterbi(emissions: List[List[float]], transitions: List[List[float]]) -> List[int]:
+    """Best label path for per-position ``emissions`` (n x T).
+
+    ``transitions[p][t]`` scores label ``t`` after ``p``; row ``T`` is the
+    start row. Ties go to the lowest label id.
+    """
+    if not emissions:
+        return []
+    n_labels = len(emissions[0])
+    labels = range(n_labels)
+    # None marks an all-zero column, whose best predecessor is simply the best previous score
+    columns = [[transitions[p][t] for p in labels] for t in labels]
+    columns = [column if any(column) else None for column in columns]
+    scores = [s + e for s, e in zip(transitions[n_labels], emissions[0])]
+    backpointers = []
+    for emission in emissions[1:]:
+        top = max(scores)
+        top_id = scores.index(top)
+        new_scores = []
+        pointers = []
+        for column, e in zip(columns, emission):
+            if column is None:
+                pointers.append(top_id)
+                new_scores.append(top + e)
+                continue
+            candidates = [s + w for s, w in zip(scores, column)]
+            best = max(candidates)
+            pointers.append(candidates.index(best))
+            new_scores.append(best + e)
+        scores = new_scores
+        backpointers.append(pointers)
+    last = scores.index(max(scores))
+    path = [last]
+    for pointers in reversed(backpointers):
+        last = pointers[last]
+        path.append(last)
+    path.reverse()
+    return path
+
+
+class StructuredPerceptron:
+    """First-order sequence tagger: sparse emission features plus label bigrams.
+
+    Weights are ``{feature: {label_id: weight}}``; transitions are the
+    features ``prev=<label>``. ``priors`` seeds weights before training,
+    e.g. ``{('rule=NOUN', 'NOUN'): 1.0}`` so that an untrained model echoes
+    a feature. Training averages weights over all updates (Collins 2002).
+    """
+
+    def __init__(self, labels: Sequence[str] = (), priors: Optional[Dict[Tuple[str, str], float]] = None):
+        self.labels: List[str] = []
+        self.label_ids: Dict[str, int] = {}
+        self.weights: Dict[str, Dict[int, float]] = {}
+        for label in labels:
+            self.label_id(label)
+        for (feature, label), weight in (priors or {}).items():
+            self.weights.setdefault(feature, {})[self.label_id(label)] = weight
+        self._totals: Dict[Tuple[str, int], float] = {}
+        self._tstamps: Dict[Tuple[str, int], int] = {}
+        self._updates = 0
+        self._transitions: Optional[List[List[float]]] = None
+
+    def label_id(self, label: str) -> int:
+        idx = self.label_ids.get(label)
+        if idx is None:
+            idx = self.label_ids[label] = len(self.labels)
+            self.labels.append(label)
+            self._transitions = None
+        return idx
+
+    def transitions(self) -> List[List[float]]:
+        """Dense (T + 1) x T label-bigram scores; the last row is the sentence start."""
+        if self._transitions is None:
+            n = len(self.labels)
+            matrix = []
+            for prev in self.labels + [START]:
+                row = [0.0] * n
+                for t, w in self.weights.get('prev=' + prev, {}).items():
+                    row[t] = w
+                matrix.append(row)
+            self._transitions = matrix
+        return self._transitions
+
+    def emissions(self, features: List[List[str]]) -> List[List[float]]:
+        weights = self.weights
+        n = len(self.labels)
+        result = []
+        for feats in features:
+            scores = [0.0] * n
+            for f in feats:
+                row = weights.get(f)
+                if row:
+                    for t, w in row.items():
+                        scores[t] += w
+            result.append(scores)
+        return result
+
+    def decode(self, features: List[List[str]]) -> List[int]:
+        return viterbi(self.emissions(features), self.transitions())
+
+    def predict(self, features: List[List[str]]) -> List[Tuple[str, float]]:
+        """Best labels with a local confidence: softmax of each position's scores given the chosen previous label."""
+        emissions = self.emissions(features)
+        transitions = self.transitions()
+        path = viterbi(emissions, transitions)
+        result = []
+        prev = len(self.labels)
+        for emission, t in zip(emissions, path):
+            scores = [e + s for e, s in zip(emission, transitions[prev])]
+            top = max(scores)
+            z = sum(math.exp(s - top) for s in scores)
+            result.append((self.labels[t], math.exp(scores[t] - top) / z))
+            prev = t
+        return result
+
+    def _update(self, feature: str, label: int, delta: float):
+        key = (feature, label)
+        row = self.weights.setdefault(feature, {})
+        weight = row.get(label, 0.0)
+        self._totals[key] = self._totals.get(key, 0.0) + (self._updates - self._tstamps.get(key, 0)) * weight
+        self._tstamps[key] = self._updates
+        row[label] = weight + delta
+
+    def update(self, features: List[List[str]], gold: Sequence[str]) -> bool:
+        """One perceptron step on a sentence; returns whether the prediction was already right."""
+        self._updates += 1
+        gold_ids = [self.label_id(label) for label in gold]
+        guess = self.decode(features)
+        if guess == gold_ids:
+            return True
+        gold_prev = guess_prev = START
+        for feats, g, p in zip(features, gold_ids, guess):
+            if g != p:
+                for f in feats:
+                    self._update(f, g, 1.0)
+                    self._update(f, p, -1.0)
+            if g != p or gold_prev != guess_prev:
+                self._update('prev=' + gold_prev, g, 1.0)
+                self._update('prev=' + guess_prev, p, -1.0)
+            gold_prev, guess_prev = self.labels[g], self.labels[p]
+        self._transitions = None
+        return False
+
+    def average(self):
+        """Replace each weight by its average over all updates so far."""
+        n = self._updates
+        if not n:
+            return
+        for feature, row in self.weights.items():
+            for label, weight in row.items():
+                key = (feature, label)
+                total = self._totals.get(key, 0.0) + (n - self._tstamps.get(key, 0)) * weight
+                row[label] = round(total / n, 4)
+        self._totals.clear()
+        self._tstamps.clear()
+        self._updates = 0
+        self._transitions = None
+
+    def fit(self, data: Iterable[Tuple[List[List[str]], Sequence[str]]], epochs: int = 5) -> 'StructuredPerceptron':
+        """Train on (features, labels) sentences for ``epochs`` passes, then average."""
+        data = list(data)
+        for _ in range(epochs):
+            for features, gold in data:
+                self.update(features, gold)
+        self.average()
+        return self
+
+    def to_dict(self) -> Dict:
+        return {
+            'labels': self.labels,
+            'weights': {f: {self.labels[t]: w for t, w in row.items() if w} for f, row in self.weights.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StructuredPerceptron':
+        model = cls(data['labels'])
+        for feature, row in data['weights'].items():
+            model.weights[feature] = {model.label_id(label): w for label, w in row.items()}
+        return model
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'StructuredPerceptron':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -1,8 +1,10 @@
 """Wolof POS Tagger - Morphology-first with context rules"""
 
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+from array import array
+from dataclasses import dataclass, field
 import re
+import time
 
 from ..core.constants import (
     COMMON_VERBS, COMMON_NOUNS, COMMON_ADJECTIVES, COMMON_ADVERBS,
@@ -12,7 +14,10 @@ from ..core.constants import (
     PRESENTATIVE, PERFECT, FUTURE, NEGATIVE_FUTURE,
     SENEGAL_PLACES, WOLOF_NAMES,
 )
-from ..core.tokenizer import WolofTokenizer, TokenType
+from ..core.parallel import chunked, parallel_map
+from ..core.tokenizer import WolofTokenizer, Token, TokenType
+from ..core.vocab import Vocabulary
+from .perceptron import StructuredPerceptron
 
 
 @dataclass
@@ -37,6 +42,20 @@ FRENCH_COMMON = frozenset([
     'cette', 'ces', 'mon', 'ton', 'son', 'notre', 'votre', 'leur', 'ce', 'cet',
 ])
 
+# Every tag the rule cascade can emit
+POS_TAGS = (
+    'NOUN', 'VERB', 'ADJ', 'ADV', 'DET', 'PREP', 'CONJ', 'PRON', 'NUM', 'CLIT', 'INTER', 'DISC',
+    'PROPN.LOC', 'PROPN.PER', 'TAM', 'TAM.SBJF', 'TAM.VRBF', 'TAM.PRSV', 'TAM.PFV', 'TAM.FUT',
+    'TAM.NEGF', 'VERB.NEG', 'VERB.RECIP', 'VERB.REP', 'NOUN.AGENT', 'NOUN.ABSTRACT', 'FWORD', 'UNK',
+)
+
+# Every value of POSToken.morphology
+POS_SOURCES = (None, 'french', 'negation', 'agent', 'abstract', 'reciprocal', 'repetitive',
+               'lexicon', 'context', 'model')
+
+# Weight of the rule-cascade tag in a fresh model, so that it tags exactly like the rules
+RULE_PRIOR = 1.0
+
 VERB_NEGATION_PATTERN = re.compile(r'^(.+?)(w?oul|w?ul)$', re.IGNORECASE)
 AGENT_NOUN_PATTERN = re.compile(r'^(.+?)(kat)$', re.IGNORECASE)
 ABSTRACT_NOUN_PATTERN = re.compile(r'^(.+?)(aay|waay|in)$', re.IGNORECASE)
@@ -45,11 +64,170 @@ CAUSATIVE_PATTERN = re.compile(r'^(.+?)(al|loo|lu|andi)$', re.IGNORECASE)
 REFLEXIVE_PATTERN = re.compile(r'^(.+?)(u|ku|iku)$', re.IGNORECASE)
 REPETITIVE_PATTERN = re.compile(r'^(.+?)(aat|waat)$', re.IGNORECASE)
 
+# The five suffix rules of _classify_by_morphology as one match. No suffix of
+# one group ends another group's suffix, so at most one group can match a word.
+MORPHOLOGY_PATTERN = re.compile(
+    r'^.+?(?:(?P<negation>w?oul|w?ul)|(?P<agent>kat)|(?P<abstract>aay|waay|in)'
+    r'|(?P<reciprocal>ante|andoo|aante)|(?P<repetitive>aat|waat))$',
+    re.IGNORECASE
+)
+
+# group -> (tag, confidence, minimum word length)
+MORPHOLOGY_TAGS = {
+    'negation': ('VERB.NEG', 0.88, 0),
+    'agent': ('NOUN.AGENT', 0.90, 0),
+    'abstract': ('NOUN.ABSTRACT', 0.85, 0),
+    'reciprocal': ('VERB.RECIP', 0.82, 6),
+    'repetitive': ('VERB.REP', 0.80, 6),
+}
+
+
+def _build_word_table(rules) -> Dict[str, Tuple[str, float]]:
+    """Word -> (tag, confidence) from (word set, tag, confidence) rules in priority order."""
+    table = {}
+    for words, tag, conf in reversed(rules):
+        for w in words:
+            table[w] = (tag, conf)
+    return table
+
+
+# word -> (tag, confidence) of the first matching lexicon check
+LEXICON_TAGS = _build_word_table([
+    (TAM_MARKERS, 'TAM', 0.99),
+    (SUBJECT_FOCUS, 'TAM.SBJF', 0.99),
+    (VERB_FOCUS, 'TAM.VRBF', 0.99),
+    (PRESENTATIVE, 'TAM.PRSV', 0.99),
+    (PERFECT, 'TAM.PFV', 0.99),
+    (FUTURE, 'TAM.FUT', 0.99),
+    (NEGATIVE_FUTURE, 'TAM.NEGF', 0.99),
+    (ALL_DETERMINERS, 'DET', 0.99),
+    (SENEGAL_PLACES, 'PROPN.LOC', 0.95),
+    (WOLOF_NAMES, 'PROPN.PER', 0.95),
+    (COMMON_VERBS, 'VERB', 0.95),
+    (COMMON_NOUNS, 'NOUN', 0.95),
+    (COMMON_ADJECTIVES, 'ADJ', 0.95),
+    (COMMON_ADVERBS, 'ADV', 0.95),
+    (PREPOSITIONS, 'PREP', 0.95),
+    (CONJUNCTIONS, 'CONJ', 0.95),
+    (INTERROGATIVES, 'INTER', 0.95),
+    (DISCOURSE_MARKERS, 'DISC', 0.90),
+    (PRONOUNS, 'PRON', 0.95),
+    (NUMBERS, 'NUM', 0.99),
+    (SUBJECT_CLITICS, 'CLIT', 0.95),
+    (OBJECT_CLITICS, 'CLIT', 0.95),
+])
+
+# previous word -> (tag, confidence) the context rule assigns to the next word
+CONTEXT_TAGS = _build_word_table([
+    (TAM_MARKERS, 'VERB', 0.78),
+    (ALL_DETERMINERS, 'NOUN', 0.75),
+    (PREPOSITIONS, 'NOUN', 0.70),
+    (SUBJECT_FOCUS, 'VERB', 0.80),
+    (VERB_FOCUS, 'VERB', 0.80),
+    (PRESENTATIVE, 'VERB', 0.82),
+])
+
+
+@dataclass
+class POSTable:
+    """Columnar tags for a batch of sentences.
+    
+    Sentence i covers tokens ``offsets[i]:offsets[i + 1]``. Token j is
+    ``words[word_ids[j]]`` tagged ``tags[tag_ids[j]]`` with confidence
+    ``confidences[j]`` (float32) and morphology ``sources[source_ids[j]]``.
+    ``POSToken`` objects are only built by ``sentence`` / ``__iter__``.
+    """
+    words: Vocabulary = field(default_factory=Vocabulary)
+    tags: Vocabulary = field(default_factory=lambda: Vocabulary(POS_TAGS))
+    sources: Vocabulary = field(default_factory=lambda: Vocabulary(POS_SOURCES))
+    word_ids: array = field(default_factory=lambda: array('i'))
+    tag_ids: array = field(default_factory=lambda: array('B'))
+    confidences: array = field(default_factory=lambda: array('f'))
+    source_ids: array = field(default_factory=lambda: array('B'))
+    offsets: array = field(default_factory=lambda: array('i', [0]))
+    
+    def append(self, tokens: List[POSToken]):
+        for t in tokens:
+            self.word_ids.append(self.words.add(t.text))
+            self.tag_ids.append(self.tags.add(t.pos))
+            self.confidences.append(t.confidence)
+            self.source_ids.append(self.sources.add(t.morphology))
+        self.offsets.append(len(self.tag_ids))
+    
+    def extend(self, other: 'POSTable'):
+        """Append another table's sentences, remapping its word, tag and source ids."""
+        base = self.offsets[-1]
+        word_map = self.words.encode(other.words)
+        tag_map = self.tags.encode(other.tags)
+        source_map = self.sources.encode(other.sources)
+        self.word_ids.extend(word_map[i] for i in other.word_ids)
+        self.tag_ids.extend(tag_map[i] for i in other.tag_ids)
+        self.confidences.extend(other.confidences)
+        self.source_ids.extend(source_map[i] for i in other.source_ids)
+        self.offsets.extend(base + o for o in other.offsets[1:])
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    @property
+    def n_tokens(self) -> int:
+        return len(self.tag_ids)
+    
+    def sentence(self, i: int) -> List[POSToken]:
+        """Sentence ``i`` as ``POSToken`` objects; confidences are rounded to the tagger's two decimals."""
+        words, tags, sources = self.words, self.tags, self.sources
+        return [
+            POSToken(words[self.word_ids[j]], tags[self.tag_ids[j]], round(self.confidences[j], 2),
+                     sources[self.source_ids[j]])
+            for j in range(self.offsets[i], self.offsets[i + 1])
+        ]
+    
+    def tag_sentence(self, i: int) -> List[Tuple[str, str]]:
+        words, tags = self.words, self.tags
+        return [(words[self.word_ids[j]], tags[self.tag_ids[j]]) for j in range(self.offsets[i], self.offsets[i + 1])]
+    
+    def __iter__(self) -> Iterator[List[POSToken]]:
+        for i in range(len(self)):
+            yield self.sentence(i)
+
+
+def rule_features(rule_tokens: List[POSToken]) -> List[List[str]]:
+    """Emission features for the statistical mode: rule-cascade output around each word plus word shape."""
+    features = []
+    n = len(rule_tokens)
+    for i, token in enumerate(rule_tokens):
+        w = token.text.lower()
+        features.append([
+            'bias',
+            'rule=' + token.pos,
+            'source=' + str(token.morphology),
+            'word=' + w,
+            'suffix=' + w[-3:],
+            'prefix=' + w[:2],
+            'upper=' + str(token.text[:1].isupper()),
+            'prev_rule=' + (rule_tokens[i - 1].pos if i else '<s>'),
+            'next_rule=' + (rule_tokens[i + 1].pos if i + 1 < n else '</s>'),
+            'prev_word=' + (rule_tokens[i - 1].text.lower() if i else '<s>'),
+        ])
+    return features
+
+
+def new_model() -> StructuredPerceptron:
+    """Untrained model that reproduces the rule cascade's tags."""
+    return StructuredPerceptron(POS_TAGS, {('rule=' + t, t): RULE_PRIOR for t in POS_TAGS})
+
 
 class POSTagger:
+    """Rule cascade tagger, optionally rescored by a ``StructuredPerceptron``.
+    
+    With a ``model``, the rule outputs become emission features and each
+    sentence is decoded jointly with Viterbi over tag bigrams, instead of the
+    greedy previous-token context rule.
+    """
     
-    def __init__(self):
+    def __init__(self, model: Optional[StructuredPerceptron] = None):
         self.tokenizer = WolofTokenizer(normalize=True)
+        self.model = model
     
     def _is_french(self, word: str) -> bool:
         w = word.lower()
@@ -61,22 +239,11 @@ class POSTagger:
     
     def _classify_by_morphology(self, word: str) -> Tuple[Optional[str], float, Optional[str]]:
         w = word.lower()
-        
-        if VERB_NEGATION_PATTERN.match(w):
-            return 'VERB.NEG', 0.88, 'negation'
-        
-        if AGENT_NOUN_PATTERN.match(w):
-            return 'NOUN.AGENT', 0.90, 'agent'
-        
-        if ABSTRACT_NOUN_PATTERN.match(w):
-            return 'NOUN.ABSTRACT', 0.85, 'abstract'
-        
-        if RECIPROCAL_PATTERN.match(w) and len(w) > 5:
-            return 'VERB.RECIP', 0.82, 'reciprocal'
-        
-        if REPETITIVE_PATTERN.match(w) and len(w) > 5:
-            return 'VERB.REP', 0.80, 'repetitive'
-        
+        m = MORPHOLOGY_PATTERN.match(w)
+        if m:
+            pos, conf, min_length = MORPHOLOGY_TAGS[m.lastgroup]
+            if len(w) >= min_length:
+                return pos, conf, m.lastgroup
         return None, 0.0, None
     
     def _classify_by_context(self, tokens: List, index: int) -> Tuple[Optional[str], float]:
@@ -84,75 +251,14 @@ class POSTagger:
             return None, 0.0
         
         prev_token = tokens[index - 1]
-        prev_word = prev_token.text.lower() if prev_token.type == TokenType.WORD else ''
-        
-        if prev_word in TAM_MARKERS:
-            return 'VERB', 0.78
-        
-        if prev_word in ALL_DETERMINERS:
-            return 'NOUN', 0.75
-        
-        if prev_word in PREPOSITIONS:
-            return 'NOUN', 0.70
-        
-        if prev_word in SUBJECT_FOCUS or prev_word in VERB_FOCUS:
-            return 'VERB', 0.80
-        
-        if prev_word in PRESENTATIVE:
-            return 'VERB', 0.82
-        
-        return None, 0.0
+        if prev_token.type != TokenType.WORD:
+            return None, 0.0
+        return CONTEXT_TAGS.get(prev_token.text.lower(), (None, 0.0))
     
     def _classify_by_lexicon(self, word: str) -> Tuple[str, float]:
-        w = word.lower()
-        
-        if w in TAM_MARKERS:
-            return 'TAM', 0.99
-        if w in SUBJECT_FOCUS:
-            return 'TAM.SBJF', 0.99
-        if w in VERB_FOCUS:
-            return 'TAM.VRBF', 0.99
-        if w in PRESENTATIVE:
-            return 'TAM.PRSV', 0.99
-        if w in PERFECT:
-            return 'TAM.PFV', 0.99
-        if w in FUTURE:
-            return 'TAM.FUT', 0.99
-        if w in NEGATIVE_FUTURE:
-            return 'TAM.NEGF', 0.99
-        if w in ALL_DETERMINERS:
-            return 'DET', 0.99
-        if w in SENEGAL_PLACES:
-            return 'PROPN.LOC', 0.95
-        if w in WOLOF_NAMES:
-            return 'PROPN.PER', 0.95
-        if w in COMMON_VERBS:
-            return 'VERB', 0.95
-        if w in COMMON_NOUNS:
-            return 'NOUN', 0.95
-        if w in COMMON_ADJECTIVES:
-            return 'ADJ', 0.95
-        if w in COMMON_ADVERBS:
-            return 'ADV', 0.95
-        if w in PREPOSITIONS:
-            return 'PREP', 0.95
-        if w in CONJUNCTIONS:
-            return 'CONJ', 0.95
-        if w in INTERROGATIVES:
-            return 'INTER', 0.95
-        if w in DISCOURSE_MARKERS:
-            return 'DISC', 0.90
-        if w in PRONOUNS:
-            return 'PRON', 0.95
-        if w in NUMBERS:
-            return 'NUM', 0.99
-        if w in SUBJECT_CLITICS or w in OBJECT_CLITICS:
-            return 'CLIT', 0.95
-        
-        return 'UNK', 0.0
+        return LEXICON_TAGS.get(word.lower(), ('UNK', 0.0))
     
-    def tag(self, text: str) -> List[POSToken]:
-        tokens = self.tokenizer.tokenize(text)
+    def _tag_by_rules(self, tokens: List[Token]) -> List[POSToken]:
         result = []
         
         for i, token in enumerate(tokens):
@@ -186,12 +292,88 @@ class POSTagger:
                 result.append(POSToken(word, 'UNK', 0.0, None))
         
         return result
-        
+    
+    def _tag_tokens(self, tokens: List[Token]) -> List[POSToken]:
+        result = self._tag_by_rules(tokens)
+        if self.model is None or not result:
+            return result
+        predictions = self.model.predict(rule_features(result))
+        for token, (pos, conf) in zip(result, predictions):
+            if pos != token.pos:
+                token.pos, token.confidence, token.morphology = pos, round(conf, 2), 'model'
         return result
     
+    def tag(self, text: str) -> List[POSToken]:
+        return self._tag_tokens(self.tokenizer.tokenize(text))
+    
+    def tag_many(self, texts: Iterable[str], n_jobs: int = 1, chunk_size: int = 256) -> POSTable:
+        """Tag a stream of sentences into one ``POSTable``, in input order.
+        
+        With ``n_jobs != 1`` chunks of ``chunk_size`` texts are tagged across
+        a process pool, each worker building its tagger once.
+        """
+        if n_jobs == 1:
+            table = POSTable()
+            for text in texts:
+                table.append(self.tag(text))
+            return table
+        table = POSTable()
+        for part in parallel_map(_tag_batch, chunked(texts, chunk_size), n_jobs,
+                                 initializer=_init_worker, initargs=(self.model,)):
+            table.extend(part)
+        return table
+    
+    def _word_tokens(self, words: List[str]) -> List[Token]:
+        return [Token(w, TokenType.WORD, 0, 0) for w in words]
+    
+    def train(self, sentences: Iterable[List[Tuple[str, str]]], epochs: int = 5) -> StructuredPerceptron:
+        """Fit the statistical mode on sentences of (word, tag) pairs, starting from the rule prior."""
+        model = new_model()
+        data = []
+        for sentence in sentences:
+            words = [w for w, _ in sentence]
+            data.append((rule_features(self._tag_by_rules(self._word_tokens(words))), [t for _, t in sentence]))
+        self.model = model.fit(data, epochs)
+        return self.model
+    
+    def evaluate(self, sentences: Iterable[List[Tuple[str, str]]]) -> Dict[str, float]:
+        """Token accuracy and throughput on sentences of (word, tag) pairs."""
+        correct = total = n_sentences = 0
+        seconds = 0.0
+        for sentence in sentences:
+            tokens = self._word_tokens([w for w, _ in sentence])
+            start = time.perf_counter()
+            predicted = self._tag_tokens(tokens)
+            seconds += time.perf_counter() - start
+            correct += sum(p.pos == gold for p, (_, gold) in zip(predicted, sentence))
+            total += len(sentence)
+            n_sentences += 1
+        return {
+            'accuracy': correct / total if total else 0.0,
+            'tokens': total,
+            'sentences': n_sentences,
+            'seconds': seconds,
+            'tokens_per_second': total / seconds if seconds else 0.0,
+        }
+    
     def tag_sentence(self, text: str) -> List[Tuple[str, str]]:
         return [(t.text, t.pos) for t in self.tag(text)]
 
 
+_WORKER_TAGGER: Optional[POSTagger] = None
+
+
+def _init_worker(model: Optional[StructuredPerceptron]):
+    global _WORKER_TAGGER
+    _WORKER_TAGGER = POSTagger(model)
+
+
+def _tag_batch(texts: List[str]) -> POSTable:
+    table = POSTable()
+    for text in texts:
+        table.append(_WORKER_TAGGER.tag(text))
+    return table
+
+
 def tag(text: str) -> List[Tuple[str, str]]:
     return POSTagger().tag_sentence(text)
@@ -1,11 +1,14 @@
 """Wolof Sentiment Analysis - Rule-based hybrid approach with morphological awareness"""
 
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import re
 
-from ..core.tokenizer import WolofTokenizer, TokenType
+from ..core.parallel import chunked, parallel_map
+from ..core.tokenizer import EMOJI_PATTERN, WolofTokenizer, TokenType
+from ..core.vocab import Vocabulary
 
 
 class Sentiment(Enum):
@@ -64,20 +67,45 @@ DISCOURSE_FLIPPERS = frozenset([
 POSITIVE_EMOJI = frozenset([
     '❤', '😂', '🙏', '😊', '😍', '🥰', '👍', '🔥', '💪', '👏', '💖', '💕',
     '💗', '💘', '💙', '💚', '💛', '🧡', '💜', '🤍', '✨', '🎉', '😘', '🤣',
+    '😀', '😃', '😄', '😁', '😆', '😅', '☺', '🙂', '🤗', '🤩', '😇', '😻',
+    '😹', '🥳', '💯', '🙌', '🤝', '👌', '✌', '🌹', '💐', '🏆', '🥇', '😋',
+    '😎', '💞', '💓', '♥', '🫶', '🤲', '✅', '⭐', '🌟', '🎊',
 ])
 
 NEGATIVE_EMOJI = frozenset([
     '😭', '😢', '💔', '😡', '😠', '😤', '😞', '😔', '😿', '🤮', '👎',
+    '😒', '😕', '🙁', '☹', '😣', '😖', '😫', '😩', '😥', '😰', '😱', '🤬',
+    '😾', '🤦', '🤢', '😪', '😓', '😟', '🥺', '🥲', '😨', '❌', '🖕',
 ])
 
 NEGATION_PATTERN = re.compile(r'^(.+?)(w?oul|w?ul)$', re.IGNORECASE)
 DU_PATTERN = re.compile(r'^(du|duma|doo|dunu|dungeen|duñu)$', re.IGNORECASE)
 
+# Polarity of an emoji's first code point; skin tones, variation selectors and
+# ZWJ continuations do not change it
+EMOJI_POLARITY = {**{ord(e): 1 for e in POSITIVE_EMOJI}, **{ord(e): -1 for e in NEGATIVE_EMOJI}}
+
+# Per-word-type flags, computed once per distinct lowercased word
+NEGATED_POSITIVE = 1      # negated verb (-ul) of a positive root
+NEGATED_NEGATIVE = 2      # negated verb (-ul) of a negative root
+POSITIVE_ROOT = 4         # flips to negative after du/duma/...
+NEGATIVE_ROOT = 8         # flips to positive after du/duma/...
+POSITIVE = 16
+NEGATIVE = 32
+DU = 64
+INTENSIFIER = 128
+FLIPPER = 256
+
 
 class SentimentAnalyzer:
     
-    def __init__(self):
-        self.tokenizer = WolofTokenizer(normalize=True)
+    def __init__(self, max_types: int = 100000):
+        """``max_types`` bounds the word-type table: past it the table is dropped and refilled on demand."""
+        # Language tags are not used for scoring
+        self.tokenizer = WolofTokenizer(normalize=True, detect_language=False)
+        self.max_types = max_types
+        self.types = Vocabulary()
+        self.flags = array('H')
     
     def _is_verb_negation(self, word: str) -> Tuple[bool, Optional[str]]:
         match = NEGATION_PATTERN.match(word.lower())
@@ -87,101 +115,104 @@ class SentimentAnalyzer:
                 return True, root
         return False, None
     
-    def _check_negation_context(self, words: List[str], index: int) -> bool:
-        if index > 0:
-            prev_word = words[index - 1].lower()
-            if DU_PATTERN.match(prev_word):
-                return True
-        return False
-    
-    def _extract_emoji_sentiment(self, text: str) -> Tuple[int, int]:
-        pos_count = sum(1 for char in text if char in POSITIVE_EMOJI)
-        neg_count = sum(1 for char in text if char in NEGATIVE_EMOJI)
+    def _extract_emoji_sentiment(self, emoji_runs: Iterable[str]) -> Tuple[int, int]:
+        """Positive and negative counts over the emojis in the tokenizer's EMOJI tokens."""
+        pos_count = neg_count = 0
+        for run in emoji_runs:
+            for emoji in EMOJI_PATTERN.findall(run):
+                polarity = EMOJI_POLARITY.get(ord(emoji[0]), 0)
+                if polarity > 0:
+                    pos_count += 1
+                elif polarity < 0:
+                    neg_count += 1
         return pos_count, neg_count
     
-    def _has_intensifier(self, words: List[str]) -> bool:
-        return any(w.lower() in INTENSIFIERS for w in words)
+    def _word_flags(self, word: str) -> int:
+        flags = 0
+        is_neg, root = self._is_verb_negation(word)
+        if is_neg and root:
+            if root in POSITIVE_ROOTS:
+                flags |= NEGATED_POSITIVE
+            elif root in NEGATIVE_ROOTS:
+                flags |= NEGATED_NEGATIVE
+        if word in POSITIVE_ROOTS:
+            flags |= POSITIVE_ROOT
+        elif word in NEGATIVE_ROOTS:
+            flags |= NEGATIVE_ROOT
+        if word in POSITIVE_ROOTS or word in ARABIC_POSITIVE or word in FRENCH_POSITIVE:
+            flags |= POSITIVE
+        elif word in NEGATIVE_ROOTS or word in FRENCH_NEGATIVE:
+            flags |= NEGATIVE
+        if DU_PATTERN.match(word):
+            flags |= DU
+        if word in INTENSIFIERS:
+            flags |= INTENSIFIER
+        if word in DISCOURSE_FLIPPERS:
+            flags |= FLIPPER
+        return flags
     
-    def _find_discourse_flip(self, words: List[str]) -> int:
-        for i, word in enumerate(words):
-            if word.lower() in DISCOURSE_FLIPPERS:
-                return i
-        return -1
+    def _encode(self, words: Iterable[str]) -> array:
+        """Type ids of lowercased ``words``, extending the type and flag tables with unseen words."""
+        if len(self.types) > self.max_types:
+            # Flags depend only on the word, so a fresh table gives the same scores
+            self.types = Vocabulary()
+            self.flags = array('H')
+        types, flags = self.types, self.flags
+        ids = array('i')
+        for word in words:
+            idx = types.add(word)
+            if idx == len(flags):
+                flags.append(self._word_flags(word))
+            ids.append(idx)
+        return ids
     
-    def analyze(self, text: str) -> SentimentResult:
-        tokens = self.tokenizer.tokenize(text)
-        words = [t.text for t in tokens if t.type == TokenType.WORD]
-        word_list = [w.lower() for w in words]
-        
-        pos_found = []
-        neg_found = []
-        negated = []
+    def _lex(self, text: str) -> Tuple[List[str], Tuple[int, int]]:
+        """Lowercased words and (positive, negative) emoji counts from one tokenization."""
+        words = []
+        emojis = []
+        for t in self.tokenizer.tokenize(text):
+            if t.type == TokenType.WORD:
+                words.append(t.text.lower())
+            elif t.type == TokenType.EMOJI:
+                emojis.append(t.text)
+        return words, self._extract_emoji_sentiment(emojis)
+    
+    def _score(self, ids: Sequence[int], emoji_counts: Tuple[int, int]) -> SentimentResult:
+        types, table = self.types, self.flags
+        flags = [table[i] for i in ids]
         
-        flip_index = self._find_discourse_flip(words)
+        flip_index = next((i for i, f in enumerate(flags) if f & FLIPPER), -1)
         has_flip = flip_index >= 0
         
-        before_flip_pos = []
-        before_flip_neg = []
-        after_flip_pos = []
-        after_flip_neg = []
+        # [positive, negative] words before and after the first discourse flipper
+        before = ([], [])
+        after = ([], [])
+        negated = []
         
-        for i, word in enumerate(word_list):
-            is_after_flip = has_flip and i > flip_index
-            
-            is_neg, root = self._is_verb_negation(word)
-            if is_neg and root:
-                if root in POSITIVE_ROOTS:
-                    negated.append(word)
-                    if is_after_flip:
-                        after_flip_neg.append(word)
-                    else:
-                        before_flip_neg.append(word)
-                    continue
-                elif root in NEGATIVE_ROOTS:
-                    negated.append(word)
-                    if is_after_flip:
-                        after_flip_pos.append(word)
-                    else:
-                        before_flip_pos.append(word)
-                    continue
-            
-            if self._check_negation_context(word_list, i):
-                if word in POSITIVE_ROOTS:
-                    negated.append(word)
-                    if is_after_flip:
-                        after_flip_neg.append(word)
-                    else:
-                        before_flip_neg.append(word)
-                    continue
-                elif word in NEGATIVE_ROOTS:
-                    negated.append(word)
-                    if is_after_flip:
-                        after_flip_pos.append(word)
-                    else:
-                        before_flip_pos.append(word)
-                    continue
-            
-            if word in POSITIVE_ROOTS or word in ARABIC_POSITIVE or word in FRENCH_POSITIVE:
-                if is_after_flip:
-                    after_flip_pos.append(word)
-                else:
-                    before_flip_pos.append(word)
-            elif word in NEGATIVE_ROOTS or word in FRENCH_NEGATIVE:
-                if is_after_flip:
-                    after_flip_neg.append(word)
-                else:
-                    before_flip_neg.append(word)
+        for i, f in enumerate(flags):
+            bucket = after if has_flip and i > flip_index else before
+            if f & (NEGATED_POSITIVE | NEGATED_NEGATIVE):
+                negated.append(types[ids[i]])
+                bucket[1 if f & NEGATED_POSITIVE else 0].append(types[ids[i]])
+                continue
+            if i > 0 and flags[i - 1] & DU and f & (POSITIVE_ROOT | NEGATIVE_ROOT):
+                negated.append(types[ids[i]])
+                bucket[1 if f & POSITIVE_ROOT else 0].append(types[ids[i]])
+                continue
+            if f & POSITIVE:
+                bucket[0].append(types[ids[i]])
+            elif f & NEGATIVE:
+                bucket[1].append(types[ids[i]])
         
-        if has_flip and (after_flip_pos or after_flip_neg):
-            pos_found = after_flip_pos
-            neg_found = after_flip_neg
+        if has_flip and (after[0] or after[1]):
+            pos_found, neg_found = after
         else:
-            pos_found = before_flip_pos + after_flip_pos
-            neg_found = before_flip_neg + after_flip_neg
+            pos_found = before[0] + after[0]
+            neg_found = before[1] + after[1]
         
-        emoji_pos, emoji_neg = self._extract_emoji_sentiment(text)
+        emoji_pos, emoji_neg = emoji_counts
         
-        has_intensifier = self._has_intensifier(word_list)
+        has_intensifier = any(f & INTENSIFIER for f in flags)
         multiplier = 1.5 if has_intensifier else 1.0
         
         pos_score = (len(pos_found) + emoji_pos * 0.5) * multiplier
@@ -205,6 +236,49 @@ class SentimentAnalyzer:
             negated_words=negated,
             intensified=has_intensifier,
         )
+    
+    def analyze(self, text: str) -> SentimentResult:
+        words, emoji_counts = self._lex(text)
+        return self._score(self._encode(words), emoji_counts)
+    
+    def analyze_many(self, texts: Iterable[str], n_jobs: int = 1, chunk_size: int = 256) -> Iterator[SentimentResult]:
+        """Analyze a stream of texts, yielding results in input order.
+        
+        Each chunk is tokenized once into a flat array of type ids with
+        per-text offsets; word flags are computed once per distinct word.
+        With ``n_jobs != 1`` chunks are scored across a process pool.
+        """
+        if n_jobs == 1:
+            for chunk in chunked(texts, chunk_size):
+                yield from self._analyze_chunk(chunk)
+        else:
+            for results in parallel_map(_analyze_chunk, chunked(texts, chunk_size), n_jobs,
+                                        initializer=_init_worker):
+                yield from results
+    
+    def _analyze_chunk(self, texts: List[str]) -> List[SentimentResult]:
+        words = []
+        offsets = [0]
+        emoji_counts = []
+        for text in texts:
+            text_words, counts = self._lex(text)
+            words.extend(text_words)
+            offsets.append(len(words))
+            emoji_counts.append(counts)
+        ids = self._encode(words)
+        return [self._score(ids[offsets[i]:offsets[i + 1]], emoji_counts[i]) for i in range(len(texts))]
+
+
+_WORKER_ANALYZER: Optional[SentimentAnalyzer] = None
+
+
+def _init_worker():
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = SentimentAnalyzer()
+
+
+def _analyze_chunk(texts: List[str]) -> List[SentimentResult]:
+    return _WORKER_ANALYZER._analyze_chunk(texts)
 
 
 def analyze_sentiment(text: str) -> SentimentResult:
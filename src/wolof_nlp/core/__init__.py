@@ -1,5 +1,9 @@
 from .tokenizer import WolofTokenizer, Token, TokenType, Language, tokenize, morphemes
 from .normalizer import WolofNormalizer, normalize
+from .vocab import Vocabulary
+from .cache import LRUCache
+from .automaton import AhoCorasick
+from .gazetteer import Gazetteer, default_gazetteer, set_default_gazetteer
 
 __all__ = [
     "WolofTokenizer",
@@ -10,4 +14,10 @@ __all__ = [
     "morphemes",
     "WolofNormalizer",
     "normalize",
+    "Vocabulary",
+    "LRUCache",
+    "AhoCorasick",
+    "Gazetteer",
+    "default_gazetteer",
+    "set_default_gazetteer",
 ]
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Aho-Corasick Automaton - Single-pass multi-pattern matching with word boundaries"""
+
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+Match = Tuple[int, int, Any]
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == '_'
+
+
+class AhoCorasick:
+    """Finds every occurrence of a set of patterns in one scan of the text.
+
+    Each pattern carries a value (several values may share a pattern).
+    With ``whole_words`` set, matches must start and end on word boundaries,
+    so ``na`` does not match inside ``nañu``.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = (), whole_words: bool = True):
+        self.whole_words = whole_words
+        self._goto: List[Dict[str, int]] = [{}]
+        self._own: List[List[Tuple[int, Any]]] = [[]]
+        self._fail: List[int] = []
+        self._out: List[List[Tuple[int, Any]]] = []
+        for pattern, value in patterns:
+            self.add(pattern, value)
+
+    def add(self, pattern: str, value: Hashable = None):
+        if not pattern:
+            raise ValueError("Empty pattern")
+        state = 0
+        for c in pattern:
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][c] = nxt
+                self._goto.append({})
+                self._own.append([])
+            state = nxt
+        self._own[state].append((len(pattern), pattern if value is None else value))
+        self._out = []
+
+    def _build(self):
+        goto = self._goto
+        fail = [0] * len(goto)
+        out = [list(matches) for matches in self._own]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(c, 0)
+                out[nxt] += out[fail[nxt]]
+        self._fail, self._out = fail, out
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """Yield ``(start, end, value)`` for every match, ordered by end offset."""
+        if not self._out:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        whole_words = self.whole_words
+        n = len(text)
+        state = 0
+        for i, c in enumerate(text):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            if whole_words and end < n and _is_word_char(text[end]) and _is_word_char(c):
+                continue
+            for length, value in out[state]:
+                start = end - length
+                if whole_words and start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                    continue
+                yield start, end, value
+
+    def find_all(self, text: str) -> List[Match]:
+        return list(self.iter_matches(text))
+
+    def find(self, text: str) -> List[Match]:
+        """Non-overlapping matches, preferring the leftmost and then the longest."""
+        result = []
+        last_end = 0
+        for start, end, value in sorted(self.iter_matches(text), key=lambda m: (m[0], m[0] - m[1])):
+            if start >= last_end:
+                result.append((start, end, value))
+                last_end = end
+        return result
+
+    def __len__(self) -> int:
+        return sum(len(matches) for matches in self._own)
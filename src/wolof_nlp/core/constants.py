@@ -399,32 +399,62 @@ SENEGAL_PLACES = frozenset([
     'thiaroye', 'parcelles', 'médina', 'medina', 'plateau', 'fann',
     'sicap', 'liberté', 'liberte', 'sacré-coeur', 'mermoz', 'mamelles',
     'diamniadio', 'saly', 'somone', 'ngaparou', 'popenguine', 'joal', 'fadiouth',
-    'kayar', 'lac-rose', 'lac rose', 'petite-côte', 'cap-skirring',
+    'kayar', 'lac-rose', 'lac rose', 'petite-côte', 'petite côte', 'cap-skirring', 'cap vert',
 ])
 
-WOLOF_NAMES = frozenset([
+FOREIGN_PLACES = frozenset([
+    'mauritanie', 'mali', 'guinée', 'guinee', 'france', 'paris', 'usa', 'america',
+    'maroc', 'italie', 'espagne', 'london', 'londres', 'new york', 'abidjan',
+    'bamako', 'conakry', 'banjul',
+])
+
+WOLOF_FIRST_NAMES = frozenset([
     'samba', 'demba', 'fatou', 'fatu', 'awa', 'moussa', 'musa', 
     'ibrahima', 'amadou', 'amadu', 'ousmane', 'usmane',
-    'mariama', 'aissatou', 'aisatu', 'aminata', 'modou', 'modu',
-    'mamadou', 'mamadu', 'abdoulaye', 'abdulaye', 'aliou', 'aliu',
-    'oumar', 'umar', 'binta', 'coumba', 'kumba', 'ndeye', 'ndey',
-    'pape', 'cheikh', 'sokhna', 'soxna',
-    'adja', 'mor', 'mbaye', 'lamine', 'malick', 'youssou', 'yusu',
-    'babacar', 'babakar', 'abdou', 'abdu',
-    'alassane', 'alasan', 'khady', 'xadi', 'mame', 'biram', 
-    'thierno', 'cerno', 'assane', 'asan', 'djibril', 'jibril',
+    'mariama', 'aïssatou', 'aissatou', 'aisatu', 'aminata', 
+    'modou', 'modu', 'mamadou', 'mamadu', 'abdoulaye', 'abdulaye',
+    'aliou', 'aliu', 'oumar', 'umar', 'binta', 'coumba', 'kumba', 
+    'daba', 'ndeye', 'ndey', 'pape', 'cheikh',
+    'sokhna', 'soxna', 'adja', 'mor', 'mbaye', 'lamine', 'malick', 
+    'youssou', 'yusu', 'babacar', 'babakar',
+    'abdou', 'abdu', 'alassane', 'alasan', 'khady', 'xadi', 
+    'mame', 'biram', 'thierno', 'cerno', 'assane', 'asan', 'djibril', 'jibril',
     'seydou', 'seydu', 'boubacar', 'bubakar', 'aida', 'astou', 'astu',
     'yacine', 'yasin', 'rokhaya', 'roxaya', 'seynabou',
     'dieynaba', 'jeynaba', 'nogaye', 'aby', 'adama', 'bamba', 
-    'fallou', 'falu', 'serigne', 'seriñ',
-    'diop', 'ndiaye', 'fall', 'gueye', 'geye', 'seck', 'ba', 'sy', 
-    'thiam', 'ciam', 'diallo', 'jalo',
-    'faye', 'sall', 'cisse', 'cissé', 'diouf', 'juf', 'wade', 
-    'diagne', 'jañ', 'sarr', 'niang', 'ñang',
-    'kane', 'dia', 'ja', 'tall', 'samb', 'lo', 'ndoye', 'ndoy',
-    'sene', 'bodian', 'bojan', 'diatta', 'jata', 'sonko', 'sow', 'so', 'camara', 'kamara',
+    'fallou', 'falu',
+])
+
+WOLOF_SURNAMES = frozenset([
+    'ba', 'seck', 'mbaye', 'fall', 'ndiaye', 'faye', 'sall', 'diop', 'thiam', 'ciam',
+    'gueye', 'geye', 'sy', 'cissé', 'cisse', 'diouf', 'juf', 'wade', 'diagne', 'jañ',
+    'mbacké', 'mbacke', 'diaw', 'sarr', 'niang', 'ñang', 'kane', 'dia', 'tall', 'samb', 'lo',
+    'ndoye', 'ndoy', 'gning', 'sene', 'bodian', 'bojan', 'diatta', 'jata', 'sonko', 'sow',
+    'camara', 'kamara', 'diallo', 'jalo',
+])
+
+# Surname spellings that collide with function words (ja, so); kept out of NER.
+AMBIGUOUS_SURNAMES = frozenset(['ja', 'so'])
+
+RELIGIOUS_TITLES = frozenset([
+    'serigne', 'sëriñ', 'seriñe', 'cheikh', 'sheikh', 'oustaz', 'ustaz',
+    'imam', 'mame', 'sokhna', 'adja', 'el hadj', 'elhadj', 'hadj', 'hajj',
+])
+
+ORGANIZATIONS = frozenset([
+    'tfm', 'rts', '2stv', 'sen tv', 'sentv', 'walf', 'gfm', 'iradio',
+    'sonatel', 'orange', 'free', 'expresso', 'auchan', 'eiffage',
+    'mouride', 'mouridiyya', 'tidiane', 'tidjane', 'layène', 'layene',
+    'ucad', 'ugb', 'uasz', 'ept', 'esp', 'iam', 'bhs', 'cbao', 'sgbs',
 ])
 
+TV_SHOWS = frozenset([
+    'pod et marichou', 'maîtresse', 'maitresse', 'wiri wiri', 'adja',
+    'mbettel', 'nafi', 'mœurs', 'moeurs', 'golden', 'dikoon', 'buur',
+])
+
+WOLOF_NAMES = WOLOF_FIRST_NAMES | WOLOF_SURNAMES | AMBIGUOUS_SURNAMES | frozenset(['serigne', 'seriñ'])
+
 POS_CATEGORIES = {
     'VERB': COMMON_VERBS,
     'NOUN': COMMON_NOUNS,
@@ -0,0 +1,183 @@
+"""Gazetteer - Compact multi-label name lists with binary-search lookup"""
+
+import json
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class Gazetteer:
+    """Immutable name -> categories map stored as one sorted UTF-8 blob.
+
+    Names are lowercased and kept byte-sorted in a single ``bytes`` object
+    with an ``array`` of offsets and one category bitmask per name, so a
+    million entries cost a few tens of megabytes instead of a Python set of
+    strings. Lookups are binary searches. ``categories`` are in priority
+    order: ``best`` returns the earliest category a name belongs to.
+    """
+
+    def __init__(self, categories: Sequence[str], blob: bytes = b'',
+                 offsets: Optional[array] = None, masks: Optional[array] = None):
+        if len(categories) > 32:
+            raise ValueError("At most 32 categories are supported")
+        self.categories = list(categories)
+        self._bits = {c: 1 << i for i, c in enumerate(self.categories)}
+        self.blob = blob
+        self.offsets = offsets if offsets is not None else array('I', [0])
+        self.masks = masks if masks is not None else array('I')
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str]], categories: Optional[Sequence[str]] = None) -> 'Gazetteer':
+        """Build from (name, category) pairs. Unlisted categories are appended in first-seen order."""
+        categories = list(categories or [])
+        bits = {c: 1 << i for i, c in enumerate(categories)}
+        merged: Dict[bytes, int] = {}
+        for name, category in entries:
+            if category not in bits:
+                bits[category] = 1 << len(categories)
+                categories.append(category)
+            key = name.strip().lower().encode('utf-8')
+            if key:
+                merged[key] = merged.get(key, 0) | bits[category]
+        keys = sorted(merged)
+        offsets = array('I', [0])
+        total = 0
+        for key in keys:
+            total += len(key)
+            offsets.append(total)
+        masks = array('I', (merged[k] for k in keys))
+        return cls(categories, b''.join(keys), offsets, masks)
+
+    @classmethod
+    def from_sets(cls, sets: Dict[str, Iterable[str]]) -> 'Gazetteer':
+        """Build from ``{category: names}``; dict order gives the priority."""
+        return cls.build(((name, category) for category, names in sets.items() for name in names), list(sets))
+
+    @classmethod
+    def from_tsv(cls, path: str, category: Optional[str] = None,
+                 categories: Optional[Sequence[str]] = None) -> 'Gazetteer':
+        """Load ``name<TAB>category`` lines, or bare names all tagged ``category``."""
+        return cls.build(_read_tsv(path, category), categories)
+
+    @classmethod
+    def from_jsonl(cls, path: str, name_key: str = 'name', category_key: str = 'category',
+                   categories: Optional[Sequence[str]] = None) -> 'Gazetteer':
+        return cls.build(_read_jsonl(path, name_key, category_key), categories)
+
+    def merge(self, other: 'Gazetteer') -> 'Gazetteer':
+        """New gazetteer with the entries of both; this one's categories keep priority."""
+        pairs = [(name, c) for g in (self, other) for name, cats in g.items() for c in cats]
+        return Gazetteer.build(pairs, self.categories)
+
+    def _find(self, key: bytes) -> int:
+        blob, offsets = self.blob, self.offsets
+        lo, hi = 0, len(self.masks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[offsets[mid]:offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.masks) and blob[offsets[lo]:offsets[lo + 1]] == key:
+            return lo
+        return -1
+
+    def mask(self, name: str) -> int:
+        """Category bitmask for ``name`` (0 when absent)."""
+        i = self._find(name.lower().encode('utf-8'))
+        return self.masks[i] if i >= 0 else 0
+
+    def category_mask(self, categories: Iterable[str]) -> int:
+        mask = 0
+        for c in categories:
+            mask |= self._bits.get(c, 0)
+        return mask
+
+    def lookup(self, name: str) -> List[str]:
+        """All categories of ``name`` in priority order."""
+        mask = self.mask(name)
+        return [c for c, bit in self._bits.items() if mask & bit]
+
+    def best(self, name: str) -> Optional[str]:
+        mask = self.mask(name)
+        if not mask:
+            return None
+        return self.categories[(mask & -mask).bit_length() - 1]
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name.lower().encode('utf-8')) >= 0
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self.blob, self.offsets
+        for i in range(len(self.masks)):
+            yield blob[offsets[i]:offsets[i + 1]].decode('utf-8')
+
+    def items(self) -> Iterator[Tuple[str, List[str]]]:
+        for i, name in enumerate(self):
+            mask = self.masks[i]
+            yield name, [c for c, bit in self._bits.items() if mask & bit]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the name blob, offsets and category masks."""
+        return (len(self.blob) + self.offsets.itemsize * len(self.offsets)
+                + self.masks.itemsize * len(self.masks))
+
+    def __repr__(self):
+        return f"Gazetteer(size={len(self)}, categories={self.categories}, nbytes={self.nbytes})"
+
+
+def _read_tsv(path: str, category: Optional[str]) -> Iterator[Tuple[str, str]]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            name, _, cat = line.partition('\t')
+            cat = cat.strip() or category
+            if cat is None:
+                raise ValueError(f"No category for {name!r} in {path}")
+            yield name, cat
+
+
+def _read_jsonl(path: str, name_key: str, category_key: str) -> Iterator[Tuple[str, str]]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                yield row[name_key], row[category_key]
+
+
+_DEFAULT_GAZETTEER: Optional[Gazetteer] = None
+
+
+def default_gazetteer() -> Gazetteer:
+    """Shared gazetteer over the built-in name lists, used by the tokenizer and NER."""
+    global _DEFAULT_GAZETTEER
+    if _DEFAULT_GAZETTEER is None:
+        from .constants import (SENEGAL_PLACES, FOREIGN_PLACES, WOLOF_FIRST_NAMES, WOLOF_SURNAMES,
+                                AMBIGUOUS_SURNAMES, RELIGIOUS_TITLES, ORGANIZATIONS, TV_SHOWS)
+        # Dict order is the priority NER applies to names listed under several categories.
+        # Towns named after families (Mbacké) are read as surnames, as NER always did.
+        _DEFAULT_GAZETTEER = Gazetteer.from_sets({
+            'place': SENEGAL_PLACES - WOLOF_SURNAMES,
+            'foreign_place': FOREIGN_PLACES,
+            'first_name': WOLOF_FIRST_NAMES,
+            'surname': WOLOF_SURNAMES,
+            'title': RELIGIOUS_TITLES,
+            'organization': ORGANIZATIONS,
+            'tv_show': TV_SHOWS,
+            'ambiguous_surname': AMBIGUOUS_SURNAMES,
+        })
+    return _DEFAULT_GAZETTEER
+
+
+def set_default_gazetteer(gazetteer: Optional[Gazetteer]):
+    """Replace the shared gazetteer, e.g. with national lists loaded via ``from_tsv`` (``None`` restores the built-in one).
+
+    Tokenizers and taggers created afterwards pick it up.
+    """
+    global _DEFAULT_GAZETTEER
+    _DEFAULT_GAZETTEER = gazetteer
@@ -0,0 +1,51 @@
+"""Batch helpers - Chunking and order-preserving process pools for the *_many APIs"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def resolve_jobs(n_jobs: Optional[int]) -> int:
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def parallel_map(func: Callable, chunks: Iterable, n_jobs: Optional[int] = 1,
+                 initializer: Optional[Callable] = None, initargs: Tuple = ()) -> Iterator[Any]:
+    """Apply ``func`` to every chunk, yielding results in input order.
+
+    With ``n_jobs == 1`` everything runs in-process. Otherwise at most
+    ``2 * n_jobs`` chunks are in flight, so arbitrarily long inputs are
+    streamed rather than submitted up front. ``func`` and ``initializer``
+    must be module-level so they can be pickled. ``n_jobs=-1`` uses all CPUs.
+    """
+    workers = resolve_jobs(n_jobs)
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -1,4 +1,5 @@
 import re
+from array import array
 from dataclasses import dataclass
 from typing import List, Optional, Set, Tuple
 from enum import Enum, auto
@@ -21,9 +22,9 @@ from .constants import (
     TAM_MARKERS,
     VOWELS,
     CONSONANTS,
-    SENEGAL_PLACES,
-    WOLOF_NAMES,
 )
+from .gazetteer import Gazetteer, default_gazetteer
+from .vocab import Vocabulary
 
 class TokenType(Enum):
     WORD = auto()
@@ -131,6 +132,32 @@ NORMALIZE_WORDS = {
     'lane': 'lan',  # question word variant
 }
 
+# One emoji: a keycap, a flag (pair of regional indicators), or a pictograph with
+# optional variation selector, skin tone and tag modifiers, ZWJ-joined to further ones
+_EMOJI_BASE = '\u2300-\u23ff\u2600-\u27bf\u2b00-\u2bff\u3030\u303d\u3297\u3299\U0001f000-\U0001faff'
+_EMOJI_MODIFIERS = '\ufe0f\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f'
+EMOJI_CLUSTER = (
+    '(?:[0-9#*]\ufe0f?\u20e3'
+    '|[\U0001f1e6-\U0001f1ff]{2}'
+    f'|[{_EMOJI_BASE}][{_EMOJI_MODIFIERS}]*(?:\u200d[{_EMOJI_BASE}][{_EMOJI_MODIFIERS}]*)*)'
+)
+EMOJI_PATTERN = re.compile(EMOJI_CLUSTER)
+
+TOKEN_PATTERN = re.compile(r"""
+            (?:https?://\S+|www\.\S+)                                                    |
+            \S+@\S+\.\S+                                                                  |
+            \
+            @\w+                                                                          |
+""" + '(?:' + EMOJI_CLUSTER + ')+|' + r"""
+            \d+(?:[.,:/]\d+)*                                                             |
+            \.{2,}|[!?]{2,}                                                              |
+            [a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+(?:[-'][a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+)* |
+            [.,;:!?()\[\]{}«»""\'"`'"-–—]                                                |
+            \s+                                                                          |
+            \S
+""", re.VERBOSE)
+
+
 class WolofTokenizer:
     PUNCTUATION_CHARS = r""".,;:!?()[]{}«»"'"'`-–—…·•"""
     
@@ -147,8 +174,12 @@ class WolofTokenizer:
     
     NUMERALS = {'benn', 'ñaar', 'ñett', 'ñeent', 'juróom', 'juroom', 'fukk', 'téeméer', 'teemeer', 'junni', 'junne'}
 
+    # Gazetteer categories whose names count as Wolof for language detection
+    WOLOF_NAME_CATEGORIES = ('place', 'first_name', 'surname', 'title', 'ambiguous_surname')
+    
     def __init__(self, normalize: bool = True, keep_whitespace: bool = False, 
-                 detect_language: bool = True, segment_attached: bool = True):
+                 detect_language: bool = True, segment_attached: bool = True,
+                 gazetteer: Optional[Gazetteer] = None):
         self.normalize = normalize
         self.keep_whitespace = keep_whitespace
         self.detect_language_flag = detect_language
@@ -156,6 +187,8 @@ class WolofTokenizer:
         self.normalizer = WolofNormalizer() if normalize else None
         self.wolof_verb_stems = self._build_verb_stem_set()
         self.sorted_negation = sorted(NEGATION_SUFFIXES.items(), key=lambda x: len(x[0]), reverse=True)
+        self.gazetteer = gazetteer if gazetteer is not None else default_gazetteer()
+        self._wolof_name_mask = self.gazetteer.category_mask(self.WOLOF_NAME_CATEGORIES)
 
     def _build_verb_stem_set(self) -> Set[str]:
         stems = set(COMMON_VERBS)
@@ -165,32 +198,22 @@ class WolofTokenizer:
                 stems.add(verb[:-2])
         return stems
 
-    def tokenize(self, text: str) -> List[Token]:
-        if not text:
-            return []
-
+    def normalize_text(self, text: str) -> str:
+        """The text ``tokenize`` works on; token offsets index into it."""
         try:
-            clean_text = self.normalizer.normalize(text) if self.normalize else text
+            return self.normalizer.normalize(text) if self.normalize else text
         except Exception:
-            clean_text = text
+            return text
 
-        token_pattern = r"""
-            (?:https?://\S+|www\.\S+)                                                    |
-            \S+@\S+\.\S+                                                                  |
-            \
-            @\w+                                                                          |
-            (?:[\U0001F300-\U0001F9FF]|[\U0001FA00-\U0001FAFF]|[\U00002600-\U000027BF]|
-               [\U0001F600-\U0001F64F]|[\U0001F680-\U0001F6FF]|[\U0001F1E0-\U0001F1FF])+ |
-            \d+(?:[.,:/]\d+)*                                                             |
-            \.{2,}|[!?]{2,}                                                              |
-            [a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+(?:[-'][a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+)* |
-            [.,;:!?()\[\]{}«»""\'"`'"-–—]                                                |
-            \s+                                                                          |
-            \S
-        """
+    def tokenize(self, text: str) -> List[Token]:
+        if not text:
+            return []
+        return self.tokenize_normalized(self.normalize_text(text))
 
+    def tokenize_normalized(self, clean_text: str) -> List[Token]:
+        """Tokenize text already passed through ``normalize_text``."""
         raw_tokens = []
-        for match in re.finditer(token_pattern, clean_text, re.VERBOSE):
+        for match in TOKEN_PATTERN.finditer(clean_text):
             val = match.group()
             start, end = match.start(), match.end()
 
@@ -215,32 +238,17 @@ class WolofTokenizer:
     def tokenize_to_strings(self, text: str) -> List[str]:
         return [t.text for t in self.tokenize(text) if t.type == TokenType.WORD]
 
+    def tokenize_to_ids(self, text: str, vocab: Vocabulary, add: bool = True) -> array:
+        """Lowercased words of ``text`` as an ``array('i')`` of ids in ``vocab`` (see ``Vocabulary.encode``)."""
+        return vocab.encode((t.text.lower() for t in self.tokenize(text) if t.type == TokenType.WORD), add)
+
     def morphemes(self, text: str) -> List[str]:
         if not text:
             return []
         
-        try:
-            clean_text = self.normalizer.normalize(text) if self.normalize else text
-        except Exception:
-            clean_text = text
-
-        token_pattern = r"""
-            (?:https?://\S+|www\.\S+)                                                    |
-            \S+@\S+\.\S+                                                                  |
-            \
-            @\w+                                                                          |
-            (?:[\U0001F300-\U0001F9FF]|[\U0001FA00-\U0001FAFF]|[\U00002600-\U000027BF]|
-               [\U0001F600-\U0001F64F]|[\U0001F680-\U0001F6FF]|[\U0001F1E0-\U0001F1FF])+ |
-            \d+(?:[.,:/]\d+)*                                                             |
-            \.{2,}|[!?]{2,}                                                              |
-            [a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+(?:[-'][a-zA-ZàáâãäåèéêëìíîïòóôõöùúûüýÿçœæŋñÑëËŋŊ]+)* |
-            [.,;:!?()\[\]{}«»""\'"`'"-–—]                                                |
-            \s+                                                                          |
-            \S
-        """
-
+        clean_text = self.normalize_text(text)
         result = []
-        for match in re.finditer(token_pattern, clean_text, re.VERBOSE):
+        for match in TOKEN_PATTERN.finditer(clean_text):
             val = match.group()
             if val.isspace():
                 continue
@@ -305,7 +313,7 @@ class WolofTokenizer:
             return TokenType.HASHTAG
         if text.startswith('@'):
             return TokenType.MENTION
-        if re.match(r'[\U0001F300-\U0001FAFF]', text):
+        if EMOJI_PATTERN.match(text):
             return TokenType.EMOJI
         if text[0].isdigit():
             return TokenType.NUMBER
@@ -479,7 +487,7 @@ class WolofTokenizer:
                 token.language = Language.ENGLISH
             elif word in COMMON_WORDS or word in ALL_DETERMINERS or word in TAM_MARKERS:
                 token.language = Language.WOLOF
-            elif word in SENEGAL_PLACES or word in WOLOF_NAMES:
+            elif self.gazetteer.mask(word) & self._wolof_name_mask:
                 token.language = Language.WOLOF
             else:
                 wolof_score, french_score = self._compute_language_scores(word)
@@ -0,0 +1,54 @@
+"""Interned Vocabulary - Compact integer ids for repeated strings"""
+
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List
+
+
+class Vocabulary:
+    """Bidirectional item <-> id map. Ids are dense and assigned in insertion order."""
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        self._ids: Dict[Hashable, int] = {}
+        self._items: List[Hashable] = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Hashable) -> int:
+        idx = self._ids.get(item)
+        if idx is None:
+            idx = len(self._items)
+            self._ids[item] = idx
+            self._items.append(item)
+        return idx
+
+    def get(self, item: Hashable, default: int = -1) -> int:
+        return self._ids.get(item, default)
+
+    def encode(self, items: Iterable[Hashable], add: bool = True) -> array:
+        """Map items to an ``array('i')`` of ids. Unknown items become -1 when ``add`` is False."""
+        if add:
+            return array('i', map(self.add, items))
+        get = self._ids.get
+        return array('i', (get(item, -1) for item in items))
+
+    def decode(self, ids: Iterable[int]) -> List[Hashable]:
+        items = self._items
+        return [items[i] if i >= 0 else None for i in ids]
+
+    def to_list(self) -> List[Hashable]:
+        return list(self._items)
+
+    def __getitem__(self, idx: int) -> Hashable:
+        return self._items[idx]
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._ids
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self):
+        return f"Vocabulary(size={len(self._items)})"
@@ -1,11 +1,18 @@
 from .utils import Lexicon, is_wolof_word, detect_noun_class, detect_tam, word_frequency
-from .dictionary import Dictionary, DictionaryEntry, lookup, translate
-from .collocations import Collocations, VERB_OBJECT_COLLOCATIONS, GREETING_EXPRESSIONS
-from .proverbs import ProverbCollection, Proverb, get_proverbs, search_proverbs
+from .dictionary import Dictionary, DictionaryEntry, DictionaryIndex, lookup, translate, get_default_dictionary, set_default_dictionary
+from .backends import DictionaryBackend, MemoryBackend, SQLiteBackend, CachedBackend
+from .collocations import Collocations, VERB_OBJECT_COLLOCATIONS, GREETING_EXPRESSIONS, EXPRESSIONS, CollocationMiner
+from .fuzzy import FuzzyIndex, fold, edit_distance
+from .frequency import FrequencyCounter, CountMinSketch, count_frequencies, load_counter
+from .proverbs import ProverbCollection, Proverb, ProverbIndex, get_proverbs, search_proverbs, retrieve_proverbs
 
 __all__ = [
     'Lexicon', 'is_wolof_word', 'detect_noun_class', 'detect_tam', 'word_frequency',
-    'Dictionary', 'DictionaryEntry', 'lookup', 'translate',
-    'Collocations', 'VERB_OBJECT_COLLOCATIONS', 'GREETING_EXPRESSIONS',
-    'ProverbCollection', 'Proverb', 'get_proverbs', 'search_proverbs',
+    'Dictionary', 'DictionaryEntry', 'DictionaryIndex', 'lookup', 'translate',
+    'get_default_dictionary', 'set_default_dictionary',
+    'DictionaryBackend', 'MemoryBackend', 'SQLiteBackend', 'CachedBackend',
+    'Collocations', 'VERB_OBJECT_COLLOCATIONS', 'GREETING_EXPRESSIONS', 'EXPRESSIONS', 'CollocationMiner',
+    'FuzzyIndex', 'fold', 'edit_distance',
+    'FrequencyCounter', 'CountMinSketch', 'count_frequencies', 'load_counter',
+    'ProverbCollection', 'Proverb', 'ProverbIndex', 'get_proverbs', 'search_proverbs', 'retrieve_proverbs',
 ]
\ No newline at end of file
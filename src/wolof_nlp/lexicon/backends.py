@@ -0,0 +1,319 @@
+"""Dictionary Backends - Pluggable storage for large lexicons"""
+
+import sqlite3
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..core.cache import LRUCache
+from .dictionary import DictionaryEntry, DictionaryIndex, SEARCH_FIELDS, WORD_PATTERN, _search_fields
+
+_MISSING = object()
+
+
+class DictionaryBackend(Mapping):
+    """Read access to entries keyed by lowercase Wolof headword.
+
+    Subclasses implement ``__getitem__``, ``__iter__``, ``__len__`` and ``add``.
+    Batched lookup and search fall back to generic implementations; the
+    search ones build an in-memory ``DictionaryIndex`` on first use.
+    ``in_memory`` tells callers whether walking every entry is cheap.
+    """
+
+    _index: Optional[DictionaryIndex] = None
+    in_memory = False
+
+    def add(self, entry: DictionaryEntry):
+        raise NotImplementedError
+
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, DictionaryEntry]:
+        """Entries for the given headwords; missing words are left out."""
+        found = {}
+        for word in words:
+            entry = self.get(word)
+            if entry is not None:
+                found[word] = entry
+        return found
+
+    @property
+    def index(self) -> DictionaryIndex:
+        if self._index is None:
+            self._index = DictionaryIndex(self.values())
+        return self._index
+
+    def search(self, query: str, field: str = 'all') -> List[DictionaryEntry]:
+        return self.index.search(query, field)
+
+    def prefix_search(self, prefix: str, field: str = 'all') -> List[DictionaryEntry]:
+        return self.index.prefix_search(prefix, field)
+
+    def by_pos(self, pos: str) -> List[DictionaryEntry]:
+        return self.index.by_pos(pos)
+
+    def by_noun_class(self, noun_class: Optional[str]) -> List[DictionaryEntry]:
+        return self.index.by_noun_class(noun_class)
+
+
+class MemoryBackend(DictionaryBackend):
+    """Entries held in a plain dict; ``Dictionary()`` gives it a copy of the built-in ``DICTIONARY``."""
+
+    in_memory = True
+
+    def __init__(self, entries: Optional[Dict[str, DictionaryEntry]] = None):
+        self.entries = entries if entries is not None else {}
+        self._index = None
+
+    def __getitem__(self, word: str) -> DictionaryEntry:
+        return self.entries[word]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, DictionaryEntry]:
+        entries = self.entries
+        return {w: entries[w] for w in words if w in entries}
+
+    def add(self, entry: DictionaryEntry):
+        self.entries[entry.wolof] = entry
+        if self._index is not None:
+            self._index.add(entry)
+
+
+class SQLiteBackend(DictionaryBackend):
+    """Entries stored in a SQLite database with indexed headword, POS, class and word-token columns.
+
+    ``lookup_many`` issues one ``IN (...)`` query per ``batch_size`` words.
+    Search runs in SQL, so nothing beyond the connection is held in memory.
+    Substring search uses an FTS5 trigram table; queries shorter than three
+    characters, or SQLite builds without the trigram tokenizer, fall back
+    to scanning the entries table.
+    """
+
+    COLUMNS = ('wolof', 'french', 'english', 'pos', 'noun_class', 'example')
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            id INTEGER PRIMARY KEY,
+            wolof TEXT NOT NULL UNIQUE,
+            french TEXT NOT NULL,
+            english TEXT NOT NULL,
+            pos TEXT NOT NULL,
+            noun_class TEXT,
+            example TEXT,
+            french_lower TEXT NOT NULL,
+            english_lower TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_pos ON entries (pos);
+        CREATE INDEX IF NOT EXISTS entries_noun_class ON entries (noun_class);
+        CREATE TABLE IF NOT EXISTS tokens (
+            token TEXT NOT NULL,
+            field TEXT NOT NULL,
+            entry_id INTEGER NOT NULL REFERENCES entries (id)
+        );
+        CREATE INDEX IF NOT EXISTS tokens_token ON tokens (token, field);
+    """
+
+    # Lowercased search fields keyed by entries.id; both sides are lowercased, so matching is case-sensitive
+    FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE fts USING fts5(
+            wolof, french, english, content='', tokenize='trigram case_sensitive 1'
+        )
+    """
+
+    def __init__(self, path: str = ':memory:', batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(self.SCHEMA)
+        self.has_fts = self._create_fts()
+
+    def _create_fts(self) -> bool:
+        if self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'fts'").fetchone():
+            return True
+        try:
+            with self.conn:
+                self.conn.execute(self.FTS_SCHEMA)
+                # Databases written before the table existed
+                self.conn.execute("INSERT INTO fts (rowid, wolof, french, english) "
+                                  "SELECT id, wolof, french_lower, english_lower FROM entries")
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[DictionaryEntry], path: str = ':memory:') -> 'SQLiteBackend':
+        backend = cls(path)
+        backend.add_many(entries)
+        return backend
+
+    def _row_to_entry(self, row) -> DictionaryEntry:
+        return DictionaryEntry(*row)
+
+    def _select(self, where: str = '', params: Iterable = ()) -> List[DictionaryEntry]:
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM entries {where} ORDER BY id"
+        return [self._row_to_entry(row) for row in self.conn.execute(sql, tuple(params))]
+
+    def __getitem__(self, word: str) -> DictionaryEntry:
+        rows = self._select('WHERE wolof = ?', (word,))
+        if not rows:
+            raise KeyError(word)
+        return rows[0]
+
+    def __iter__(self) -> Iterator[str]:
+        for (wolof,) in self.conn.execute("SELECT wolof FROM entries ORDER BY id"):
+            yield wolof
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def values(self) -> Iterator[DictionaryEntry]:
+        sql = f"SELECT {', '.join(self.COLUMNS)} FROM entries ORDER BY id"
+        for row in self.conn.execute(sql):
+            yield self._row_to_entry(row)
+
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, DictionaryEntry]:
+        unique = list(dict.fromkeys(words))
+        found = {}
+        for i in range(0, len(unique), self.batch_size):
+            batch = unique[i:i + self.batch_size]
+            placeholders = ', '.join('?' * len(batch))
+            for entry in self._select(f'WHERE wolof IN ({placeholders})', batch):
+                found[entry.wolof] = entry
+        return found
+
+    def add(self, entry: DictionaryEntry):
+        self.add_many([entry])
+
+    def add_many(self, entries: Iterable[DictionaryEntry]):
+        with self.conn:
+            for entry in entries:
+                cursor = self.conn.execute(
+                    "INSERT INTO entries (wolof, french, english, pos, noun_class, example, french_lower, english_lower) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (entry.wolof, entry.french, entry.english, entry.pos, entry.noun_class, entry.example,
+                     entry.french.lower(), entry.english.lower()),
+                )
+                entry_id = cursor.lastrowid
+                if self.has_fts:
+                    self.conn.execute("INSERT INTO fts (rowid, wolof, french, english) VALUES (?, ?, ?, ?)",
+                                      (entry_id, entry.wolof, entry.french.lower(), entry.english.lower()))
+                rows = []
+                for field in SEARCH_FIELDS:
+                    value = getattr(entry, field)
+                    text = value if field == 'wolof' else value.lower()
+                    rows.extend((token, field, entry_id) for token in set(WORD_PATTERN.findall(text)))
+                self.conn.executemany("INSERT INTO tokens (token, field, entry_id) VALUES (?, ?, ?)", rows)
+                if self._index is not None:
+                    self._index.add(entry)
+
+    def search(self, query: str, field: str = 'all') -> List[DictionaryEntry]:
+        fields = _search_fields(field)
+        if not fields:
+            return []
+        query = query.lower()
+        if self.has_fts and len(query) >= 3:
+            # A quoted phrase of trigrams matches exactly the entries containing the query
+            match = '{%s} : "%s"' % (' '.join(fields), query.replace('"', '""'))
+            return self._select("WHERE id IN (SELECT rowid FROM fts WHERE fts MATCH ?)", (match,))
+        columns = {'wolof': 'wolof', 'french': 'french_lower', 'english': 'english_lower'}
+        where = ' OR '.join(f"instr({columns[f]}, ?) > 0" for f in fields)
+        return self._select(f'WHERE {where}', [query] * len(fields))
+
+    def prefix_search(self, prefix: str, field: str = 'all') -> List[DictionaryEntry]:
+        fields = _search_fields(field)
+        if not fields:
+            return []
+        prefix = prefix.lower()
+        placeholders = ', '.join('?' * len(fields))
+        return self._select(
+            f"WHERE id IN (SELECT entry_id FROM tokens WHERE token >= ? AND token < ? AND field IN ({placeholders}))",
+            [prefix, prefix + '\U0010ffff', *fields],
+        )
+
+    def by_pos(self, pos: str) -> List[DictionaryEntry]:
+        return self._select('WHERE pos = ?', (pos,))
+
+    def by_noun_class(self, noun_class: Optional[str]) -> List[DictionaryEntry]:
+        if noun_class is None:
+            return self._select('WHERE noun_class IS NULL')
+        return self._select('WHERE noun_class = ?', (noun_class,))
+
+    def close(self):
+        self.conn.close()
+
+
+class CachedBackend(DictionaryBackend):
+    """Bounded LRU cache in front of another backend. Misses are cached too."""
+
+    def __init__(self, backend: DictionaryBackend, maxsize: int = 10000):
+        self.backend = backend
+        self.cache = LRUCache(maxsize)
+
+    def __getitem__(self, word: str) -> DictionaryEntry:
+        entry = self.get(word)
+        if entry is None:
+            raise KeyError(word)
+        return entry
+
+    def get(self, word: str, default=None) -> Optional[DictionaryEntry]:
+        entry = self.cache.get(word, _MISSING)
+        if entry is _MISSING:
+            entry = self.backend.get(word)
+            self.cache.put(word, entry)
+        return entry if entry is not None else default
+
+    def __contains__(self, word) -> bool:
+        return self.get(word) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.backend)
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def values(self):
+        return self.backend.values()
+
+    @property
+    def index(self) -> DictionaryIndex:
+        return self.backend.index
+
+    @property
+    def in_memory(self) -> bool:
+        return self.backend.in_memory
+
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, DictionaryEntry]:
+        found = {}
+        misses = []
+        for word in dict.fromkeys(words):
+            entry = self.cache.get(word, _MISSING)
+            if entry is _MISSING:
+                misses.append(word)
+            elif entry is not None:
+                found[word] = entry
+        if misses:
+            fetched = self.backend.lookup_many(misses)
+            for word in misses:
+                entry = fetched.get(word)
+                self.cache.put(word, entry)
+                if entry is not None:
+                    found[word] = entry
+        return found
+
+    def add(self, entry: DictionaryEntry):
+        self.backend.add(entry)
+        self.cache.pop(entry.wolof)
+
+    def search(self, query: str, field: str = 'all') -> List[DictionaryEntry]:
+        return self.backend.search(query, field)
+
+    def prefix_search(self, prefix: str, field: str = 'all') -> List[DictionaryEntry]:
+        return self.backend.prefix_search(prefix, field)
+
+    def by_pos(self, pos: str) -> List[DictionaryEntry]:
+        return self.backend.by_pos(pos)
+
+    def by_noun_class(self, noun_class: Optional[str]) -> List[DictionaryEntry]:
+        return self.backend.by_noun_class(noun_class)
@@ -1,6 +1,13 @@
 """Wolof Collocations - Common expressions and word combinations"""
 
-from typing import List, Tuple
+import math
+from array import array
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..core.automaton import AhoCorasick
+from ..core.parallel import chunked, parallel_map
+from ..core.vocab import Vocabulary
 
 
 VERB_OBJECT_COLLOCATIONS = [
@@ -76,13 +83,28 @@ DISCOURSE_COLLOCATIONS = [
 ]
 
 
+def _pair_index(triples: List[Tuple[str, str, str]]) -> Dict[str, List[Tuple[str, str]]]:
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for head, dependent, gloss in triples:
+        index.setdefault(head, []).append((dependent, gloss))
+    return index
+
+
+EXPRESSIONS = GREETING_EXPRESSIONS + RELIGIOUS_EXPRESSIONS + SOCIAL_EXPRESSIONS
+
+_VERB_OBJECTS = _pair_index(VERB_OBJECT_COLLOCATIONS)
+_NOUN_MODIFIERS = _pair_index(NOUN_ADJECTIVE_COLLOCATIONS)
+_COLLOCATION_PAIRS: Set[Tuple[str, str]] = {(a, b) for a, b, _ in VERB_OBJECT_COLLOCATIONS + DISCOURSE_COLLOCATIONS}
+_EXPRESSION_MATCHER = AhoCorasick((expr[0], i) for i, expr in enumerate(EXPRESSIONS))
+
+
 class Collocations:
     
     def get_verb_objects(self, verb: str) -> List[Tuple[str, str]]:
-        return [(obj, gloss) for v, obj, gloss in VERB_OBJECT_COLLOCATIONS if v == verb.lower()]
+        return list(_VERB_OBJECTS.get(verb.lower(), ()))
     
     def get_noun_modifiers(self, noun: str) -> List[Tuple[str, str]]:
-        return [(mod, gloss) for n, mod, gloss in NOUN_ADJECTIVE_COLLOCATIONS if n == noun.lower()]
+        return list(_NOUN_MODIFIERS.get(noun.lower(), ()))
     
     def get_greetings(self) -> List[Tuple[str, str, str]]:
         return GREETING_EXPRESSIONS
@@ -94,24 +116,186 @@ class Collocations:
         return SOCIAL_EXPRESSIONS
     
     def is_collocation(self, word1: str, word2: str) -> bool:
-        w1, w2 = word1.lower(), word2.lower()
-        for v, obj, _ in VERB_OBJECT_COLLOCATIONS:
-            if v == w1 and obj == w2:
-                return True
-        for d1, d2, _ in DISCOURSE_COLLOCATIONS:
-            if d1 == w1 and d2 == w2:
-                return True
-        return False
+        return (word1.lower(), word2.lower()) in _COLLOCATION_PAIRS
     
-    def find_expression(self, text: str) -> List[Tuple[str, str, str]]:
+    def find_expression_spans(self, text: str, overlapping: bool = False) -> List[Tuple[int, int, Tuple[str, str, str]]]:
+        """(start, end, expression) for whole-word matches in ``text``.
+        
+        By default overlapping matches are resolved leftmost-longest.
+        """
         text_lower = text.lower()
-        results = []
+        matches = _EXPRESSION_MATCHER.find_all(text_lower) if overlapping else _EXPRESSION_MATCHER.find(text_lower)
+        return [(start, end, EXPRESSIONS[i]) for start, end, i in matches]
+    
+    def find_expression(self, text: str) -> List[Tuple[str, str, str]]:
+        found = {i for _, _, i in _EXPRESSION_MATCHER.iter_matches(text.lower())}
+        return [EXPRESSIONS[i] for i in sorted(found)]
+
+
+SCORE_MEASURES = ('pmi', 't_score', 'llr')
+
+
+def _llr(n_ii: float, n_ix: float, n_xi: float, n_xx: float) -> float:
+    """Dunning's log-likelihood ratio (G2) of a 2x2 contingency table."""
+    observed = (n_ii, n_ix - n_ii, n_xi - n_ii, n_xx - n_ix - n_xi + n_ii)
+    expected = (n_ix * n_xi / n_xx, n_ix * (n_xx - n_xi) / n_xx,
+                (n_xx - n_ix) * n_xi / n_xx, (n_xx - n_ix) * (n_xx - n_xi) / n_xx)
+    return 2 * sum(o * math.log(o / e) for o, e in zip(observed, expected) if o > 0 and e > 0)
+
+
+class CollocationMiner:
+    """Windowed co-occurrence counts over a token stream, scored as collocations.
+    
+    Each token is paired with the ``window`` tokens that follow it. Pair counts
+    live in a dict keyed by packed word ids; once it exceeds ``max_pairs`` the
+    rarest pairs are pruned (``prune_floor`` records the highest count dropped),
+    so memory stays bounded.
+    Miners fed on different shards combine with ``merge``.
+    """
+    
+    def __init__(self, window: int = 1, min_count: int = 2, max_pairs: int = 2_000_000,
+                 lemmatize: bool = False):
+        self.window = window
+        self.min_count = min_count
+        self.max_pairs = max_pairs
+        self.lemmatize = lemmatize
+        self.vocab = Vocabulary()
+        self.unigrams = array('q')
+        self.pairs: Dict[int, int] = {}
+        self.n_tokens = 0
+        self.prune_floor = 0
+        self._tokenizer = None
+        self._lemmatizer = None
+    
+    def _tokens(self, sentence: Union[str, List[str]]) -> List[str]:
+        if isinstance(sentence, str):
+            if self._tokenizer is None:
+                from ..core.tokenizer import WolofTokenizer
+                self._tokenizer = WolofTokenizer(detect_language=False)
+            sentence = self._tokenizer.tokenize_to_strings(sentence)
+        tokens = [t.lower() for t in sentence]
+        if self.lemmatize and tokens:
+            if self._lemmatizer is None:
+                from ..morphology.lemmatizer import Lemmatizer
+                self._lemmatizer = Lemmatizer()
+            lemmas = self._lemmatizer.lemmatize_tokens(tokens)
+            tokens = [lemmas.lemma(i) for i in range(len(lemmas))]
+        return tokens
+    
+    def add_sentence(self, sentence: Union[str, List[str]]):
+        """Count one sentence, given as raw text or a token list."""
+        add = self.vocab.add
+        unigrams = self.unigrams
+        ids = [add(t) for t in self._tokens(sentence)]
+        while len(unigrams) < len(self.vocab):
+            unigrams.append(0)
+        pairs = self.pairs
+        window = self.window
+        for i, a in enumerate(ids):
+            unigrams[a] += 1
+            for b in ids[i + 1:i + 1 + window]:
+                key = (a << 32) | b
+                pairs[key] = pairs.get(key, 0) + 1
+        self.n_tokens += len(ids)
+        if len(pairs) > self.max_pairs:
+            self.prune()
+    
+    def feed(self, sentences: Iterable[Union[str, List[str]]], n_jobs: int = 1,
+             chunk_size: int = 10000) -> 'CollocationMiner':
+        """Count a stream of sentences; with ``n_jobs != 1`` shards are counted in worker processes and merged."""
+        if n_jobs == 1:
+            for sentence in sentences:
+                self.add_sentence(sentence)
+            return self
+        worker = partial(_mine_chunk, window=self.window, min_count=self.min_count,
+                         max_pairs=self.max_pairs, lemmatize=self.lemmatize)
+        for shard in parallel_map(worker, chunked(sentences, chunk_size), n_jobs=n_jobs):
+            self.merge(shard)
+        return self
+    
+    def prune(self):
+        """Drop the rarest pairs until at most half of ``max_pairs`` remain."""
+        pairs = self.pairs
+        floor = 0
+        while len(pairs) > self.max_pairs // 2:
+            floor += 1
+            pairs = {k: c for k, c in pairs.items() if c > floor}
+        self.pairs = pairs
+        self.prune_floor = max(self.prune_floor, floor)
+    
+    def merge(self, other: 'CollocationMiner') -> 'CollocationMiner':
+        if other.window != self.window:
+            raise ValueError("Cannot merge miners with different windows")
+        remap = array('q', (self.vocab.add(w) for w in other.vocab))
+        while len(self.unigrams) < len(self.vocab):
+            self.unigrams.append(0)
+        for i, count in enumerate(other.unigrams):
+            self.unigrams[remap[i]] += count
+        pairs = self.pairs
+        for key, count in other.pairs.items():
+            new_key = (remap[key >> 32] << 32) | remap[key & 0xFFFFFFFF]
+            pairs[new_key] = pairs.get(new_key, 0) + count
+        self.n_tokens += other.n_tokens
+        self.prune_floor = max(self.prune_floor, other.prune_floor)
+        if len(pairs) > self.max_pairs:
+            self.prune()
+        return self
+    
+    def count(self, word1: str, word2: str) -> int:
+        a, b = self.vocab.get(word1.lower()), self.vocab.get(word2.lower())
+        if a < 0 or b < 0:
+            return 0
+        return self.pairs.get((a << 32) | b, 0)
+    
+    def score(self, measure: str = 'llr') -> List[Tuple[str, str, float]]:
+        """(word1, word2, score) for pairs seen at least ``min_count`` times, best first.
         
-        for wolof, french, english in GREETING_EXPRESSIONS + RELIGIOUS_EXPRESSIONS + SOCIAL_EXPRESSIONS:
-            if wolof in text_lower:
-                results.append((wolof, french, english))
+        ``measure`` is ``'pmi'`` (log2), ``'t_score'`` or ``'llr'``.
+        """
+        if measure not in SCORE_MEASURES:
+            raise ValueError(f"Unknown measure: {measure}")
+        n_xx = float(self.n_tokens)
+        unigrams = self.unigrams
+        window = self.window
+        words = self.vocab
+        scored = []
+        for key, count in self.pairs.items():
+            if count < self.min_count:
+                continue
+            a, b = key >> 32, key & 0xFFFFFFFF
+            n_ix, n_xi = unigrams[a], unigrams[b]
+            n_ii = count / window
+            if measure == 'pmi':
+                value = math.log2(n_ii * n_xx / (n_ix * n_xi))
+            elif measure == 't_score':
+                value = (n_ii - n_ix * n_xi / n_xx) / math.sqrt(n_ii)
+            else:
+                value = _llr(n_ii, n_ix, n_xi, n_xx)
+            scored.append((words[a], words[b], value))
+        scored.sort(key=lambda t: t[2], reverse=True)
+        return scored
+    
+    def top(self, n: int = 20, measure: str = 'llr') -> List[Tuple[str, str, float]]:
+        return self.score(measure)[:n]
+    
+    def export(self, n: int = 20, measure: str = 'llr') -> List[Tuple[str, str, str]]:
+        """Top pairs as (word1, word2, gloss) tuples, the format of ``VERB_OBJECT_COLLOCATIONS``.
         
-        return results
+        The gloss joins the English translations of both words, or is empty
+        when either is missing from the dictionary.
+        """
+        from .dictionary import get_default_dictionary
+        dictionary = get_default_dictionary()
+        result = []
+        for w1, w2, _ in self.top(n, measure):
+            e1, e2 = dictionary.translate(w1), dictionary.translate(w2)
+            result.append((w1, w2, f"{e1} {e2}" if e1 and e2 else ''))
+        return result
+
+
+def _mine_chunk(sentences: List[Union[str, List[str]]], window: int, min_count: int,
+                max_pairs: int, lemmatize: bool) -> CollocationMiner:
+    return CollocationMiner(window, min_count, max_pairs, lemmatize).feed(sentences)
 
 
 def get_collocations() -> Collocations:
@@ -1,7 +1,12 @@
 """Wolof Dictionary - Core vocabulary with verified translations"""
 
+import re
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.constants import WORD_NORMALIZATIONS
+from .fuzzy import FuzzyIndex
 
 
 @dataclass
@@ -135,13 +140,165 @@ DICTIONARY = {
 }
 
 
+SEARCH_FIELDS = ('wolof', 'french', 'english')
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _search_fields(field: str) -> Tuple[str, ...]:
+    if field == 'all':
+        return SEARCH_FIELDS
+    return (field,) if field in SEARCH_FIELDS else ()
+
+
+class DictionaryIndex:
+    """Token, character-trigram, POS and noun-class indexes over dictionary entries.
+    
+    Entries are numbered in insertion order and every query returns them in
+    that order, so results match a linear scan of the same entries.
+    """
+    
+    def __init__(self, entries: Iterable[DictionaryEntry] = ()):
+        self.entries: List[DictionaryEntry] = []
+        self._text: Dict[str, List[str]] = {f: [] for f in SEARCH_FIELDS}
+        self._trigrams: Dict[str, Dict[str, Set[int]]] = {f: {} for f in SEARCH_FIELDS}
+        self._short: Dict[str, List[int]] = {f: [] for f in SEARCH_FIELDS}
+        self._tokens: Dict[str, Dict[str, List[int]]] = {f: {} for f in SEARCH_FIELDS}
+        self._sorted_tokens: Dict[str, Optional[List[str]]] = {f: None for f in SEARCH_FIELDS}
+        self._by_pos: Dict[str, List[int]] = {}
+        self._by_noun_class: Dict[Optional[str], List[int]] = {}
+        for entry in entries:
+            self.add(entry)
+    
+    def add(self, entry: DictionaryEntry):
+        ordinal = len(self.entries)
+        self.entries.append(entry)
+        for field in SEARCH_FIELDS:
+            value = getattr(entry, field)
+            text = value if field == 'wolof' else value.lower()
+            self._text[field].append(text)
+            if len(text) < 3:
+                self._short[field].append(ordinal)
+            grams = self._trigrams[field]
+            for gram in _trigrams(text):
+                grams.setdefault(gram, set()).add(ordinal)
+            tokens = self._tokens[field]
+            for token in set(WORD_PATTERN.findall(text)):
+                tokens.setdefault(token, []).append(ordinal)
+            self._sorted_tokens[field] = None
+        self._by_pos.setdefault(entry.pos, []).append(ordinal)
+        self._by_noun_class.setdefault(entry.noun_class, []).append(ordinal)
+    
+    def _substring(self, field: str, query: str) -> Set[int]:
+        texts = self._text[field]
+        grams = self._trigrams[field]
+        if len(query) >= 3:
+            postings = sorted((grams.get(g, set()) for g in _trigrams(query)), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = set(o for o in self._short[field] if query in texts[o])
+            for gram, ordinals in grams.items():
+                if query in gram:
+                    candidates |= ordinals
+        return {o for o in candidates if query in texts[o]}
+    
+    def _prefix(self, field: str, prefix: str) -> Set[int]:
+        tokens = self._sorted_tokens[field]
+        if tokens is None:
+            tokens = self._sorted_tokens[field] = sorted(self._tokens[field])
+        result = set()
+        i = bisect_left(tokens, prefix)
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            result.update(self._tokens[field][tokens[i]])
+            i += 1
+        return result
+    
+    def _collect(self, ordinals: Iterable[int]) -> List[DictionaryEntry]:
+        return [self.entries[o] for o in sorted(ordinals)]
+    
+    def search(self, query: str, field: str = 'all') -> List[DictionaryEntry]:
+        """Entries whose field contains ``query`` as a substring."""
+        query = query.lower()
+        if not query:
+            return list(self.entries) if _search_fields(field) else []
+        ordinals = set()
+        for f in _search_fields(field):
+            ordinals |= self._substring(f, query)
+        return self._collect(ordinals)
+    
+    def prefix_search(self, prefix: str, field: str = 'all') -> List[DictionaryEntry]:
+        """Entries with a word starting with ``prefix`` (type-ahead)."""
+        prefix = prefix.lower()
+        ordinals = set()
+        for f in _search_fields(field):
+            ordinals |= self._prefix(f, prefix)
+        return self._collect(ordinals)
+    
+    def by_pos(self, pos: str) -> List[DictionaryEntry]:
+        return [self.entries[o] for o in self._by_pos.get(pos, [])]
+    
+    def by_noun_class(self, noun_class: Optional[str]) -> List[DictionaryEntry]:
+        return [self.entries[o] for o in self._by_noun_class.get(noun_class, [])]
+    
+    def __len__(self):
+        return len(self.entries)
+
+
 class Dictionary:
     
-    def __init__(self):
-        self.entries = DICTIONARY
+    def __init__(self, backend=None, cache_size: int = 0):
+        """``backend`` defaults to a private in-memory copy of the built-in entries;
+        ``cache_size`` puts an LRU cache of that many headwords in front of it."""
+        from .backends import CachedBackend, MemoryBackend
+        backend = backend if backend is not None else MemoryBackend(dict(DICTIONARY))
+        if cache_size:
+            backend = CachedBackend(backend, cache_size)
+        self.backend = backend
+        self.entries = backend
+        # Bumped by every add, so derived tables can tell they are stale without counting entries
+        self.version = 0
+        self._fuzzy: Optional[FuzzyIndex] = None
+    
+    @property
+    def index(self) -> DictionaryIndex:
+        """Search indexes, built on first use."""
+        return self.backend.index
+    
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """Headwords plus known informal spellings (beug -> bëgg), built on first use."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex()
+            for headword in self.entries:
+                self._fuzzy.add(headword)
+            known = self.backend.lookup_many(WORD_NORMALIZATIONS.values())
+            for variant, standard in WORD_NORMALIZATIONS.items():
+                if standard in known:
+                    self._fuzzy.add(variant, standard)
+        return self._fuzzy
+    
+    def add(self, entry: DictionaryEntry):
+        if entry.wolof in self.entries:
+            raise ValueError(f"Entry already exists: {entry.wolof}")
+        self.backend.add(entry)
+        self.version += 1
+        if self._fuzzy is not None:
+            self._fuzzy.add(entry.wolof)
     
     def lookup(self, word: str) -> Optional[DictionaryEntry]:
-        return self.entries.get(word.lower())
+        return self.backend.get(word.lower())
+    
+    def lookup_many(self, words: Iterable[str]) -> Dict[str, DictionaryEntry]:
+        """Batched lookup keyed by lowercased word; one backend round trip per batch."""
+        return self.backend.lookup_many(w.lower() for w in words)
+    
+    def fuzzy_lookup(self, word: str, max_distance: int = 2, limit: int = 5) -> List[Tuple[DictionaryEntry, int]]:
+        """Ranked (entry, edit distance) candidates for a possibly misspelled word."""
+        return [(self.entries[headword], distance)
+                for headword, distance in self.fuzzy_index.lookup(word, max_distance, limit)]
     
     def translate(self, word: str, target: str = 'english') -> Optional[str]:
         entry = self.lookup(word)
@@ -150,30 +307,38 @@ class Dictionary:
         return entry.english if target == 'english' else entry.french
     
     def search(self, query: str, field: str = 'all') -> List[DictionaryEntry]:
-        results = []
-        query = query.lower()
-        for entry in self.entries.values():
-            if field == 'all':
-                if query in entry.wolof or query in entry.french.lower() or query in entry.english.lower():
-                    results.append(entry)
-            elif field == 'wolof' and query in entry.wolof:
-                results.append(entry)
-            elif field == 'french' and query in entry.french.lower():
-                results.append(entry)
-            elif field == 'english' and query in entry.english.lower():
-                results.append(entry)
-        return results
+        return self.backend.search(query, field)
+    
+    def prefix_search(self, prefix: str, field: str = 'all') -> List[DictionaryEntry]:
+        return self.backend.prefix_search(prefix, field)
     
     def get_by_pos(self, pos: str) -> List[DictionaryEntry]:
-        return [e for e in self.entries.values() if e.pos == pos]
+        return self.backend.by_pos(pos)
     
     def get_by_noun_class(self, noun_class: str) -> List[DictionaryEntry]:
-        return [e for e in self.entries.values() if e.noun_class == noun_class]
+        return self.backend.by_noun_class(noun_class)
+
+
+_DEFAULT_DICTIONARY: Optional[Dictionary] = None
+
+
+def get_default_dictionary() -> Dictionary:
+    """The dictionary used by ``lookup``, ``translate`` and the glosser unless one is passed in."""
+    global _DEFAULT_DICTIONARY
+    if _DEFAULT_DICTIONARY is None:
+        _DEFAULT_DICTIONARY = Dictionary()
+    return _DEFAULT_DICTIONARY
+
+
+def set_default_dictionary(dictionary: Optional[Dictionary]):
+    """Route module-level lookups through ``dictionary`` (``None`` restores the built-in one)."""
+    global _DEFAULT_DICTIONARY
+    _DEFAULT_DICTIONARY = dictionary
 
 
 def lookup(word: str) -> Optional[DictionaryEntry]:
-    return Dictionary().lookup(word)
+    return get_default_dictionary().lookup(word)
 
 
 def translate(word: str, target: str = 'english') -> Optional[str]:
-    return Dictionary().translate(word, target)
+    return get_default_dictionary().translate(word, target)
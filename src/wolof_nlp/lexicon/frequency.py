@@ -0,0 +1,230 @@
+"""Word Frequency - Streaming, mergeable token counters"""
+
+import heapq
+import json
+import zlib
+from array import array
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..core.parallel import parallel_map
+from ..core.vocab import Vocabulary
+
+
+def _clean(tokens: Iterable[str], min_length: int, lowercase: bool) -> Iterable[str]:
+    for token in tokens:
+        if len(token) >= min_length:
+            yield token.lower() if lowercase else token
+
+
+class FrequencyCounter:
+    """Exact streaming counts over interned token ids.
+
+    Tokens shorter than ``min_length`` are skipped and the rest lowercased,
+    as ``Lexicon.word_frequency`` does. Counters built on different batches,
+    processes or machines combine with ``merge``.
+    """
+
+    def __init__(self, min_length: int = 2, lowercase: bool = True):
+        self.min_length = min_length
+        self.lowercase = lowercase
+        self.vocab = Vocabulary()
+        self.counts = array('q')
+        self.total = 0
+
+    def update(self, tokens: Iterable[str]) -> 'FrequencyCounter':
+        counts = self.counts
+        add = self.vocab.add
+        n = 0
+        for word in _clean(tokens, self.min_length, self.lowercase):
+            idx = add(word)
+            if idx == len(counts):
+                counts.append(1)
+            else:
+                counts[idx] += 1
+            n += 1
+        self.total += n
+        return self
+
+    def add(self, word: str, count: int = 1):
+        idx = self.vocab.add(word)
+        if idx == len(self.counts):
+            self.counts.append(0)
+        self.counts[idx] += count
+        self.total += count
+
+    def merge(self, other: 'FrequencyCounter') -> 'FrequencyCounter':
+        for word, count in zip(other.vocab, other.counts):
+            self.add(word, count)
+        return self
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Highest counts first; ties keep first-seen order, like ``Counter.most_common``."""
+        counts = self.counts
+        if n is None:
+            ids = sorted(range(len(counts)), key=counts.__getitem__, reverse=True)
+        else:
+            ids = heapq.nlargest(n, range(len(counts)), key=counts.__getitem__)
+        return [(self.vocab[i], counts[i]) for i in ids]
+
+    def __getitem__(self, word: str) -> int:
+        idx = self.vocab.get(word)
+        return self.counts[idx] if idx >= 0 else 0
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.vocab
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': 'exact',
+            'min_length': self.min_length,
+            'lowercase': self.lowercase,
+            'words': self.vocab.to_list(),
+            'counts': self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FrequencyCounter':
+        counter = cls(data['min_length'], data['lowercase'])
+        for word, count in zip(data['words'], data['counts']):
+            counter.add(word, count)
+        return counter
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'FrequencyCounter':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+class CountMinSketch:
+    """Approximate counts in fixed memory, plus a bounded set of heavy hitters.
+
+    Estimates never undercount and overcount by at most ``e * total / width``
+    with probability ``1 - exp(-depth)``. Row hashes are seeded CRC32, so
+    sketches with the same ``width`` and ``depth`` merge exactly.
+    """
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4, heavy_hitters: int = 100,
+                 min_length: int = 2, lowercase: bool = True):
+        self.width = width
+        self.depth = depth
+        self.heavy_hitters = heavy_hitters
+        self.min_length = min_length
+        self.lowercase = lowercase
+        self.tables = [array('q', bytes(8 * width)) for _ in range(depth)]
+        self.seeds = [zlib.crc32(f'row{i}'.encode()) for i in range(depth)]
+        self.total = 0
+        self._candidates: Dict[str, int] = {}
+
+    def _cells(self, word: str) -> List[int]:
+        data = word.encode('utf-8')
+        return [zlib.crc32(data, seed) % self.width for seed in self.seeds]
+
+    def add(self, word: str, count: int = 1):
+        estimate = None
+        for table, cell in zip(self.tables, self._cells(word)):
+            table[cell] += count
+            value = table[cell]
+            if estimate is None or value < estimate:
+                estimate = value
+        self.total += count
+        self._offer(word, estimate)
+
+    def update(self, tokens: Iterable[str]) -> 'CountMinSketch':
+        for word in _clean(tokens, self.min_length, self.lowercase):
+            self.add(word)
+        return self
+
+    def _offer(self, word: str, estimate: int):
+        self._candidates[word] = estimate
+        if len(self._candidates) > 2 * self.heavy_hitters:
+            self._trim()
+
+    def _trim(self):
+        top = heapq.nlargest(self.heavy_hitters, self._candidates.items(), key=lambda kv: kv[1])
+        self._candidates = dict(top)
+
+    def estimate(self, word: str) -> int:
+        return min(table[cell] for table, cell in zip(self.tables, self._cells(word)))
+
+    def __getitem__(self, word: str) -> int:
+        return self.estimate(word)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Heavy hitters by current estimate; reliable for ``n <= heavy_hitters``."""
+        ranked = sorted(((w, self.estimate(w)) for w in self._candidates), key=lambda kv: kv[1], reverse=True)
+        return ranked[:min(n, self.heavy_hitters)] if n is not None else ranked[:self.heavy_hitters]
+
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        if (other.width, other.depth, other.seeds) != (self.width, self.depth, self.seeds):
+            raise ValueError("Cannot merge sketches with different dimensions")
+        for table, other_table in zip(self.tables, other.tables):
+            for i, value in enumerate(other_table):
+                if value:
+                    table[i] += value
+        self.total += other.total
+        for word in set(self._candidates) | set(other._candidates):
+            self._candidates[word] = self.estimate(word)
+        self._trim()
+        return self
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': 'sketch',
+            'width': self.width,
+            'depth': self.depth,
+            'heavy_hitters': self.heavy_hitters,
+            'min_length': self.min_length,
+            'lowercase': self.lowercase,
+            'total': self.total,
+            'tables': [t.tolist() for t in self.tables],
+            'candidates': self._candidates,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CountMinSketch':
+        sketch = cls(data['width'], data['depth'], data['heavy_hitters'], data['min_length'], data['lowercase'])
+        sketch.tables = [array('q', t) for t in data['tables']]
+        sketch.total = data['total']
+        sketch._candidates = dict(data['candidates'])
+        return sketch
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'CountMinSketch':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_counter(path: str):
+    """Load whichever counter type was saved at ``path``."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return (CountMinSketch if data['type'] == 'sketch' else FrequencyCounter).from_dict(data)
+
+
+def _count_batch(tokens: List[str], sketch: bool, options: Dict):
+    counter = CountMinSketch(**options) if sketch else FrequencyCounter(**options)
+    return counter.update(tokens)
+
+
+def count_frequencies(batches: Iterable[List[str]], n_jobs: int = 1, sketch: bool = False, **options):
+    """Count a stream of token batches, merging per-batch counters as they complete.
+
+    ``options`` go to ``FrequencyCounter`` or, with ``sketch=True``, ``CountMinSketch``.
+    """
+    total = CountMinSketch(**options) if sketch else FrequencyCounter(**options)
+    worker = partial(_count_batch, sketch=sketch, options=options)
+    for partial_counter in parallel_map(worker, batches, n_jobs=n_jobs):
+        total.merge(partial_counter)
+    return total
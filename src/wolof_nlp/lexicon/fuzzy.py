@@ -0,0 +1,97 @@
+"""Wolof Fuzzy Lookup - SymSpell-style deletion index for noisy spellings"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+DIACRITIC_FOLDING = str.maketrans('ëàáâéèêíóôúñŋ', 'eaaaeeeioounn')
+
+
+def fold(word: str) -> str:
+    """Lowercase and strip diacritics: bëgg -> begg, jàng -> jang."""
+    return word.lower().translate(DIACRITIC_FOLDING)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or ``max_distance + 1`` once it is exceeded."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev_prev is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, prev_prev[j - 2] + 1)
+            cur[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, cur
+    return prev[-1] if prev[-1] <= max_distance else max_distance + 1
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - result
+        result |= frontier
+    return result
+
+
+class FuzzyIndex:
+    """Maps misspelled words to known targets within an edit-distance budget.
+
+    Terms are diacritic-folded and indexed by every deletion of their first
+    ``prefix_length`` characters, so a lookup touches a bounded number of
+    candidates regardless of index size.
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._deletes: Dict[str, Set[str]] = {}
+        self._targets: Dict[str, List[str]] = {}
+        self._order: Dict[str, int] = {}
+
+    def add(self, term: str, target: Optional[str] = None):
+        """Index ``term`` as a spelling of ``target`` (defaults to the term itself)."""
+        target = target if target is not None else term
+        self._order.setdefault(target, len(self._order))
+        key = fold(term)
+        targets = self._targets.setdefault(key, [])
+        if target in targets:
+            return
+        targets.append(target)
+        for variant in _deletes(key[:self.prefix_length], self.max_distance):
+            self._deletes.setdefault(variant, set()).add(key)
+
+    def update(self, pairs: Iterable[Tuple[str, str]]):
+        for term, target in pairs:
+            self.add(term, target)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None, limit: int = 10) -> List[Tuple[str, int]]:
+        """Return up to ``limit`` (target, distance) pairs, closest first."""
+        budget = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        key = fold(word)
+        prefix = key[:self.prefix_length]
+        candidates = set()
+        for variant in _deletes(prefix, budget):
+            candidates |= self._deletes.get(variant, set())
+
+        best: Dict[str, int] = {}
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, budget)
+            if distance > budget:
+                continue
+            for target in self._targets[candidate]:
+                if distance < best.get(target, budget + 1):
+                    best[target] = distance
+
+        ranked = sorted(best.items(), key=lambda kv: (kv[1], self._order[kv[0]]))
+        return ranked[:limit]
+
+    def __len__(self):
+        return len(self._targets)
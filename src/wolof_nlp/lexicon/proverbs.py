@@ -1,7 +1,13 @@
 """Wolof Proverbs - Léebu Wolof"""
 
-from dataclasses import dataclass
-from typing import List, Optional
+import heapq
+import json
+import math
+import re
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .fuzzy import fold
 
 @dataclass
 class Proverb:
@@ -28,20 +34,177 @@ PROVERBS = [
     Proverb("Am na lu gën wax", "Il y a plus important que parler", "There's more than just talking", "action"),
 ]
 
-class ProverbCollection:
+TERM_PATTERN = re.compile(r"\w+")
+
+
+class _TextAnalyzer:
+    """Folded surface tokens plus Wolof lemmas, shared by indexing and querying."""
+    
     def __init__(self):
-        self.proverbs = PROVERBS
+        from ..core.normalizer import WolofNormalizer
+        from ..morphology.lemmatizer import Lemmatizer
+        self.normalizer = WolofNormalizer()
+        self.lemmatizer = Lemmatizer()
+    
+    def wolof_terms(self, text: str, cache: bool = True) -> List[str]:
+        """``cache=False`` keeps the words out of the lemmatizer's type cache (open-ended queries)."""
+        tokens = TERM_PATTERN.findall(self.normalizer.normalize(text).lower())
+        if cache:
+            arrays = self.lemmatizer.lemmatize_tokens(tokens)
+            lemmas = [arrays.lemma(i) for i in range(len(arrays))]
+        else:
+            lemmas = [self.lemmatizer.get_lemma(t) for t in tokens]
+        terms = [fold(t) for t in tokens]
+        terms.extend(fold(lemma) for token, lemma in zip(tokens, lemmas) if lemma != token)
+        return terms
+    
+    def terms(self, text: str) -> List[str]:
+        return [fold(t) for t in TERM_PATTERN.findall(text.lower())]
+
+
+class ProverbIndex:
+    """BM25 inverted index over proverbs, plus a theme index.
+    
+    Wolof text is normalized and indexed both as written and by lemma;
+    French and English are indexed as folded words. Postings are stored
+    impact-ordered, so a query reads at most ``max_postings`` entries per
+    term whatever the collection size.
+    """
+    
+    def __init__(self, proverbs: Iterable[Proverb] = (), k1: float = 1.2, b: float = 0.75,
+                 max_postings: int = 1000):
+        self.k1 = k1
+        self.b = b
+        self.max_postings = max_postings
+        self.proverbs: List[Proverb] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.doc_lengths: List[int] = []
+        self.themes: Dict[str, List[int]] = {}
+        self._impacts: Optional[Dict[str, List[Tuple[float, int]]]] = None
+        self._analyzer: Optional[_TextAnalyzer] = None
+        for proverb in proverbs:
+            self.add(proverb)
+    
+    @property
+    def analyzer(self) -> _TextAnalyzer:
+        if self._analyzer is None:
+            self._analyzer = _TextAnalyzer()
+        return self._analyzer
+    
+    def _document_terms(self, proverb: Proverb) -> List[str]:
+        analyzer = self.analyzer
+        return (analyzer.wolof_terms(proverb.wolof) + analyzer.terms(proverb.french)
+                + analyzer.terms(proverb.english))
+    
+    def _add_terms(self, doc_id: int, terms: List[str]):
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        for term, tf in counts.items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+        self.doc_lengths.append(len(terms))
+    
+    def add(self, proverb: Proverb):
+        doc_id = len(self.proverbs)
+        self.proverbs.append(proverb)
+        self._add_terms(doc_id, self._document_terms(proverb))
+        self.themes.setdefault(proverb.theme, []).append(doc_id)
+        self._impacts = None
+    
+    def _build_impacts(self) -> Dict[str, List[Tuple[float, int]]]:
+        n = len(self.proverbs)
+        avgdl = sum(self.doc_lengths) / n if n else 0.0
+        k1, b = self.k1, self.b
+        impacts = {}
+        for term, postings in self.postings.items():
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            weighted = []
+            for doc_id, tf in postings:
+                norm = 1 - b + b * self.doc_lengths[doc_id] / avgdl if avgdl else 1.0
+                weighted.append((idf * tf * (k1 + 1) / (tf + k1 * norm), doc_id))
+            weighted.sort(key=lambda w: (-w[0], w[1]))
+            impacts[term] = weighted
+        return impacts
+    
+    def search(self, query: str, k: int = 5) -> List[Tuple[Proverb, float]]:
+        """Top ``k`` (proverb, BM25 score) pairs for a Wolof, French or English query."""
+        if self._impacts is None:
+            self._impacts = self._build_impacts()
+        terms = set(self.analyzer.wolof_terms(query, cache=False)) | set(self.analyzer.terms(query))
+        scores: Dict[int, float] = {}
+        for term in terms:
+            for weight, doc_id in self._impacts.get(term, ())[:self.max_postings]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        best = heapq.nsmallest(k, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(self.proverbs[doc_id], score) for doc_id, score in best]
+    
+    def by_theme(self, theme: str) -> List[Proverb]:
+        return [self.proverbs[i] for i in self.themes.get(theme.lower(), ())]
+    
+    def __len__(self) -> int:
+        return len(self.proverbs)
+    
+    def save(self, path: str):
+        """Persist proverbs and postings as JSON; loading skips re-analysis."""
+        data = {
+            'k1': self.k1,
+            'b': self.b,
+            'proverbs': [asdict(p) for p in self.proverbs],
+            'postings': self.postings,
+            'doc_lengths': self.doc_lengths,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+    
+    @classmethod
+    def load(cls, path: str, max_postings: int = 1000) -> 'ProverbIndex':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        index = cls(k1=data['k1'], b=data['b'], max_postings=max_postings)
+        index.proverbs = [Proverb(**p) for p in data['proverbs']]
+        index.postings = {term: [tuple(p) for p in postings] for term, postings in data['postings'].items()}
+        index.doc_lengths = data['doc_lengths']
+        for doc_id, proverb in enumerate(index.proverbs):
+            index.themes.setdefault(proverb.theme, []).append(doc_id)
+        return index
+    
+    @classmethod
+    def from_jsonl(cls, path: str, **kwargs) -> 'ProverbIndex':
+        """Build from one JSON object per line with wolof, french, english and theme keys."""
+        return cls(load_proverbs_jsonl(path), **kwargs)
+
+
+def load_proverbs_jsonl(path: str) -> List[Proverb]:
+    with open(path, encoding='utf-8') as f:
+        return [Proverb(**json.loads(line)) for line in f if line.strip()]
+
+
+class ProverbCollection:
+    def __init__(self, proverbs: Optional[List[Proverb]] = None):
+        self.proverbs = proverbs if proverbs is not None else PROVERBS
+        self._index: Optional[ProverbIndex] = None
+    
+    @property
+    def index(self) -> ProverbIndex:
+        """Full-text and theme index, built on first use."""
+        if self._index is None:
+            self._index = ProverbIndex(self.proverbs)
+        return self._index
     
     def get_all(self) -> List[Proverb]:
         return self.proverbs
     
     def get_by_theme(self, theme: str) -> List[Proverb]:
-        return [p for p in self.proverbs if p.theme == theme.lower()]
+        return self.index.by_theme(theme)
     
     def search(self, query: str) -> List[Proverb]:
         q = query.lower()
         return [p for p in self.proverbs if q in p.wolof.lower() or q in p.english.lower()]
     
+    def retrieve(self, query: str, k: int = 5) -> List[Proverb]:
+        """Best-matching proverbs for a free-text query, ranked by BM25."""
+        return [p for p, _ in self.index.search(query, k)]
+    
     def random(self) -> Proverb:
         import random
         return random.choice(self.proverbs)
@@ -49,8 +212,20 @@ class ProverbCollection:
     def themes(self) -> List[str]:
         return list(set(p.theme for p in self.proverbs))
 
+_DEFAULT_COLLECTION: Optional[ProverbCollection] = None
+
+def default_collection() -> ProverbCollection:
+    """Shared collection over the built-in proverbs; its index is built on the first retrieval."""
+    global _DEFAULT_COLLECTION
+    if _DEFAULT_COLLECTION is None:
+        _DEFAULT_COLLECTION = ProverbCollection()
+    return _DEFAULT_COLLECTION
+
 def get_proverbs() -> List[Proverb]:
-    return ProverbCollection().get_all()
+    return default_collection().get_all()
 
 def search_proverbs(query: str) -> List[Proverb]:
-    return ProverbCollection().search(query)
\ No newline at end of file
+    return default_collection().search(query)
+
+def retrieve_proverbs(query: str, k: int = 5) -> List[Proverb]:
+    return default_collection().retrieve(query, k)
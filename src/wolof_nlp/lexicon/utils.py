@@ -1,20 +1,46 @@
 """Wolof Lexicon - Word lookup and classification utilities"""
 
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterable, List, Tuple
 from collections import Counter
 
 from ..core.constants import (
     POS_CATEGORIES, COMMON_WORDS, ARABIC_LOANWORDS, FRENCH_COMMON, ENGLISH_COMMON,
     NOUN_CLASS_MARKERS, PRONOUNS, NUMBERS, TAM_MARKERS, SENTENCE_PARTICLES
 )
+from .frequency import FrequencyCounter
+
+def _build_word_pos() -> Dict[str, Tuple[str, ...]]:
+    index: Dict[str, Tuple[str, ...]] = {}
+    for pos, words in POS_CATEGORIES.items():
+        for word in words:
+            index[word] = index.get(word, ()) + (pos,)
+    return index
+
+def _build_marker_class() -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    for cls, markers in NOUN_CLASS_MARKERS.items():
+        for value in markers.values():
+            if isinstance(value, str):
+                index.setdefault(value, cls)
+    return index
+
+# word -> every POS it is listed under, in POS_CATEGORIES order
+WORD_POS = _build_word_pos()
+# marker value -> first noun class carrying it
+MARKER_CLASS = _build_marker_class()
 
 class Lexicon:
     def lookup_pos(self, word: str) -> Optional[str]:
-        word_lower = word.lower()
-        for pos, words in POS_CATEGORIES.items():
-            if word_lower in words:
-                return pos
-        return None
+        labels = WORD_POS.get(word.lower())
+        return labels[0] if labels else None
+    
+    def lookup_pos_all(self, word: str) -> Tuple[str, ...]:
+        """All POS labels for an ambiguous word, most preferred first."""
+        return WORD_POS.get(word.lower(), ())
+    
+    def lookup_pos_many(self, words: Iterable[str]) -> List[Optional[str]]:
+        get = WORD_POS.get
+        return [labels[0] if labels else None for labels in (get(w.lower()) for w in words)]
     
     def is_wolof_word(self, word: str) -> bool:
         word_lower = word.lower()
@@ -28,11 +54,11 @@ class Lexicon:
         return False
     
     def detect_noun_class(self, determiner: str) -> Optional[str]:
-        det_lower = determiner.lower()
-        for cls, markers in NOUN_CLASS_MARKERS.items():
-            if det_lower in markers.values():
-                return cls
-        return None
+        return MARKER_CLASS.get(determiner.lower())
+    
+    def detect_noun_class_many(self, determiners: Iterable[str]) -> List[Optional[str]]:
+        get = MARKER_CLASS.get
+        return [get(d.lower()) for d in determiners]
     
     def detect_tam(self, word: str) -> Optional[str]:
         word_lower = word.lower()
@@ -58,8 +84,7 @@ class Lexicon:
         return NUMBERS.get(word.lower())
     
     def word_frequency(self, tokens: List[str], top_n: int = 10) -> List[Tuple[str, int]]:
-        cleaned = [t.lower() for t in tokens if len(t) > 1]
-        return Counter(cleaned).most_common(top_n)
+        return FrequencyCounter().update(tokens).most_common(top_n)
     
     def compute_language_ratio(self, tokens: List['Token']) -> Dict[str, float]:
         langs = [t.language for t in tokens if hasattr(t, 'language') and t.language]
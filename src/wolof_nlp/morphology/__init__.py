@@ -1,9 +1,11 @@
-from .analyzer import MorphologyAnalyzer, Morpheme, MorphemeType, analyze_morphology, get_root
-from .lemmatizer import Lemmatizer, lemmatize
+from .analyzer import MorphologyAnalyzer, MorphologyTable, Morpheme, MorphemeType, analyze_morphology, get_root
+from .lemmatizer import Lemmatizer, LemmaArrays, lemmatize, lemmatize_tokens, feature_names
 from .verb_conjugator import VerbConjugator, ConjugatedForm, conjugate
+from .paradigms import ParadigmTable, MappedParadigmTable, FormAnalysis, recognize
 
 __all__ = [
-    'MorphologyAnalyzer', 'Morpheme', 'MorphemeType', 'analyze_morphology', 'get_root',
-    'Lemmatizer', 'lemmatize',
+    'MorphologyAnalyzer', 'MorphologyTable', 'Morpheme', 'MorphemeType', 'analyze_morphology', 'get_root',
+    'Lemmatizer', 'LemmaArrays', 'lemmatize', 'lemmatize_tokens', 'feature_names',
     'VerbConjugator', 'ConjugatedForm', 'conjugate',
+    'ParadigmTable', 'MappedParadigmTable', 'FormAnalysis', 'recognize',
 ]
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Wolof Morphology Analyzer - Derivational and inflectional analysis"""
 
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 from enum import Enum, auto
 
 from ..core.constants import (
@@ -12,6 +13,8 @@ from ..core.constants import (
     SUBJECT_FOCUS, VERB_FOCUS, PRESENTATIVE, PERFECT, FUTURE, NEGATIVE_FUTURE,
     IMPERFECTIVE, SEMI_AUXILIARIES, AK_CONTRACTIONS, AY_CONTRACTIONS
 )
+from ..core.vocab import Vocabulary
+from ..core.parallel import chunked, parallel_map
 
 class MorphemeType(Enum):
     ROOT = auto()
@@ -60,6 +63,38 @@ class Morpheme:
             return f"{self.text}:{self.type.name}({self.gloss})"
         return f"{self.text}:{self.type.name}"
 
+AffixSequence = Tuple[Tuple[str, MorphemeType, Optional[str]], ...]
+
+@dataclass
+class MorphologyTable:
+    """Columnar morphology for a token sequence.
+    
+    Token i has type ``index[i]``; type t has root ``roots[root_ids[t]]``
+    (-1 when the analysis has no ROOT) followed by the affix sequence
+    ``affixes[affix_ids[t]]``. Each distinct word is stored once.
+    """
+    types: Vocabulary
+    index: array
+    root_ids: array
+    affix_ids: array
+    roots: Vocabulary
+    affixes: Vocabulary
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def root(self, i: int) -> Optional[str]:
+        root_id = self.root_ids[self.index[i]]
+        return self.roots[root_id] if root_id >= 0 else None
+    
+    def morphemes(self, i: int) -> List[Morpheme]:
+        t = self.index[i]
+        result = []
+        if self.root_ids[t] >= 0:
+            result.append(Morpheme(self.roots[self.root_ids[t]], MorphemeType.ROOT))
+        result.extend(Morpheme(text, mtype, gloss) for text, mtype, gloss in self.affixes[self.affix_ids[t]])
+        return result
+
 class MorphologyAnalyzer:
     FRENCH_PATTERNS = {'ment$', 'tion$', 'eur$', 'eux$', 'ique$', 'able$', 'ible$'}
     FRENCH_WORDS = {'meriku', 'pendant', 'vraiment', 'toujours', 'beaucoup', 'quelque'}
@@ -264,6 +299,34 @@ class MorphologyAnalyzer:
         
         return remaining
     
+    def analyze_many(self, words: Iterable[str], n_jobs: int = 1, chunk_size: int = 2048) -> MorphologyTable:
+        """Analyze a token stream, running each distinct (lowercased) word once.
+        
+        With ``n_jobs != 1`` the unique types are analyzed across a process pool.
+        """
+        types = Vocabulary()
+        index = array('i', (types.add(w.lower()) for w in words))
+        
+        if n_jobs == 1:
+            analyses = map(self.analyze, types)
+        else:
+            batches = parallel_map(_analyze_batch, chunked(types, chunk_size), n_jobs, initializer=_init_worker)
+            analyses = (a for batch in batches for a in batch)
+        
+        roots = Vocabulary()
+        affixes = Vocabulary()
+        root_ids = array('i')
+        affix_ids = array('i')
+        for morphemes in analyses:
+            root_id = -1
+            if morphemes and morphemes[0].type == MorphemeType.ROOT:
+                root_id = roots.add(morphemes[0].text)
+                morphemes = morphemes[1:]
+            root_ids.append(root_id)
+            affix_ids.append(affixes.add(tuple((m.text, m.type, m.gloss) for m in morphemes)))
+        
+        return MorphologyTable(types, index, root_ids, affix_ids, roots, affixes)
+    
     def get_root(self, word: str) -> str:
         morphemes = self.analyze(word)
         for m in morphemes:
@@ -282,6 +345,15 @@ class MorphologyAnalyzer:
             chain.append(current)
         return chain
 
+_WORKER_ANALYZER: Optional[MorphologyAnalyzer] = None
+
+def _init_worker():
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = MorphologyAnalyzer()
+
+def _analyze_batch(words: List[str]) -> List[List[Morpheme]]:
+    return [_WORKER_ANALYZER.analyze(w) for w in words]
+
 def analyze_morphology(word: str) -> List[Morpheme]:
     return MorphologyAnalyzer().analyze(word)
 
@@ -1,11 +1,36 @@
 """Wolof Lemmatizer - Extract dictionary forms from inflected words"""
 
-from typing import Optional, Tuple
-from .analyzer import MorphologyAnalyzer, MorphemeType
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from .analyzer import MorphologyAnalyzer, Morpheme, MorphemeType
+from ..core.vocab import Vocabulary
+
+FEATURE_BITS = {t: 1 << (t.value - 1) for t in MorphemeType}
+_UNINFORMATIVE = (MorphemeType.TAM, MorphemeType.OBJECT, MorphemeType.SUBJECT)
+
+def feature_names(mask: int) -> List[str]:
+    """Decode a feature bitmask into lowercase morpheme type names."""
+    return [t.name.lower() for t, bit in FEATURE_BITS.items() if mask & bit]
+
+@dataclass
+class LemmaArrays:
+    """Per-token lemma ids and feature bitmasks; ``vocab[lemma_ids[i]]`` is the lemma string."""
+    lemma_ids: array
+    features: array
+    vocab: Vocabulary
+    
+    def __len__(self):
+        return len(self.lemma_ids)
+    
+    def lemma(self, i: int) -> str:
+        return self.vocab[self.lemma_ids[i]]
 
 class Lemmatizer:
     def __init__(self):
         self.analyzer = MorphologyAnalyzer()
+        self.vocab = Vocabulary()
+        self._type_cache: Dict[str, Tuple[int, int]] = {}
     
     def lemmatize(self, word: str) -> Tuple[str, str]:
         """Returns (lemma, morphological_info)"""
@@ -29,8 +54,46 @@ class Lemmatizer:
         
         return word.lower(), "unknown"
     
+    def lemmatize_tokens(self, tokens: Iterable[str], n_jobs: int = 1) -> LemmaArrays:
+        """Lemmatize a whole document into lemma ids and feature bitmasks.
+        
+        Lemma ids index ``self.vocab`` and stay stable across calls on the same
+        Lemmatizer. Bitmask 0 means a bare root; the UNKNOWN bit marks words
+        without a root morpheme (``lemmatize`` reports these as "unknown").
+        """
+        types = Vocabulary()
+        index = array('i', (types.add(t.lower()) for t in tokens))
+        
+        unseen = [t for t in types if t not in self._type_cache]
+        if unseen:
+            table = self.analyzer.analyze_many(unseen, n_jobs=n_jobs)
+            for i, word in enumerate(unseen):
+                self._type_cache[word] = self._encode(word, table.morphemes(i))
+        
+        cached = [self._type_cache[t] for t in types]
+        lemma_ids = array('i', (cached[i][0] for i in index))
+        features = array('I', (cached[i][1] for i in index))
+        return LemmaArrays(lemma_ids, features, self.vocab)
+    
+    def _encode(self, word: str, morphemes: List[Morpheme]) -> Tuple[int, int]:
+        root: Optional[str] = None
+        mask = 0
+        for m in morphemes:
+            if m.type == MorphemeType.ROOT:
+                root = m.text
+            elif m.type not in _UNINFORMATIVE:
+                mask |= FEATURE_BITS[m.type]
+        if root is None:
+            return self.vocab.add(word), FEATURE_BITS[MorphemeType.UNKNOWN]
+        if len(morphemes) == 1:
+            return self.vocab.add(word), 0
+        return self.vocab.add(root), mask
+    
     def get_lemma(self, word: str) -> str:
         return self.lemmatize(word)[0]
 
 def lemmatize(word: str) -> str:
-    return Lemmatizer().get_lemma(word)
\ No newline at end of file
+    return Lemmatizer().get_lemma(word)
+
+def lemmatize_tokens(tokens: Iterable[str]) -> LemmaArrays:
+    return Lemmatizer().lemmatize_tokens(tokens)
@@ -0,0 +1,159 @@
+"""Wolof Paradigm Tables - Precomputed verb forms with a surface form -> analysis index"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.constants import COMMON_VERBS
+from .verb_conjugator import VerbConjugator
+
+DERIVATIONS = (None, 'reflexive', 'reciprocal', 'repetitive', 'causative', 'causative_lo')
+
+
+@dataclass(frozen=True)
+class FormAnalysis:
+    root: str
+    tam: Optional[str]
+    person: Optional[int]
+    number: Optional[str]
+    derivation: Optional[str]
+
+    def to_row(self) -> str:
+        return '\t'.join('' if v is None else str(v)
+                         for v in (self.root, self.tam, self.person, self.number, self.derivation))
+
+    @classmethod
+    def from_row(cls, row: str) -> 'FormAnalysis':
+        root, tam, person, number, derivation = row.split('\t')
+        return cls(root, tam or None, int(person) if person else None, number or None, derivation or None)
+
+
+def dictionary_verbs() -> List[str]:
+    from ..lexicon.dictionary import DICTIONARY
+    return [e.wolof for e in DICTIONARY.values() if e.pos == 'verb']
+
+
+def generate_forms(verbs: Iterable[str], conjugator: Optional[VerbConjugator] = None) -> Iterator[Tuple[str, FormAnalysis]]:
+    """Yield (surface form, analysis) for every bare, derived and conjugated form of each verb."""
+    conjugator = conjugator or VerbConjugator()
+    for root in verbs:
+        for derivation in DERIVATIONS:
+            stem = conjugator.derive(root, derivation) if derivation else root
+            yield stem, FormAnalysis(root, None, None, None, derivation)
+            for tam in conjugator.TAMS:
+                for f in conjugator.conjugate(stem, tam):
+                    yield f.form, FormAnalysis(root, tam, f.person, f.number, derivation)
+
+
+class ParadigmTable:
+    """In-memory surface form -> analyses index over a full paradigm."""
+
+    def __init__(self, forms: Optional[Dict[str, List[FormAnalysis]]] = None):
+        self.forms = forms if forms is not None else {}
+
+    @classmethod
+    def build(cls, verbs: Optional[Iterable[str]] = None) -> 'ParadigmTable':
+        """Build from ``verbs``, by default COMMON_VERBS plus every dictionary verb."""
+        if verbs is None:
+            verbs = sorted(set(COMMON_VERBS) | set(dictionary_verbs()))
+        table = cls()
+        for form, analysis in generate_forms(verbs):
+            table.add(form, analysis)
+        return table
+
+    def add(self, form: str, analysis: FormAnalysis):
+        analyses = self.forms.setdefault(form.lower(), [])
+        if analysis not in analyses:
+            analyses.append(analysis)
+
+    def lookup(self, form: str) -> List[FormAnalysis]:
+        return self.forms.get(form.lower(), [])
+
+    def __contains__(self, form: str) -> bool:
+        return form.lower() in self.forms
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def save(self, path: str):
+        """Write a byte-sorted TSV (form, root, tam, person, number, derivation) usable by ``open``."""
+        lines = sorted(f"{form}\t{a.to_row()}\n".encode('utf-8')
+                       for form, analyses in self.forms.items() for a in analyses)
+        with open(path, 'wb') as f:
+            f.writelines(lines)
+
+    @classmethod
+    def load(cls, path: str) -> 'ParadigmTable':
+        table = cls()
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                form, row = line.rstrip('\n').split('\t', 1)
+                table.forms.setdefault(form, []).append(FormAnalysis.from_row(row))
+        return table
+
+    @staticmethod
+    def open(path: str) -> 'MappedParadigmTable':
+        return MappedParadigmTable(path)
+
+
+class MappedParadigmTable:
+    """Read-only view of a saved table: binary search over a memory-mapped file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def _first_line_at_or_after(self, key: bytes) -> int:
+        mm = self._mm
+        lo, hi = 0, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b'\n', 0, mid) + 1
+            end = mm.find(b'\n', start)
+            if mm[start:mm.find(b'\t', start, end)] < key:
+                lo = end + 1
+            else:
+                hi = start
+        return lo
+
+    def lookup(self, form: str) -> List[FormAnalysis]:
+        key = form.lower().encode('utf-8')
+        mm = self._mm
+        pos = self._first_line_at_or_after(key)
+        result = []
+        prefix = key + b'\t'
+        while pos < len(mm) and mm[pos:pos + len(prefix)] == prefix:
+            end = mm.find(b'\n', pos)
+            result.append(FormAnalysis.from_row(mm[pos + len(prefix):end].decode('utf-8')))
+            pos = end + 1
+        return result
+
+    def __contains__(self, form: str) -> bool:
+        return bool(self.lookup(form))
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_DEFAULT_TABLE: Optional[ParadigmTable] = None
+
+
+def default_paradigm_table() -> ParadigmTable:
+    global _DEFAULT_TABLE
+    if _DEFAULT_TABLE is None:
+        _DEFAULT_TABLE = ParadigmTable.build()
+    return _DEFAULT_TABLE
+
+
+def recognize(form: str) -> List[FormAnalysis]:
+    return default_paradigm_table().lookup(form)
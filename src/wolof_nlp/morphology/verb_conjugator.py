@@ -42,6 +42,16 @@ class VerbConjugator:
         (1, 'pl'): 'dunu', (2, 'pl'): 'dungeen', (3, 'pl'): 'duñu'
     }
     
+    TAMS = ('perfect', 'verb_focus', 'subject_focus', 'future', 'negative')
+    
+    PARADIGMS = {
+        'perfect': PERFECT_MARKERS,
+        'verb_focus': VERB_FOCUS,
+        'subject_focus': SUBJECT_FOCUS,
+        'future': FUTURE,
+        'negative': NEGATIVE,
+    }
+    
     def conjugate(self, root: str, tam: str = 'perfect') -> List[ConjugatedForm]:
         forms = []
         paradigm = self._get_paradigm(tam)
@@ -67,23 +77,15 @@ class VerbConjugator:
         return forms
     
     def conjugate_all(self, root: str) -> Dict[str, List[ConjugatedForm]]:
-        return {
-            'perfect': self.conjugate(root, 'perfect'),
-            'verb_focus': self.conjugate(root, 'verb_focus'),
-            'subject_focus': self.conjugate(root, 'subject_focus'),
-            'future': self.conjugate(root, 'future'),
-            'negative': self.conjugate(root, 'negative'),
-        }
+        return {tam: self.conjugate(root, tam) for tam in self.TAMS}
+    
+    def recognize(self, form: str) -> List['FormAnalysis']:
+        """Analyze a conjugated or derived surface form with one lookup in the precomputed paradigm table."""
+        from .paradigms import recognize
+        return recognize(form)
     
     def _get_paradigm(self, tam: str) -> Dict:
-        paradigms = {
-            'perfect': self.PERFECT_MARKERS,
-            'verb_focus': self.VERB_FOCUS,
-            'subject_focus': self.SUBJECT_FOCUS,
-            'future': self.FUTURE,
-            'negative': self.NEGATIVE,
-        }
-        return paradigms.get(tam, self.PERFECT_MARKERS)
+        return self.PARADIGMS.get(tam, self.PERFECT_MARKERS)
     
     def _make_gloss(self, root: str, person: int, number: str, tam: str) -> str:
         subj = {(1, 'sg'): 'I', (2, 'sg'): 'you', (3, 'sg'): 'he/she',
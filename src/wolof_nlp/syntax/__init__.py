@@ -1,7 +1,9 @@
-from .sentence_parser import SentenceParser, SentenceAnalysis, ClauseType, FocusType, parse_sentence
+from .segmenter import SentenceSegmenter, Sentence, segment_sentences
+from .sentence_parser import SentenceParser, SentenceAnalysis, ClauseType, FocusType, parse_sentence, parse_document
 from .clause_analyzer import ClauseAnalyzer, ClauseAnalysis, CopularType, ClauseStructure, analyze_clause
 
 __all__ = [
-    'SentenceParser', 'SentenceAnalysis', 'ClauseType', 'FocusType', 'parse_sentence',
+    'SentenceSegmenter', 'Sentence', 'segment_sentences',
+    'SentenceParser', 'SentenceAnalysis', 'ClauseType', 'FocusType', 'parse_sentence', 'parse_document',
     'ClauseAnalyzer', 'ClauseAnalysis', 'CopularType', 'ClauseStructure', 'analyze_clause',
 ]
\ No newline at end of file
@@ -1,10 +1,27 @@
 """Wolof Clause Analyzer - Copular sentences, relative clauses (Martinović)"""
 
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 from enum import Enum, auto
 
 from ..core.constants import ALL_DETERMINERS, RELATIVE_PRONOUNS
+from ..core.parallel import chunked, parallel_map
+from ..core.tokenizer import WolofTokenizer
+from ..core.vocab import Vocabulary
+from .segmenter import Sentence, SentenceSegmenter
+
+# Flags of one lowercased word
+RELATIVE_WORD = 1
+LA_WORD = 2
+DI_WORD = 4
+DETERMINER_WORD = 8
+
+CLAUSE_FLAGS = {'la': LA_WORD, 'di': DI_WORD}
+for _word in RELATIVE_PRONOUNS:
+    CLAUSE_FLAGS[_word] = CLAUSE_FLAGS.get(_word, 0) | RELATIVE_WORD
+for _word in ALL_DETERMINERS:
+    CLAUSE_FLAGS[_word] = CLAUSE_FLAGS.get(_word, 0) | DETERMINER_WORD
 
 class CopularType(Enum):
     PREDICATIONAL = auto()
@@ -28,26 +45,105 @@ class ClauseAnalysis:
     relative_pronoun: Optional[str]
 
 class ClauseAnalyzer:
+    """Clause structure from a single scan of per-word ``CLAUSE_FLAGS``.
+    
+    ``analyze`` takes word strings. ``analyze_ids`` takes lowercased word ids
+    in ``vocab`` (see ``WolofTokenizer.tokenize_to_ids``); flags of the first
+    ``max_types`` ids are kept in an array aligned with the vocabulary, later
+    ids are flagged from their word. The document APIs segment text into
+    sentences and analyze each one as a clause without touching ``vocab``.
+    """
+    
+    def __init__(self, vocab: Optional[Vocabulary] = None, max_types: int = 100000):
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self.max_types = max_types
+        # Flags per vocabulary id, plus a trailing 0 read by unknown words (id -1)
+        self.flags = array('B', [0])
+        self._segmenter: Optional[SentenceSegmenter] = None
+    
+    @property
+    def segmenter(self) -> SentenceSegmenter:
+        if self._segmenter is None:
+            # Clause analysis never looks at token languages
+            self._segmenter = SentenceSegmenter(WolofTokenizer(normalize=True, detect_language=False))
+        return self._segmenter
+    
     def analyze(self, tokens: List[str]) -> ClauseAnalysis:
         words = [t.lower() for t in tokens]
+        return self._analyze(tokens, words, self._scan(map(CLAUSE_FLAGS.get, words)))
+    
+    def analyze_ids(self, ids: Sequence[int]) -> ClauseAnalysis:
+        """``analyze`` for lowercased word ids in ``self.vocab`` (-1 for unknown words); DPs come back lowercased."""
+        vocab, flags = self.vocab, self.flags
+        covered = len(flags) - 1
+        if covered < len(vocab) and covered < self.max_types:
+            covered = min(len(vocab), self.max_types)
+            flags[-1:] = array('B', [CLAUSE_FLAGS.get(vocab[i], 0) for i in range(len(flags) - 1, covered)] + [0])
+        words = _IdWords(vocab, ids)
+        if covered >= len(vocab):
+            return self._analyze(words, words, self._scan(map(flags.__getitem__, ids)))
+        return self._analyze(words, words, self._scan(CLAUSE_FLAGS.get(vocab[i]) if i >= 0 else 0 for i in ids))
+    
+    def analyze_document(self, text: str) -> List[Tuple[Sentence, ClauseAnalysis]]:
+        """Segment ``text`` once and analyze every sentence as a clause; DPs come back lowercased."""
+        return [(s, self.analyze([t.text.lower() for t in s.words])) for s in self.segmenter.segment(text)]
+    
+    def analyze_many(self, texts: Iterable[str], n_jobs: int = 1,
+                     chunk_size: int = 64) -> Iterator[List[Tuple[Sentence, ClauseAnalysis]]]:
+        """``analyze_document`` over a stream of documents, yielding results in input order.
+        
+        With ``n_jobs != 1`` chunks of ``chunk_size`` documents go to a process
+        pool; each worker builds its analyzer once.
+        """
+        if n_jobs == 1:
+            return map(self.analyze_document, texts)
+        batches = parallel_map(_analyze_batch, chunked(texts, chunk_size), n_jobs, initializer=_init_worker)
+        return (document for batch in batches for document in batch)
+    
+    def _scan(self, flags: Iterable[Optional[int]]) -> Tuple[int, int, int, bool, bool]:
+        """One pass over word flags.
         
-        rel_pronoun = self._find_relative(words)
-        if rel_pronoun:
+        Returns the positions of the first relative pronoun, 'la' and 'di'
+        (-1 when absent; the scan stops at a relative pronoun) and whether a
+        determiner occurs before 'la' / right before it.
+        """
+        la_idx = di_idx = last_determiner = -1
+        dp1_is_definite = dp2_is_definite = False
+        for i, f in enumerate(flags):
+            if not f:
+                continue
+            if f & RELATIVE_WORD:
+                return i, la_idx, di_idx, dp1_is_definite, dp2_is_definite
+            if f & LA_WORD:
+                if la_idx < 0:
+                    la_idx = i
+                    dp1_is_definite = last_determiner >= 0
+                    dp2_is_definite = i > 0 and last_determiner == i - 1
+            elif f & DI_WORD and di_idx < 0:
+                di_idx = i
+            if f & DETERMINER_WORD:
+                last_determiner = i
+        return -1, la_idx, di_idx, dp1_is_definite, dp2_is_definite
+    
+    def _analyze(self, tokens: Sequence[str], words: Sequence[str],
+                 scan: Tuple[int, int, int, bool, bool]) -> ClauseAnalysis:
+        rel_idx, la_idx, di_idx, dp1_is_definite, dp2_is_definite = scan
+        
+        if rel_idx >= 0:
             return ClauseAnalysis(
                 structure=ClauseStructure.RELATIVE,
                 copular_type=None,
                 dp1=None, dp2=None,
                 particle=None,
                 is_relative=True,
-                relative_pronoun=rel_pronoun
+                relative_pronoun=words[rel_idx]
             )
         
-        if 'la' in words:
-            return self._analyze_la_sentence(tokens, words)
+        if la_idx >= 0:
+            return self._analyze_la_sentence(tokens, la_idx, dp1_is_definite, dp2_is_definite)
         
-        for i, w in enumerate(words):
-            if w.endswith('a') and i == 0 and 'di' in words:
-                return self._analyze_a_sentence(tokens, words)
+        if di_idx >= 0 and words[0] is not None and words[0].endswith('a'):
+            return self._analyze_a_sentence(tokens, di_idx)
         
         return ClauseAnalysis(
             structure=ClauseStructure.SIMPLE,
@@ -56,20 +152,11 @@ class ClauseAnalyzer:
             is_relative=False, relative_pronoun=None
         )
     
-    def _find_relative(self, words: List[str]) -> Optional[str]:
-        for w in words:
-            if w in RELATIVE_PRONOUNS:
-                return w
-        return None
-    
-    def _analyze_la_sentence(self, tokens: List[str], words: List[str]) -> ClauseAnalysis:
-        la_idx = words.index('la')
+    def _analyze_la_sentence(self, tokens: Sequence[str], la_idx: int,
+                             dp1_is_definite: bool, dp2_is_definite: bool) -> ClauseAnalysis:
         dp1 = tokens[0] if la_idx > 0 else None
         dp2 = tokens[la_idx - 1] if la_idx > 1 else None
         
-        dp1_is_definite = self._is_definite(tokens[:la_idx] if la_idx > 0 else [])
-        dp2_is_definite = self._is_definite([tokens[la_idx-1]] if la_idx > 0 else [])
-        
         if dp1_is_definite and not dp2_is_definite:
             copular_type = CopularType.PREDICATIONAL
         elif not dp1_is_definite and dp2_is_definite:
@@ -84,10 +171,9 @@ class ClauseAnalyzer:
             is_relative=False, relative_pronoun=None
         )
     
-    def _analyze_a_sentence(self, tokens: List[str], words: List[str]) -> ClauseAnalysis:
-        dp1 = tokens[0].rstrip('a') if tokens else None
-        di_idx = words.index('di') if 'di' in words else -1
-        dp2 = tokens[di_idx + 1] if di_idx >= 0 and di_idx + 1 < len(tokens) else None
+    def _analyze_a_sentence(self, tokens: Sequence[str], di_idx: int) -> ClauseAnalysis:
+        dp1 = tokens[0].rstrip('a')
+        dp2 = tokens[di_idx + 1] if di_idx + 1 < len(tokens) else None
         
         return ClauseAnalysis(
             structure=ClauseStructure.A_SENTENCE,
@@ -95,12 +181,29 @@ class ClauseAnalyzer:
             dp1=dp1, dp2=dp2, particle='a',
             is_relative=False, relative_pronoun=None
         )
+
+class _IdWords:
+    """Words of an id array, decoded only at the positions an analysis reports."""
     
-    def _is_definite(self, tokens: List[str]) -> bool:
-        for t in tokens:
-            if t.lower() in ALL_DETERMINERS:
-                return True
-        return False
+    def __init__(self, vocab: Vocabulary, ids: Sequence[int]):
+        self.vocab = vocab
+        self.ids = ids
+    
+    def __getitem__(self, i: int) -> Optional[str]:
+        idx = self.ids[i]
+        return self.vocab[idx] if idx >= 0 else None
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+
+_WORKER_ANALYZER: Optional[ClauseAnalyzer] = None
+
+def _init_worker():
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = ClauseAnalyzer()
+
+def _analyze_batch(texts: List[str]) -> List[List[Tuple[Sentence, ClauseAnalysis]]]:
+    return [_WORKER_ANALYZER.analyze_document(text) for text in texts]
 
 def analyze_clause(tokens: List[str]) -> ClauseAnalysis:
-    return ClauseAnalyzer().analyze(tokens)
\ No newline at end of file
+    return ClauseAnalyzer().analyze(tokens)
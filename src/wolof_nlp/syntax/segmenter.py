@@ -0,0 +1,108 @@
+"""Sentence Segmenter - Splits Wolof paragraphs on the tokenizer's punctuation tokens"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from ..core.tokenizer import WolofTokenizer, Token, TokenType
+
+# Words that end with a period without ending the sentence: "Dr. Diop", "S. Touba" (capital single letters are always initials)
+ABBREVIATIONS = frozenset([
+    'dr', 'pr', 'me', 'mme', 'mlle', 'mr', 'st', 'ste', 'sr', 'av', 'bd', 'cf', 'vol', 'art', 'tel', 'ex',
+])
+
+_TERMINALS = frozenset('.!?…')
+_CLOSING = frozenset('»")]\'”’')
+_PARAGRAPH_BREAK = re.compile(r'\n[ \t\r]*\n\s*')
+
+
+@dataclass
+class Sentence:
+    """One sentence: ``tokens[start_token:end_token]`` of the document, ``[start:end]`` of its normalized text."""
+    text: str
+    start: int
+    end: int
+    start_token: int
+    end_token: int
+    tokens: List[Token]
+
+    @property
+    def words(self) -> List[Token]:
+        return [t for t in self.tokens if t.type == TokenType.WORD]
+
+
+def _is_terminal(token: Token) -> bool:
+    return token.type == TokenType.PUNCTUATION and all(c in _TERMINALS for c in token.text)
+
+
+class SentenceSegmenter:
+    """Sentence boundaries from a token stream.
+
+    A sentence ends at a run of ``. ! ? …`` (closing quotes and brackets
+    stay with it) or at a blank line. A period after an abbreviation or a
+    capital initial does not end a sentence, nor does an ellipsis
+    followed by a lowercase word ("dafa dem... mu ñëw").
+    """
+
+    def __init__(self, tokenizer: Optional[WolofTokenizer] = None):
+        self.tokenizer = tokenizer or WolofTokenizer(normalize=True, detect_language=True)
+
+    def split(self, tokens: Sequence[Token], text: Optional[str] = None) -> List[Tuple[int, int]]:
+        """Half-open token index ranges, one per sentence; ``text`` (the normalized text) enables blank-line breaks."""
+        spans = []
+        start = 0
+        n = len(tokens)
+        i = 0
+        while i < n:
+            token = tokens[i]
+            if i > start and text is not None and '\n\n' in text[tokens[i - 1].end:token.start]:
+                spans.append((start, i))
+                start = i
+            if not _is_terminal(token) or not self._ends_sentence(tokens, i, text):
+                i += 1
+                continue
+            i += 1
+            while i < n and tokens[i].type == TokenType.PUNCTUATION and (
+                    _is_terminal(tokens[i]) or tokens[i].text in _CLOSING):
+                i += 1
+            spans.append((start, i))
+            start = i
+        if start < n:
+            spans.append((start, n))
+        return spans
+
+    def _ends_sentence(self, tokens: Sequence[Token], i: int, text: Optional[str]) -> bool:
+        mark = tokens[i].text
+        if mark == '.' and i > 0:
+            prev = tokens[i - 1]
+            if prev.type == TokenType.WORD and not prev.is_split and prev.end == tokens[i].start and (
+                    len(prev.text) == 1 and prev.text.isupper() or prev.text.lower() in ABBREVIATIONS):
+                return False
+        if mark in ('...', '…') and i + 1 < len(tokens):
+            nxt = tokens[i + 1]
+            # Split tokens ("Dañuy" -> da ñu y) are lowercased; the text keeps the original case
+            first = text[nxt.start] if text is not None and nxt.is_split else nxt.text[0]
+            if nxt.type == TokenType.WORD and first.islower():
+                return False
+        return True
+
+    def normalize_text(self, text: str) -> str:
+        """The tokenizer's normalized text with paragraph breaks kept as blank lines; sentence offsets index into it."""
+        return '\n\n'.join(self.tokenizer.normalize_text(p) for p in _PARAGRAPH_BREAK.split(text))
+
+    def segment(self, text: str) -> List[Sentence]:
+        """Tokenize ``text`` once and cut the token stream into sentences."""
+        if not text:
+            return []
+        clean_text = self.normalize_text(text)
+        tokens = self.tokenizer.tokenize_normalized(clean_text)
+        sentences = []
+        for start, end in self.split(tokens, clean_text):
+            first, last = tokens[start], tokens[end - 1]
+            sentences.append(Sentence(clean_text[first.start:last.end], first.start, last.end,
+                                      start, end, tokens[start:end]))
+        return sentences
+
+
+def segment_sentences(text: str) -> List[str]:
+    return [s.text for s in SentenceSegmenter().segment(text)]
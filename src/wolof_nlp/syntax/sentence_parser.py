@@ -1,14 +1,83 @@
 """Wolof Sentence Parser - Based on Martinović's analysis of clause structure"""
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 from enum import Enum, auto
 
 from ..core.constants import (
     SUBJECT_FOCUS, VERB_FOCUS, PRESENTATIVE, PERFECT, FUTURE, NEGATIVE_FUTURE,
     PROHIBITIVE, SUBJECT_CLITICS, OBJECT_CLITICS, INTERROGATIVES, SENTENCE_PARTICLES
 )
+from ..core.parallel import chunked, parallel_map
 from ..core.tokenizer import WolofTokenizer, Token, TokenType
+from .segmenter import Sentence, SentenceSegmenter
+
+# Feature bits of one lowercased word
+INTERROGATIVE_WORD = 1
+NEGATION_WORD = 2          # negative marker or negative verb suffix
+PARTICLE_WORD = 4          # sentence particle, or starts with a focus/TAM marker
+VERB_FOCUS_WORD = 8
+SUBJECT_FOCUS_WORD = 16
+PRESENTATIVE_WORD = 32
+SUBJECT_CLITIC_WORD = 64
+NON_VERB = 128             # marker, clitic or determiner: never the main verb
+LA_WORD = 256
+HAS_A = 512
+FINAL_A = 1024
+FINAL_AL = 2048
+LONG_WORD = 4096           # more than three letters
+RAISING_PARTICLE = 8192    # clause types a particle selects
+NEUTRAL_PARTICLE = 16384
+CONDITIONAL_PARTICLE = 32768
+
+_FOCUS_TAM_MARKERS = SUBJECT_FOCUS | VERB_FOCUS | PRESENTATIVE | FUTURE | NEGATIVE_FUTURE
+_MARKER_PREFIXES = tuple(sorted(_FOCUS_TAM_MARKERS))
+_NEGATION_MARKERS = frozenset(['du', 'duma', 'doo', 'dunu', 'duñu', 'bul', 'bañ'])
+_NEGATION_SUFFIXES = ('ul', 'uma', 'uloo', 'unu', 'uleen', 'uñu', 'wul')
+_DETERMINERS = frozenset(['bi', 'gi', 'ji', 'ki', 'yi', 'ñi'])
+_NON_VERBS = _FOCUS_TAM_MARKERS | SUBJECT_CLITICS | OBJECT_CLITICS | _DETERMINERS
+
+def word_features(w: str) -> int:
+    """Feature bits of the lowercased word ``w``."""
+    bits = 0
+    if w in INTERROGATIVES:
+        bits |= INTERROGATIVE_WORD
+    if w in _NEGATION_MARKERS or w.endswith(_NEGATION_SUFFIXES):
+        bits |= NEGATION_WORD
+    if w in SENTENCE_PARTICLES or w.startswith(_MARKER_PREFIXES):
+        bits |= PARTICLE_WORD
+    if w in VERB_FOCUS:
+        bits |= VERB_FOCUS_WORD
+    if w in SUBJECT_FOCUS:
+        bits |= SUBJECT_FOCUS_WORD
+    if w in PRESENTATIVE:
+        bits |= PRESENTATIVE_WORD
+    if w in SUBJECT_CLITICS:
+        bits |= SUBJECT_CLITIC_WORD
+    if w in _NON_VERBS:
+        bits |= NON_VERB
+    if w == 'la':
+        bits |= LA_WORD
+    if 'a' in w:
+        bits |= HAS_A
+    if w.endswith('a'):
+        bits |= FINAL_A
+    if w.endswith('al'):
+        bits |= FINAL_AL
+    if len(w) > 3:
+        bits |= LONG_WORD
+    if w in VERB_FOCUS or w in PRESENTATIVE or w in FUTURE or w in NEGATIVE_FUTURE:
+        bits |= RAISING_PARTICLE
+    elif w == 'na' or w in PERFECT:
+        bits |= NEUTRAL_PARTICLE
+    elif w in PROHIBITIVE or w.startswith(('bu', 'su')):
+        bits |= CONDITIONAL_PARTICLE
+    return bits
+
+# Every word of the marker tables, so common sentences need no feature computation at all
+MARKER_WORDS = frozenset(
+    _NON_VERBS | _NEGATION_MARKERS | PERFECT | PROHIBITIVE | INTERROGATIVES | frozenset(SENTENCE_PARTICLES)
+)
 
 class ClauseType(Enum):
     V_RAISING = auto()
@@ -44,26 +113,79 @@ class SentenceAnalysis:
         return f"SentenceAnalysis(type={self.clause_type.name}, focus={self.focus_type.name})"
 
 class SentenceParser:
-    def __init__(self):
+    def __init__(self, max_types: int = 100000):
+        """``max_types`` bounds the per-word feature memo: past it the memo is reset to the marker words."""
         self.tokenizer = WolofTokenizer(normalize=True, detect_language=True)
+        self.segmenter = SentenceSegmenter(self.tokenizer)
+        self.max_types = max_types
+        self.features = {w: word_features(w) for w in MARKER_WORDS}
     
     def parse(self, sentence: str) -> SentenceAnalysis:
         tokens = self.tokenizer.tokenize(sentence)
         word_tokens = [t for t in tokens if t.type == TokenType.WORD]
+        return self._analyze(word_tokens, sentence.strip().endswith('?'))
+    
+    def parse_document(self, text: str) -> List[Tuple[Sentence, SentenceAnalysis]]:
+        """Segment ``text`` into sentences and analyze each from the one token stream."""
+        return [(s, self._analyze(s.words, s.text.endswith('?'))) for s in self.segmenter.segment(text)]
+    
+    def parse_many(self, texts: Iterable[str], n_jobs: int = 1,
+                   chunk_size: int = 64) -> Iterator[List[Tuple[Sentence, SentenceAnalysis]]]:
+        """``parse_document`` over a stream of documents, yielding results in input order.
         
+        With ``n_jobs != 1`` chunks of ``chunk_size`` documents go to a process
+        pool; each worker builds its parser once.
+        """
+        if n_jobs == 1:
+            return map(self.parse_document, texts)
+        batches = parallel_map(_parse_batch, chunked(texts, chunk_size), n_jobs, initializer=_init_worker)
+        return (document for batch in batches for document in batch)
+    
+    def _analyze(self, word_tokens: List[Token], question_mark: bool) -> SentenceAnalysis:
+        """Fill every field in one pass over the words' feature bits."""
         if not word_tokens:
             return self._empty_analysis()
         
-        words = [t.text.lower() for t in word_tokens]
+        features = self.features
+        if len(features) > self.max_types:
+            features = self.features = {w: word_features(w) for w in MARKER_WORDS}
+        n = len(word_tokens)
+        seen = head = 0
+        long_words = 0
+        particle = particle_bits = verb = None
+        focus_type, focused_elem = FocusType.NONE, None
+        
+        for i, token in enumerate(word_tokens):
+            w = token.text.lower()
+            bits = features.get(w)
+            if bits is None:
+                bits = features[w] = word_features(w)
+            seen |= bits
+            if i < 2:
+                head |= bits
+            if bits & LONG_WORD:
+                long_words += 1
+            if particle is None and bits & PARTICLE_WORD:
+                particle, particle_bits = w, bits
+            if verb is None and not bits & NON_VERB:
+                verb = token.text
+            if focus_type is FocusType.NONE:
+                if bits & VERB_FOCUS_WORD:
+                    focus_type = FocusType.VERB
+                elif ((bits & SUBJECT_FOCUS_WORD or (bits & FINAL_A and i == 0 and n > 1))
+                      and bits & HAS_A and i < n - 1):
+                    focus_type = FocusType.SUBJECT
+                    focused_elem = word_tokens[0].text if i == 0 else None
+                elif bits & LA_WORD and i > 0:
+                    focus_type, focused_elem = FocusType.COMPLEMENT, word_tokens[i - 1].text
+        
+        clause_type = self._determine_clause_type(seen, head, particle_bits, focus_type)
         
-        is_question = any(w in INTERROGATIVES for w in words) or sentence.strip().endswith('?')
-        is_negative = self._detect_negation(words)
-        particle = self._find_sentence_particle(words)
-        focus_type, focused_elem = self._detect_focus(words, word_tokens)
-        clause_type = self._determine_clause_type(words, particle, focus_type, is_question)
-        subject = self._find_subject(word_tokens, clause_type)
-        verb = self._find_verb(word_tokens, clause_type)
-        has_clitic = self._has_clitic_doubling(words)
+        subject = None
+        if clause_type in (ClauseType.SUBJECT_FOCUS, ClauseType.V_RAISING):
+            first = word_tokens[0]
+            if not features[first.text.lower()] & (VERB_FOCUS_WORD | PRESENTATIVE_WORD):
+                subject = first.text
         
         return SentenceAnalysis(
             clause_type=clause_type,
@@ -72,9 +194,9 @@ class SentenceParser:
             subject=subject,
             verb=verb,
             focused_element=focused_elem,
-            is_negative=is_negative,
-            is_question=is_question,
-            has_clitic_doubling=has_clitic
+            is_negative=bool(seen & NEGATION_WORD),
+            is_question=bool(seen & INTERROGATIVE_WORD) or question_mark,
+            has_clitic_doubling=bool(seen & SUBJECT_CLITIC_WORD) and long_words > 1
         )
     
     def _empty_analysis(self) -> SentenceAnalysis:
@@ -90,32 +212,10 @@ class SentenceParser:
             has_clitic_doubling=False
         )
     
-    def _find_sentence_particle(self, words: List[str]) -> Optional[str]:
-        for w in words:
-            if w in SENTENCE_PARTICLES:
-                return w
-            for marker in SUBJECT_FOCUS | VERB_FOCUS | PRESENTATIVE | FUTURE | NEGATIVE_FUTURE:
-                if w == marker or w.startswith(marker):
-                    return w
-        return None
-    
-    def _detect_focus(self, words: List[str], tokens: List[Token]) -> Tuple[FocusType, Optional[str]]:
-        for i, w in enumerate(words):
-            if w in VERB_FOCUS:
-                return FocusType.VERB, None
-            
-            if w in SUBJECT_FOCUS or (w.endswith('a') and i == 0 and len(words) > 1 and w not in VERB_FOCUS):
-                if 'a' in w and i < len(words) - 1:
-                    return FocusType.SUBJECT, tokens[0].text if i == 0 else None
-            
-            if w == 'la' and i > 0:
-                return FocusType.COMPLEMENT, tokens[i-1].text if i > 0 else None
-        
-        return FocusType.NONE, None
-    
-    def _determine_clause_type(self, words: List[str], particle: Optional[str], 
-                               focus_type: FocusType, is_question: bool) -> ClauseType:
-        if is_question and any(w in INTERROGATIVES for w in words):
+    def _determine_clause_type(self, seen: int, head: int, particle_bits: Optional[int],
+                               focus_type: FocusType) -> ClauseType:
+        """``seen``/``head``: union of the feature bits of all words / the first two words."""
+        if seen & INTERROGATIVE_WORD:
             return ClauseType.WH_RAISING
         
         if focus_type == FocusType.SUBJECT:
@@ -127,57 +227,30 @@ class SentenceParser:
         if focus_type == FocusType.COMPLEMENT:
             return ClauseType.COMPLEMENT_FOCUS
         
-        if particle:
-            if particle in VERB_FOCUS:
+        if particle_bits is not None:
+            if particle_bits & RAISING_PARTICLE:
                 return ClauseType.V_RAISING
-            if particle in PRESENTATIVE:
-                return ClauseType.V_RAISING
-            if particle in FUTURE or particle in NEGATIVE_FUTURE:
-                return ClauseType.V_RAISING
-            if particle == 'na' or particle in PERFECT:
+            if particle_bits & NEUTRAL_PARTICLE:
                 return ClauseType.NEUTRAL
-            if particle in PROHIBITIVE or particle.startswith('bu') or particle.startswith('su'):
+            if particle_bits & CONDITIONAL_PARTICLE:
                 return ClauseType.CONDITIONAL
         
-        if any(w.endswith('al') for w in words[:2]):
+        if head & FINAL_AL:
             return ClauseType.IMPERATIVE
         
         return ClauseType.UNKNOWN
-    
-    def _detect_negation(self, words: List[str]) -> bool:
-        neg_markers = {'du', 'duma', 'doo', 'dunu', 'duñu', 'bul', 'bañ'}
-        neg_suffixes = ['ul', 'uma', 'uloo', 'unu', 'uleen', 'uñu', 'wul']
-        
-        if any(w in neg_markers for w in words):
-            return True
-        if any(any(w.endswith(suf) for suf in neg_suffixes) for w in words):
-            return True
-        return False
-    
-    def _find_subject(self, tokens: List[Token], clause_type: ClauseType) -> Optional[str]:
-        if not tokens:
-            return None
-        
-        if clause_type in [ClauseType.SUBJECT_FOCUS, ClauseType.V_RAISING]:
-            first = tokens[0].text.lower()
-            if first not in VERB_FOCUS and first not in PRESENTATIVE:
-                return tokens[0].text
-        
-        return None
-    
-    def _find_verb(self, tokens: List[Token], clause_type: ClauseType) -> Optional[str]:
-        for t in tokens:
-            w = t.text.lower()
-            if w not in (SUBJECT_FOCUS | VERB_FOCUS | PRESENTATIVE | FUTURE | 
-                        NEGATIVE_FUTURE | SUBJECT_CLITICS | OBJECT_CLITICS):
-                if not any(w == det for det in ['bi', 'gi', 'ji', 'ki', 'yi', 'ñi']):
-                    return t.text
-        return None
-    
-    def _has_clitic_doubling(self, words: List[str]) -> bool:
-        has_clitic = any(w in SUBJECT_CLITICS for w in words)
-        has_full_noun = len([w for w in words if len(w) > 3]) > 1
-        return has_clitic and has_full_noun
+
+_WORKER_PARSER: Optional[SentenceParser] = None
+
+def _init_worker():
+    global _WORKER_PARSER
+    _WORKER_PARSER = SentenceParser()
+
+def _parse_batch(texts: List[str]) -> List[List[Tuple[Sentence, SentenceAnalysis]]]:
+    return [_WORKER_PARSER.parse_document(text) for text in texts]
 
 def parse_sentence(sentence: str) -> SentenceAnalysis:
-    return SentenceParser().parse(sentence)
\ No newline at end of file
+    return SentenceParser().parse(sentence)
+
+def parse_document(text: str) -> List[Tuple[Sentence, SentenceAnalysis]]:
+    return SentenceParser().parse_document(text)
\ No newline at end of file
@@ -135,3 +135,692 @@ class TestGlosser:
             assert hasattr(word, 'wolof')
             assert hasattr(word, 'gloss')
             assert hasattr(word, 'translation')
+
+
+class TestAnalyzeMany:
+    
+    def test_matches_single_word_analysis(self):
+        from wolof_nlp.morphology import MorphologyAnalyzer
+        analyzer = MorphologyAnalyzer()
+        words = ["bindkat", "demul", "Demul", "gisante", "xale", "bindkat"]
+        table = analyzer.analyze_many(words)
+        assert len(table) == len(words)
+        for i, word in enumerate(words):
+            assert table.morphemes(i) == analyzer.analyze(word)
+        pooled = analyzer.analyze_many(words, n_jobs=2, chunk_size=2)
+        assert [pooled.morphemes(i) for i in range(len(words))] == [table.morphemes(i) for i in range(len(words))]
+    
+    def test_deduplicates_types(self):
+        from wolof_nlp.morphology import MorphologyAnalyzer
+        table = MorphologyAnalyzer().analyze_many(["demul", "Demul", "demul", "bindkat"])
+        assert len(table.types) == 2
+        assert table.index[0] == table.index[1] == table.index[2]
+        assert table.root(3) == "bind"
+
+
+class TestParadigmTable:
+    
+    def test_reverse_lookup(self):
+        from wolof_nlp.morphology import ParadigmTable
+        table = ParadigmTable.build(["dem", "gis"])
+        analyses = table.lookup("dafa dem")
+        assert any(a.root == "dem" and a.tam == "verb_focus" and a.person == 3 for a in analyses)
+        assert any(a.derivation == "reciprocal" for a in table.lookup("gisante"))
+    
+    def test_save_and_open(self, tmp_path):
+        from wolof_nlp.morphology import ParadigmTable
+        table = ParadigmTable.build(["dem", "lekk"])
+        path = str(tmp_path / "paradigms.tsv")
+        table.save(path)
+        with ParadigmTable.open(path) as mapped:
+            for form in ["dem naa", "lekkaat", "dinañu dem"]:
+                assert mapped.lookup(form) == table.lookup(form)
+            assert mapped.lookup("xyz") == []
+
+
+class TestLemmatizeTokens:
+    
+    def test_lemma_ids_match_lemmatize(self):
+        from wolof_nlp.morphology import Lemmatizer
+        lemmatizer = Lemmatizer()
+        words = ["demul", "bindkat", "gisante", "dem", "Demul"]
+        result = lemmatizer.lemmatize_tokens(words)
+        assert [result.lemma(i) for i in range(len(words))] == [lemmatizer.get_lemma(w) for w in words]
+        assert result.lemma_ids[0] == result.lemma_ids[3] == result.lemma_ids[4]
+    
+    def test_feature_bitmask(self):
+        from wolof_nlp.morphology import Lemmatizer, feature_names
+        result = Lemmatizer().lemmatize_tokens(["demul", "dem"])
+        assert feature_names(result.features[0]) == ["negation"]
+        assert result.features[1] == 0
+
+
+class TestDictionaryIndex:
+
+    def test_search_matches_scan(self):
+        from wolof_nlp.lexicon import Dictionary
+        dictionary = Dictionary()
+        entries = list(dictionary.entries.values())
+        assert dictionary.search("ee", "wolof") == [e for e in entries if "ee" in e.wolof]
+        assert dictionary.search("être", "french") == [e for e in entries if "être" in e.french.lower()]
+        assert dictionary.search("Go") == [e for e in entries
+                                           if "go" in e.wolof or "go" in e.french.lower() or "go" in e.english.lower()]
+    
+    def test_prefix_and_secondary_indexes(self):
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry
+        dictionary = Dictionary()
+        assert "bëgg" in [e.wolof for e in dictionary.prefix_search("lov", "english")]
+        assert all(e.pos == "verb" for e in dictionary.get_by_pos("verb"))
+        assert [e.wolof for e in dictionary.get_by_noun_class("K")] == ["nit"]
+    
+    def test_add_is_local_to_instance(self):
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry, translate
+        from wolof_nlp.lexicon.dictionary import DICTIONARY
+        size = len(DICTIONARY)
+        first, second = Dictionary(), Dictionary()
+        assert second.search("ndoxx") == []
+        first.add(DictionaryEntry("ndoxx", "eau salée", "salt water", "noun", "M"))
+        assert first.lookup("ndoxx").english == "salt water"
+        assert [e.wolof for e in first.search("ndoxx")] == ["ndoxx"]
+        assert len(DICTIONARY) == size
+        assert second.lookup("ndoxx") is None and second.search("ndoxx") == []
+        assert translate("ndoxx") is None
+
+
+class TestFuzzyLookup:
+
+    def test_noisy_spellings(self):
+        from wolof_nlp.lexicon import Dictionary
+        dictionary = Dictionary()
+        for spelling in ["beug", "begg", "bëg"]:
+            entry, distance = dictionary.fuzzy_lookup(spelling)[0]
+            assert entry.wolof == "bëgg"
+            assert distance <= 1
+    
+    def test_distance_budget(self):
+        from wolof_nlp.lexicon import FuzzyIndex
+        index = FuzzyIndex(max_distance=2)
+        index.add("lekk")
+        assert index.lookup("lekkk", max_distance=1) == [("lekk", 1)]
+        assert index.lookup("lxxkk", max_distance=1) == []
+
+
+class TestDictionaryBackends:
+
+    def test_sqlite_matches_memory(self):
+        from wolof_nlp.lexicon import Dictionary, SQLiteBackend
+        from wolof_nlp.lexicon.dictionary import DICTIONARY
+        memory = Dictionary()
+        sqlite = Dictionary(SQLiteBackend.from_entries(DICTIONARY.values()), cache_size=16)
+        for query in ["xam", "to", "lov", "être"]:
+            assert sqlite.search(query) == memory.search(query)
+            assert sqlite.prefix_search(query) == memory.prefix_search(query)
+        assert sqlite.get_by_pos("verb") == memory.get_by_pos("verb")
+        words = ["xam", "Lekk", "unknownword"]
+        assert sqlite.lookup_many(words) == memory.lookup_many(words)
+        assert sqlite.translate("xam") == "know"
+    
+    def test_cache_and_default_dictionary(self):
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry, MemoryBackend, translate, set_default_dictionary
+        dictionary = Dictionary(MemoryBackend(), cache_size=2)
+        assert dictionary.lookup("ndox") is None
+        dictionary.add(DictionaryEntry("ndox", "eau", "water", "noun", "M"))
+        assert dictionary.lookup("ndox").english == "water"
+        set_default_dictionary(dictionary)
+        try:
+            assert translate("ndox") == "water"
+            assert translate("xam") is None
+        finally:
+            set_default_dictionary(None)
+        assert translate("xam") == "know"
+    
+    def test_add_reaches_indexes(self):
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry, SQLiteBackend
+        from wolof_nlp.lexicon.dictionary import DICTIONARY
+        entry = DictionaryEntry("ndoxx", "eau salée", "salt water", "noun", "M")
+        cached = Dictionary(cache_size=8)
+        assert cached.index.search("ndoxx") == []
+        cached.add(entry)
+        assert cached.index.search("ndoxx") == cached.search("ndoxx") == [entry]
+        sqlite = Dictionary(SQLiteBackend.from_entries(DICTIONARY.values()))
+        assert sqlite.backend.has_fts
+        assert len(sqlite.index) == len(DICTIONARY)
+        sqlite.add(entry)
+        assert sqlite.search("SALÉE") == sqlite.index.search("salée") == [entry]
+        assert sqlite.search('"x') == []
+
+
+class TestLexiconReverseMaps:
+
+    def test_multi_label_pos(self):
+        from wolof_nlp.lexicon import Lexicon
+        lex = Lexicon()
+        assert lex.lookup_pos("Naan") == "VERB"
+        assert lex.lookup_pos_all("naan") == ("VERB", "NOUN")
+        assert lex.lookup_pos_many(["dem", "xale", "xyz"]) == ["VERB", "NOUN", None]
+    
+    def test_noun_class_batch(self):
+        from wolof_nlp.lexicon import Lexicon
+        lex = Lexicon()
+        assert lex.detect_noun_class_many(["bi", "GI", "ki", "xyz"]) == ["B", "G", "K", None]
+
+
+class TestFrequency:
+
+    def test_exact_counter_merges(self):
+        from collections import Counter
+        from wolof_nlp.lexicon import FrequencyCounter, word_frequency
+        tokens = "Xam xam nga a lekk ak xale yi , xale bi lekk".split()
+        expected = Counter(t.lower() for t in tokens if len(t) > 1).most_common(3)
+        assert word_frequency(tokens, 3) == expected
+        left = FrequencyCounter().update(tokens[:5])
+        right = FrequencyCounter().update(tokens[5:])
+        assert left.merge(right).most_common(3) == expected
+        assert FrequencyCounter.from_dict(left.to_dict())["xale"] == 2
+    
+    def test_sketch_heavy_hitters(self, tmp_path):
+        from wolof_nlp.lexicon import CountMinSketch, count_frequencies, load_counter
+        batches = [["dem"] * 50 + ["lekk"] * 20 + [f"w{i}" for i in range(100)]] * 3
+        sketch = count_frequencies(batches, sketch=True, width=512, heavy_hitters=5)
+        assert [w for w, _ in sketch.most_common(2)] == ["dem", "lekk"]
+        assert sketch.estimate("dem") >= 150
+        sketch.save(tmp_path / "freq.json")
+        assert isinstance(load_counter(tmp_path / "freq.json"), CountMinSketch)
+
+
+class TestExpressionMatching:
+
+    def test_whole_word_spans(self):
+        from wolof_nlp.lexicon import Collocations
+        collocations = Collocations()
+        text = "Na nga def? Dafa baax na"
+        spans = collocations.find_expression_spans(text)
+        assert [(text[s:e], expr[2]) for s, e, expr in spans] == [("Na nga def", "how are you"),
+                                                                  ("Dafa baax", "it is well")]
+        assert [e[0] for e in collocations.find_expression(text)] == ["na nga def", "dafa baax", "baax na"]
+        assert collocations.find_expression("dafa baaxna") == []
+    
+    def test_automaton_and_pair_index(self):
+        from wolof_nlp.core import AhoCorasick
+        from wolof_nlp.lexicon import Collocations
+        matcher = AhoCorasick([("he", 1), ("she", 2), ("hers", 3)], whole_words=False)
+        assert matcher.find_all("ushers") == [(1, 4, 2), (2, 4, 1), (2, 6, 3)]
+        assert Collocations().is_collocation("Amul", "dara")
+        assert not Collocations().is_collocation("dara", "amul")
+
+
+class TestCollocationMiner:
+
+    def _sentences(self):
+        return [["dafa", "lekk", "ceeb", "bi"], ["ñu", "lekk", "ceeb"], ["lekk", "ceeb", "ak", "jën"],
+                ["dafa", "dem"], ["mu", "dem", "kër"], ["amul", "dara"]] * 5
+    
+    def test_scores_and_export(self):
+        from wolof_nlp.lexicon import CollocationMiner
+        miner = CollocationMiner(min_count=3).feed(self._sentences())
+        assert miner.count("lekk", "ceeb") == 15
+        for measure in ("pmi", "t_score", "llr"):
+            assert miner.top(10, measure)
+        assert miner.top(1, "t_score")[0][:2] == ("lekk", "ceeb")
+        assert ("lekk", "ceeb", "eat rice") in miner.export(10)
+    
+    def test_merge_and_prune(self):
+        from wolof_nlp.lexicon import CollocationMiner
+        sentences = self._sentences()
+        whole = CollocationMiner().feed(sentences)
+        left = CollocationMiner().feed(sentences[:13])
+        merged = left.merge(CollocationMiner().feed(sentences[13:]))
+        assert sorted(merged.score()) == sorted(whole.score())
+        bounded = CollocationMiner(max_pairs=4).feed(sentences)
+        assert len(bounded.pairs) <= 4 and bounded.prune_floor > 0
+
+
+class TestProverbIndex:
+
+    def test_ranked_retrieval(self):
+        from wolof_nlp.lexicon import ProverbCollection
+        collection = ProverbCollection()
+        assert collection.retrieve("monkey", 1)[0].wolof == "Ndank-ndank mooy jàpp golo ci ñaay"
+        assert collection.retrieve("singe", 1)[0].theme == "patience"
+        assert collection.get_by_theme("Wisdom") == [p for p in collection.proverbs if p.theme == "wisdom"]
+    
+    def test_jsonl_and_persistence(self, tmp_path):
+        import json
+        from wolof_nlp.lexicon import ProverbIndex
+        rows = [{"wolof": "Loxo benn du taar", "french": "Une main ne peut applaudir",
+                 "english": "One hand cannot clap", "theme": "solidarity"},
+                {"wolof": "Jëf ja gën wax", "french": "L'action vaut mieux que la parole",
+                 "english": "Actions speak louder than words", "theme": "action"}]
+        source = tmp_path / "proverbs.jsonl"
+        source.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows), encoding="utf-8")
+        index = ProverbIndex.from_jsonl(source)
+        index.save(tmp_path / "index.json")
+        loaded = ProverbIndex.load(tmp_path / "index.json")
+        assert [p.theme for p, _ in loaded.search("jef action")] == ["action"]
+        assert loaded.search("clap") == index.search("clap")
+    
+    def test_shared_index_and_uncached_queries(self):
+        from wolof_nlp.lexicon import proverbs
+        assert proverbs.retrieve_proverbs("singe", 1)[0].theme == "patience"
+        index = proverbs.default_collection().index
+        lemmatizer = index.analyzer.lemmatizer
+        size = len(lemmatizer.vocab), len(lemmatizer._type_cache)
+        proverbs.retrieve_proverbs("xalyi dañuy dem ba dëkkbi", 3)
+        assert proverbs.default_collection().index is index
+        assert (len(lemmatizer.vocab), len(lemmatizer._type_cache)) == size
+
+
+class TestNERGazetteerAutomaton:
+
+    def test_multi_word_gazetteer_entries(self):
+        from wolof_nlp.applications import NERTagger
+        tagger = NERTagger()
+        entities = tagger.extract("Petite Côte ak Cap Vert")
+        assert [(e.text, e.label) for e in entities] == [("Petite Côte", "LOC"), ("Cap Vert", "LOC")]
+        entities = tagger.extract("Dama seetaan Pod et Marichou ci Sen TV")
+        assert [(e.text, e.label) for e in entities] == [("Pod et Marichou", "WORK"), ("Sen TV", "ORG")]
+    
+    def test_span_set(self):
+        from wolof_nlp.applications.ner import _SpanSet
+        spans = _SpanSet()
+        spans.add(10, 20)
+        spans.add(0, 5)
+        assert spans.overlaps(4, 6) and spans.overlaps(15, 30) and spans.overlaps(0, 100)
+        assert not spans.overlaps(5, 10) and not spans.overlaps(20, 25)
+
+
+class TestGazetteer:
+
+    def test_lookup_and_priority(self):
+        from wolof_nlp.core import Gazetteer
+        gazetteer = Gazetteer.from_sets({"place": ["Touba", "mbacké"], "surname": ["mbacké", "diop"]})
+        assert gazetteer.lookup("MBACKÉ") == ["place", "surname"]
+        assert gazetteer.best("diop") == "surname"
+        assert "touba" in gazetteer and "dakar" not in gazetteer
+        assert gazetteer.nbytes < 100
+    
+    def test_loaders_shared_with_ner(self, tmp_path):
+        from wolof_nlp.applications import NERTagger
+        from wolof_nlp.core import Gazetteer, default_gazetteer
+        source = tmp_path / "places.tsv"
+        source.write_text("Keur Massar\nNdiosmone\tplace\n", encoding="utf-8")
+        gazetteer = default_gazetteer().merge(Gazetteer.from_tsv(source, category="place"))
+        tagger = NERTagger(gazetteer=gazetteer)
+        assert tagger.tokenizer.gazetteer is gazetteer
+        entities = tagger.extract("Mu ngi dëkk Keur Massar ak Ndiosmone")
+        assert [(e.text, e.label) for e in entities] == [("Keur Massar", "LOC"), ("Ndiosmone", "LOC")]
+    
+    def test_place_named_surnames_stay_persons(self):
+        from wolof_nlp.applications import NERTagger
+        from wolof_nlp.applications.pos_tagger import POSTagger
+        tagger = NERTagger()
+        for text in ["Moussa Mbacké dem na", "Dafa gis Mbacke tey"]:
+            assert [(e.label, e.confidence) for e in tagger.extract(text) if e.text.lower().startswith("mbac")] == [
+                ("PER", 0.85)]
+        assert [(e.text, e.label) for e in tagger.extract("Dafa gis Kaolack tey")] == [("Kaolack", "LOC")]
+        assert POSTagger().tag("Mbacké")[0].pos == "PROPN.LOC"
+
+
+class TestNERBatch:
+
+    TEXTS = ["Moussa Diop dafa dem Dakar", "", "Dama seetaan Pod et Marichou ci Sen TV", "dafa baax"] * 3
+    
+    def test_extract_many_matches_extract(self):
+        from wolof_nlp.applications import NERTagger
+        tagger = NERTagger()
+        expected = [tagger.extract(text) for text in self.TEXTS]
+        assert list(tagger.extract_many(self.TEXTS)) == expected
+        assert list(tagger.extract_many(self.TEXTS, n_jobs=2, chunk_size=5)) == expected
+    
+    def test_columnar_table(self):
+        from wolof_nlp.applications import NERTagger, extract_entities
+        from wolof_nlp.applications.ner import ENTITY_LABELS, default_tagger
+        tagger = NERTagger()
+        table = tagger.extract_many(self.TEXTS, columnar=True)
+        flat = [(doc_id, e) for doc_id, text in enumerate(self.TEXTS) for e in tagger.extract(text)]
+        assert len(table) == len(flat)
+        assert [(table.doc_ids[i], table.entity(i)) for i in range(len(table))] == flat
+        assert ENTITY_LABELS[table.labels[0]] == "PER"
+        extract_entities("Dakar")
+        assert default_tagger() is default_tagger()
+
+
+class TestStatisticalPOS:
+
+    def test_untrained_model_matches_rules(self):
+        from wolof_nlp.applications import POSTagger
+        from wolof_nlp.applications.pos_tagger import new_model
+        text = "Xale bi dafa jàng téere. Moussa dem na Dakar, waaye du ñibbi"
+        rules = [(t.text, t.pos) for t in POSTagger().tag(text)]
+        assert [(t.text, t.pos) for t in POSTagger(model=new_model()).tag(text)] == rules
+    
+    def test_train_evaluate_and_save(self, tmp_path):
+        from wolof_nlp.applications import POSTagger, StructuredPerceptron
+        sentences = [[("xarit", "NOUN"), ("bu", "DET"), ("rafet", "ADJ")], [("xale", "NOUN"), ("bu", "DET"), ("ndaw", "ADJ")]]
+        tagger = POSTagger()
+        assert tagger.evaluate(sentences)["accuracy"] < 1.0
+        tagger.train(sentences)
+        report = tagger.evaluate(sentences)
+        assert report["accuracy"] == 1.0 and report["tokens"] == 6
+        tagger.model.save(tmp_path / "pos.json")
+        loaded = POSTagger(model=StructuredPerceptron.load(tmp_path / "pos.json"))
+        assert loaded.evaluate(sentences)["accuracy"] == 1.0
+
+
+class TestPOSTables:
+
+    def test_lexicon_table_keeps_check_order(self):
+        from wolof_nlp.applications.pos_tagger import POSTagger, LEXICON_TAGS, CONTEXT_TAGS
+        tagger = POSTagger()
+        assert LEXICON_TAGS["moo"] == ("TAM", 0.99)
+        assert tagger._classify_by_lexicon("Naan") == ("VERB", 0.95)
+        assert tagger._classify_by_lexicon("mbacké") == ("PROPN.LOC", 0.95)
+        assert tagger._classify_by_lexicon("xyz") == ("UNK", 0.0)
+        assert CONTEXT_TAGS["moo"] == ("VERB", 0.78)
+    
+    def test_combined_morphology_pattern(self):
+        from wolof_nlp.applications.pos_tagger import POSTagger
+        tagger = POSTagger()
+        assert tagger._classify_by_morphology("jàngul") == ("VERB.NEG", 0.88, "negation")
+        assert tagger._classify_by_morphology("Liggéeykat") == ("NOUN.AGENT", 0.90, "agent")
+        assert tagger._classify_by_morphology("dajante") == ("VERB.RECIP", 0.82, "reciprocal")
+        assert tagger._classify_by_morphology("ante") == (None, 0.0, None)
+        assert tagger._classify_by_morphology("waat") == (None, 0.0, None)
+        assert tagger._classify_by_morphology("kat") == (None, 0.0, None)
+
+
+class TestPOSTagMany:
+
+    TEXTS = ["Xale bi dafa jàng téere", "", "Vraiment magnifique", "Moussa dem na Dakar"] * 3
+    
+    def test_table_matches_tag(self):
+        from wolof_nlp.applications import POSTagger
+        tagger = POSTagger()
+        table = tagger.tag_many(self.TEXTS)
+        expected = [tagger.tag(text) for text in self.TEXTS]
+        assert len(table) == len(self.TEXTS)
+        assert table.n_tokens == sum(map(len, expected))
+        assert list(table) == expected
+        assert table.tag_sentence(0) == tagger.tag_sentence(self.TEXTS[0])
+        assert table.tag_ids.typecode == "B" and table.confidences.typecode == "f"
+    
+    def test_parallel_merge(self):
+        from wolof_nlp.applications import POSTagger
+        tagger = POSTagger()
+        table = tagger.tag_many(self.TEXTS, n_jobs=2, chunk_size=5)
+        assert list(table.offsets) == list(tagger.tag_many(self.TEXTS).offsets)
+        assert list(table) == [tagger.tag(text) for text in self.TEXTS]
+
+
+class TestSentimentBatch:
+
+    TEXTS = [
+        "Neexul waaye dafa baax", "Du baax 😭", "Dafa neex lool 🙏❤", "", "Bravo waaye triste",
+        "Mashallah", "xale bi dem na", "Metti na, waaye baaxul",
+    ]
+    
+    def test_analyze_many_matches_analyze(self):
+        from wolof_nlp.applications import SentimentAnalyzer
+        analyzer = SentimentAnalyzer()
+        expected = [analyzer.analyze(text) for text in self.TEXTS]
+        assert list(analyzer.analyze_many(self.TEXTS, chunk_size=3)) == expected
+        assert list(analyzer.analyze_many(self.TEXTS, n_jobs=2, chunk_size=3)) == expected
+    
+    def test_word_flags_computed_once(self):
+        from wolof_nlp.applications.sentiment import SentimentAnalyzer, DU, POSITIVE_ROOT, POSITIVE
+        analyzer = SentimentAnalyzer()
+        list(analyzer.analyze_many(["Du baax", "du baax", "baax"]))
+        assert analyzer.types.to_list() == ["du", "baax"]
+        assert analyzer.flags[0] & DU and analyzer.flags[1] == POSITIVE_ROOT | POSITIVE
+        assert analyzer.analyze("Du baax").negated_words == ["baax"]
+
+
+class TestEmojiTokens:
+
+    def test_emoji_clusters(self):
+        from wolof_nlp.core.tokenizer import EMOJI_PATTERN
+        tokens = WolofTokenizer().tokenize("Dafa neex ❤️ 👍🏽👍🏽 🇸🇳")
+        assert [(t.text, t.type) for t in tokens if t.type != TokenType.WORD] == [
+            ("❤️", TokenType.EMOJI), ("👍🏽👍🏽", TokenType.EMOJI), ("🇸🇳", TokenType.EMOJI)]
+        assert EMOJI_PATTERN.findall("❤️\u200d🔥👨\u200d👩\u200d👧1️⃣") == ["❤️\u200d🔥", "👨\u200d👩\u200d👧", "1️⃣"]
+    
+    def test_sentiment_counts_emoji_tokens(self):
+        from wolof_nlp.applications import SentimentAnalyzer
+        analyzer = SentimentAnalyzer()
+        assert analyzer._lex("xale bi 👍🏽 ❤️\u200d🔥 😭 🇸🇳")[1] == (2, 1)
+        assert analyzer.analyze("💯").sentiment == Sentiment.POSITIVE
+        assert analyzer.analyze("🥺").sentiment == Sentiment.NEGATIVE
+
+
+class TestSentimentAggregator:
+
+    def test_tumbling_windows(self):
+        from wolof_nlp.applications import SentimentAggregator
+        closed = []
+        agg = SentimentAggregator(window=60, batch_size=2, on_window=closed.append)
+        agg.extend([("v1", 0, "Dafa neex lool"), ("v1", 30, "Dafa metti"), ("v2", 10, "xale bi"),
+                    ("v1", 61, "baax na"), ("v1", 70, "Mashallah")])
+        agg.flush()
+        assert [(w.key, w.start, w.count, w.positive, w.negative) for w in closed] == [("v1", 0, 2, 1, 1)]
+        stats = agg.snapshot("v1")
+        assert stats["window"]["start"] == 60 and stats["window"]["count"] == 2
+        assert stats["window"]["positive_ratio"] == 1.0
+        assert stats["previous_window"]["count"] == 2
+        assert agg.snapshot()["v2"]["window"]["count"] == 1
+        assert [w.key for w in agg.close_windows(now=200)] == ["v1", "v2"]
+    
+    def test_event_after_close_windows(self):
+        from wolof_nlp.applications import SentimentAggregator
+        closed = []
+        agg = SentimentAggregator(window=60, on_window=closed.append)
+        agg.add("v", 10, "Dafa neex")
+        agg.add("v", 20, "Dafa metti")
+        assert len(agg.close_windows(now=130)) == 1
+        agg.add("v", 200, "baax na")
+        stats = agg.snapshot("v")
+        assert (stats["previous_window"]["start"], stats["previous_window"]["count"]) == (0, 2)
+        assert (stats["window"]["start"], stats["window"]["count"]) == (180, 1)
+        assert [(w.start, w.count) for w in closed] == [(0, 2)]
+    
+    def test_rolling_decay_and_cache(self):
+        from wolof_nlp.applications import SentimentAggregator
+        agg = SentimentAggregator(half_life=10, batch_size=100)
+        agg.add("v", 0, "Dafa metti")
+        agg.add("v", 10, "Dafa neex")
+        agg.add("v", 10, "Dafa neex")
+        rolling = agg.snapshot("v")["rolling"]
+        assert rolling["weight"] == 2.5
+        assert rolling["positive_ratio"] == 2 / 2.5 and rolling["negative_ratio"] == 0.5 / 2.5
+        assert agg.snapshot("v", now=20)["rolling"]["weight"] == 1.25
+        agg.add("v", 20, "Dafa neex")
+        agg.flush()
+        assert agg.cache.hits == 1 and len(agg.cache) == 2
+    
+    def test_memory_bounded_under_vocabulary_churn(self):
+        import random
+        from wolof_nlp.applications import SentimentAggregator, SentimentAnalyzer
+        rng = random.Random(0)
+        words = ["".join(rng.choice("abdefgiklmnoprstuwxy") for _ in range(8)) for _ in range(5000)]
+        analyzer = SentimentAnalyzer(max_types=500)
+        agg = SentimentAggregator(window=10, batch_size=100, analyzer=analyzer, cache_size=100)
+        for t, word in enumerate(words):
+            agg.add(t % 7, t, f"{word} dafa neex")
+            assert len(analyzer.types) == len(analyzer.flags) <= 500 + 300
+        agg.flush()
+        assert len(agg.cache) == 100 and len(agg) == 7
+        assert analyzer.analyze("Dafa neex lool").sentiment == SentimentAnalyzer().analyze("Dafa neex lool").sentiment
+
+
+class TestGlossCache:
+
+    def test_cached_rows_match_fresh_analysis(self):
+        from wolof_nlp.applications import InterlinearGlosser
+        text = "Dinaa dem. Xale bi dafa jàng téere, dafa jàng lool. Je suis content"
+        cached = InterlinearGlosser()
+        plain = InterlinearGlosser(precompute=False, cache_size=1)
+        assert cached.gloss(text) == plain.gloss(text)
+        assert "dem" in cached.gloss_table() and "jàng" in cached.gloss_table()
+        assert cached.gloss(text) == plain.gloss(text)
+        assert cached.cache.hits >= 12
+    
+    def test_dictionary_growth_invalidates(self):
+        from wolof_nlp.applications import InterlinearGlosser
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry, MemoryBackend
+        dictionary = Dictionary(MemoryBackend())
+        glosser = InterlinearGlosser(dictionary=dictionary)
+        assert glosser.gloss("Dem").words[0].translation == "?"
+        dictionary.add(DictionaryEntry("dem", "aller", "go", "verb"))
+        word = glosser.gloss("Dem").words[0]
+        assert (word.wolof, word.translation) == ("Dem", "go")
+        assert "dem" in glosser.gloss_table()
+    
+    def test_sqlite_backend_is_glossed_on_demand(self):
+        from wolof_nlp.applications import InterlinearGlosser
+        from wolof_nlp.lexicon import Dictionary, DictionaryEntry, SQLiteBackend
+        from wolof_nlp.lexicon.dictionary import DICTIONARY
+        text = "Xale bi dafa naan ndox, dafa jàng téere"
+        backend = SQLiteBackend.from_entries(DICTIONARY.values())
+        dictionary = Dictionary(backend, cache_size=64)
+        glosser = InterlinearGlosser(dictionary=dictionary)
+        statements = []
+        backend.conn.set_trace_callback(statements.append)
+        assert glosser.gloss(text) == InterlinearGlosser(dictionary=Dictionary()).gloss(text)
+        assert "ndox" not in glosser.gloss_table() and "dem" in glosser.gloss_table()
+        assert not any("COUNT" in sql or "ORDER BY id" in sql and "WHERE" not in sql for sql in statements)
+        dictionary.add(DictionaryEntry("téeree", "livres", "books", "noun"))
+        assert dictionary.version == 1
+        assert glosser.gloss("téeree").words[0].translation == "books"
+
+
+class TestGlossRendering:
+
+    def test_wrapped_text_blocks(self):
+        import io
+        from wolof_nlp.applications import InterlinearGlosser, render_text
+        glosser = InterlinearGlosser()
+        text = "Xale bi dafa jàng téere ci biir kër gi"
+        out = io.StringIO()
+        render_text(glosser.iter_gloss(text), out, width=30)
+        blocks = out.getvalue().split("\n\n")
+        assert len(blocks) > 1
+        assert all(len(line) <= 30 for block in blocks for line in block.split("\n"))
+        assert " ".join(b.split("\n")[0] for b in blocks).split() == [w.wolof for w in glosser.gloss(text).words]
+        full = io.StringIO()
+        render_text(glosser.iter_gloss(text), full)
+        assert full.getvalue() == glosser.gloss(text).to_string()
+    
+    def test_html_streaming(self):
+        import io
+        from wolof_nlp.applications import InterlinearGlosser, InterlinearGloss, render_html
+        result = InterlinearGlosser().gloss("dem dem dem")
+        out = io.StringIO()
+        result.write_html(out)
+        assert out.getvalue() == result.to_html()
+        assert result.to_html().count("<td") == 12
+        out = io.StringIO()
+        render_html(iter(result.words), out, width=8)
+        assert out.getvalue().count("<table") == 2
+        assert InterlinearGloss("", []).to_string() == "\n\n\n"
+
+
+class TestSentenceSegmenter:
+
+    def test_boundaries(self):
+        from wolof_nlp.syntax import segment_sentences
+        text = "Dr. Diop dafa dem... mu ñëw. Yaa ngi? Waaw!! «Dem na.» S. Touba la jëm\n\nXale bi dem na"
+        assert segment_sentences(text) == [
+            "Dr. Diop dafa dem... mu ñëw.", "Yaa ngi?", "Waaw!!", "«Dem na.»", "S. Tuba la jëm", "Xale bi dem na",
+        ]
+    
+    def test_parse_document_matches_parse(self):
+        from wolof_nlp.syntax import SentenceParser
+        parser = SentenceParser()
+        sentences = ["Dafa lekk ceeb.", "Yaa ngi dem?", "Moo ko def.", "Wéy naa."]
+        results = parser.parse_document(" ".join(sentences))
+        assert [s.text for s, _ in results] == sentences
+        assert [a for _, a in results] == [parser.parse(s) for s in sentences]
+        assert results[1][1].is_question
+        docs = ["Dafa baax. Yaa ngi dem?", "", "Moo ko def."]
+        assert list(parser.parse_many(docs, n_jobs=2, chunk_size=2)) == list(parser.parse_many(docs))
+    
+    def test_ellipsis_before_split_word(self):
+        from wolof_nlp.syntax import segment_sentences
+        # "Dañuy" is split into lowercased da + ñu + y; the capital in the text still starts a sentence
+        assert segment_sentences("Hmm... Dañuy dem.") == ["Hmm...", "Dañuy dem."]
+        assert segment_sentences("Hmm... dañuy dem.") == ["Hmm... dañuy dem."]
+
+
+class TestSentenceFeatures:
+
+    def test_word_features(self):
+        from wolof_nlp.syntax import sentence_parser as sp
+        assert sp.word_features("dafa") & (sp.VERB_FOCUS_WORD | sp.PARTICLE_WORD | sp.RAISING_PARTICLE | sp.NON_VERB)
+        assert sp.word_features("dafay") & sp.PARTICLE_WORD and not sp.word_features("dafay") & sp.NON_VERB
+        assert sp.word_features("lekkul") & sp.NEGATION_WORD
+        assert sp.word_features("lekkal") & sp.FINAL_AL
+        assert sp.word_features("bunu") & sp.CONDITIONAL_PARTICLE
+    
+    def test_single_pass_analysis(self):
+        from wolof_nlp.syntax import SentenceParser, ClauseType, FocusType
+        parser = SentenceParser()
+        a = parser.parse("Dafa lekk ceeb")
+        assert (a.clause_type, a.focus_type, a.sentence_particle, a.verb) == (
+            ClauseType.VERB_FOCUS, FocusType.VERB, "dafa", "lekk")
+        a = parser.parse("Ceeb la lekk")
+        assert (a.clause_type, a.focused_element) == (ClauseType.COMPLEMENT_FOCUS, "Ceeb")
+        assert parser.parse("Lekkal ceeb bi").clause_type == ClauseType.IMPERATIVE
+        assert parser.parse("Xale bi lekkul").is_negative
+        a = parser.parse("Kan moo dem?")
+        assert a.clause_type == ClauseType.WH_RAISING and a.is_question
+        assert "lekkul" in parser.features
+    
+    def test_feature_memo_is_bounded(self):
+        from wolof_nlp.syntax import SentenceParser
+        from wolof_nlp.syntax.sentence_parser import MARKER_WORDS
+        parser = SentenceParser(max_types=len(MARKER_WORDS) + 50)
+        reference = SentenceParser()
+        for i in range(500):
+            sentence = f"Xale{i} bi dafa lekk ceeb{i}"
+            assert parser.parse(sentence) == reference.parse(sentence)
+            assert len(parser.features) <= len(MARKER_WORDS) + 50 + 5
+
+
+class TestClauseIds:
+
+    def test_ids_match_strings(self):
+        from wolof_nlp import WolofTokenizer
+        from wolof_nlp.syntax import ClauseAnalyzer, ClauseStructure, CopularType
+        analyzer = ClauseAnalyzer()
+        tokenizer = WolofTokenizer(normalize=True, detect_language=False)
+        for text in ["Xale bi la", "Aminata di jàngalekat bi", "Xale bu lekk ceeb", "Dafa lekk ceeb"]:
+            ids = tokenizer.tokenize_to_ids(text, analyzer.vocab)
+            assert analyzer.analyze_ids(ids) == analyzer.analyze(text.lower().split())
+        result = analyzer.analyze_ids(analyzer.vocab.encode(["xale", "bi", "la"]))
+        assert (result.structure, result.copular_type, result.dp1) == (
+            ClauseStructure.LA_SENTENCE, CopularType.PREDICATIONAL, "xale")
+        unknown = analyzer.vocab.encode(["zzz", "la"], add=False)
+        assert list(unknown) == [-1, analyzer.vocab.get("la")]
+        assert analyzer.analyze_ids(unknown).structure == ClauseStructure.LA_SENTENCE
+    
+    def test_analyze_document(self):
+        from wolof_nlp.syntax import ClauseAnalyzer, ClauseStructure
+        analyzer = ClauseAnalyzer()
+        results = analyzer.analyze_document("Xale bi la. Aminata di jàngalekat bi. Hmm... Dañuy dem.")
+        assert [s.text for s, _ in results] == ["Xale bi la.", "Aminata di jàngalekat bi.", "Hmm...", "Dañuy dem."]
+        assert [c.structure for _, c in results] == [
+            ClauseStructure.LA_SENTENCE, ClauseStructure.A_SENTENCE, ClauseStructure.SIMPLE, ClauseStructure.SIMPLE]
+        docs = ["Xale bi la.", "", "Xale bu lekk."]
+        assert list(analyzer.analyze_many(docs, n_jobs=2, chunk_size=2)) == list(analyzer.analyze_many(docs))
+    
+    def test_memory_bounded(self):
+        from wolof_nlp.core.vocab import Vocabulary
+        from wolof_nlp.syntax import ClauseAnalyzer
+        analyzer = ClauseAnalyzer()
+        analyzer.analyze_document(" ".join(f"Xale{i} bi la." for i in range(200)))
+        assert len(analyzer.vocab) == 0
+        vocab = Vocabulary()
+        capped, full = ClauseAnalyzer(vocab, max_types=3), ClauseAnalyzer(vocab)
+        for words in (["xale", "bi", "la"], ["aminata", "di", "jàngalekat", "bi"], ["xale", "bu", "lekk"]):
+            ids = vocab.encode(words)
+            assert capped.analyze_ids(ids) == full.analyze_ids(ids) == full.analyze(words)
+        assert len(capped.flags) == 4